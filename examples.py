@@ -6,15 +6,26 @@ This script demonstrates various ways to use KubeGPT for Kubernetes pod diagnost
 including innovative features like AI analysis, predictive diagnostics, and automated fixes.
 """
 
-import subprocess
+import io
+import os
+import shlex
 import sys
 import time
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Pacing pauses are skipped when output is not a terminal or KUBEGPT_FAST is set
+_PACE = 0 if not sys.stdout.isatty() or os.environ.get('KUBEGPT_FAST') else 1
+
+def _pause(seconds):
+    """Sleep for demo pacing, unless pacing is disabled"""
+    if _PACE:
+        time.sleep(seconds * _PACE)
+
 def print_innovation_banner():
     """Display innovative features banner"""
     print("🚀 KubeGPT - AI-Powered Kubernetes Diagnostics")
@@ -59,7 +70,7 @@ def showcase_ai_features():
         print(f"\n{example['title']}")
         print(f"Command: python kubegpt.py {example['command']}")
         print(f"Innovation: {example['innovation']}")
-        time.sleep(1)
+        _pause(1)
 
 def showcase_intelligent_patterns():
     """Demonstrate intelligent pattern recognition"""
@@ -78,7 +89,7 @@ def showcase_intelligent_patterns():
     print("🎯 Automatically detects and analyzes:")
     for i, pattern in enumerate(pattern_examples, 1):
         print(f"   {i}. {pattern}")
-        time.sleep(0.5)
+        _pause(0.5)
 
 def showcase_multi_modal_interface():
     """Demonstrate different interface modes"""
@@ -112,7 +123,7 @@ def showcase_multi_modal_interface():
         print(f"\n{mode['mode']}")
         print(f"   Command: {mode['command']}")
         print(f"   Use Case: {mode['description']}")
-        time.sleep(1)
+        _pause(1)
 
 def showcase_future_innovations():
     """Preview upcoming innovative features"""
@@ -151,7 +162,7 @@ def showcase_future_innovations():
     for feature in future_features:
         print(f"\n   {feature['feature']} ({feature['timeline']})")
         print(f"   → {feature['description']}")
-        time.sleep(1)
+        _pause(1)
 
 def run_command(cmd, description):
     """Run a KubeGPT command and display results"""
@@ -161,24 +172,27 @@ def run_command(cmd, description):
     print(f"Command: python kubegpt.py {cmd}")
     print("-" * 60)
     
+    # Run the CLI in this interpreter instead of starting a new Python per
+    # example; kubegpt.cli and its dependencies are imported only once
+    stdout = io.StringIO()
+    stderr = io.StringIO()
     try:
-        result = subprocess.run(
-            f"python kubegpt.py {cmd}",
-            shell=True,
-            capture_output=True,
-            text=True,
-            cwd=project_root
-        )
+        from kubegpt.cli import app
         
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(f"Errors: {result.stderr}")
-            
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                app(args=shlex.split(cmd), prog_name="kubegpt.py", standalone_mode=False)
+            except SystemExit:
+                pass
     except Exception as e:
-        print(f"Error running command: {e}")
+        stderr.write(f"Error running command: {e}\n")
+    
+    if stdout.getvalue():
+        print(stdout.getvalue())
+    if stderr.getvalue():
+        print(f"Errors: {stderr.getvalue()}")
     
-    time.sleep(2)  # Brief pause between commands
+    _pause(2)  # Brief pause between commands
 
 def main():
     """Run example KubeGPT commands"""
@@ -6,6 +6,7 @@ This script demonstrates the cutting-edge features of KubeGPT,
 showcasing how AI-powered Kubernetes diagnostics revolutionize troubleshooting.
 """
 
+import os
 import sys
 import time
 from pathlib import Path
@@ -19,6 +20,14 @@ from rich import print as rprint
 # Initialize rich console
 console = Console()
 
+# Pacing pauses are skipped when output is not a terminal or KUBEGPT_FAST is set
+_PACE = 0 if not sys.stdout.isatty() or os.environ.get('KUBEGPT_FAST') else 1
+
+def _pause(seconds):
+    """Sleep for demo pacing, unless pacing is disabled"""
+    if _PACE:
+        time.sleep(seconds * _PACE)
+
 def innovation_banner():
     """Display the innovation banner"""
     banner_text = Text()
@@ -81,13 +90,13 @@ def demo_ai_diagnosis():
     
     # Simulate AI analysis process
     with console.status("[bold green]Running AI analysis...") as status:
-        time.sleep(2)
+        _pause(2)
         status.update("[bold yellow]Analyzing pod logs...")
-        time.sleep(1.5)
+        _pause(1.5)
         status.update("[bold cyan]Correlating events...")
-        time.sleep(1.5)
+        _pause(1.5)
         status.update("[bold magenta]Generating recommendations...")
-        time.sleep(1)
+        _pause(1)
     
     # Display simulated AI analysis
     analysis_panel = Panel(
@@ -6,11 +6,23 @@ A comprehensive presentation highlighting the revolutionary innovations in KubeG
 This script can be run to showcase the project's cutting-edge features.
 """
 
+import os
 import time
 import sys
 
+# Pacing pauses are skipped when output is not a terminal or KUBEGPT_FAST is set
+_PACE = 0 if not sys.stdout.isatty() or os.environ.get('KUBEGPT_FAST') else 1
+
+def _pause(seconds):
+    """Sleep for demo pacing, unless pacing is disabled"""
+    if _PACE:
+        time.sleep(seconds * _PACE)
+
 def print_with_delay(text, delay=0.03):
     """Print text with typewriter effect"""
+    if not _PACE:
+        print(text)
+        return
     for char in text:
         print(char, end='', flush=True)
         time.sleep(delay)
@@ -258,7 +270,7 @@ def innovation_presentation():
 def main():
     """Main function"""
     print_with_delay("Starting KubeGPT Innovation Presentation...")
-    time.sleep(1)
+    _pause(1)
     innovation_presentation()
 
 if __name__ == "__main__":
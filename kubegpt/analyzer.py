@@ -6,22 +6,323 @@ Currently supports OpenAI GPT models, with placeholders for other AI services.
 """
 
 import os
+import re
 import json
+import random
+import time
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, List, Iterator
 from datetime import datetime
 
+from .llm_cache import request_key
+
 # Optional AI dependencies
 logger = logging.getLogger(__name__)
 
 try:
-    from openai import OpenAI
+    from openai import OpenAI, RateLimitError, APIConnectionError
     import yaml
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeLoader as _Loader
     OPENAI_AVAILABLE = True
+    # Transient failures worth retrying (APITimeoutError is an APIConnectionError)
+    RETRYABLE_ERRORS = (RateLimitError, APIConnectionError)
 except ImportError:
     OPENAI_AVAILABLE = False
+    RETRYABLE_ERRORS = ()
     logger.warning("OpenAI or YAML module not available")
 
+# Attempts per chat completion, and the bounds of the jittered backoff between them
+OPENAI_RETRY_ATTEMPTS = 3
+RETRY_MIN_WAIT = 1
+RETRY_MAX_WAIT = 30
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Pod specs, statuses and events are embedded in prompts as indented JSON;
+# orjson encodes them much faster than the stdlib when it is installed
+try:
+    import orjson
+
+    def _prompt_json(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+except ImportError:
+    def _prompt_json(data: Any) -> str:
+        return json.dumps(data, indent=2, default=str)
+
+# HTTP/2 needs the h2 package; without it the pool speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connections kept open to the OpenAI API by the shared client
+OPENAI_MAX_CONNECTIONS = 64
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Characters per token assumed when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+
+# Markers reported by the fallback log analysis, in report order
+FALLBACK_ERROR_PATTERNS = ("error", "exception", "fatal", "panic", "failed")
+_FALLBACK_ERROR_RE = re.compile("|".join(FALLBACK_ERROR_PATTERNS), re.IGNORECASE)
+
+# With pyahocorasick the markers are found in one automaton pass over the
+# lowercased log; otherwise the case-insensitive regex above scans it once
+try:
+    import ahocorasick
+    _FALLBACK_ERROR_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in FALLBACK_ERROR_PATTERNS:
+        _FALLBACK_ERROR_AUTOMATON.add_word(_pattern, _pattern)
+    _FALLBACK_ERROR_AUTOMATON.make_automaton()
+except ImportError:
+    _FALLBACK_ERROR_AUTOMATON = None
+
+
+def _find_error_patterns(text: str) -> List[str]:
+    """FALLBACK_ERROR_PATTERNS that occur in text (case-insensitive), in a single scan"""
+    if _FALLBACK_ERROR_AUTOMATON is not None:
+        found = {pattern for _, pattern in _FALLBACK_ERROR_AUTOMATON.iter(text.lower())}
+    else:
+        found = {match.lower() for match in _FALLBACK_ERROR_RE.findall(text)}
+    return [pattern for pattern in FALLBACK_ERROR_PATTERNS if pattern in found]
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; the mtime in the cache key makes edits re-parse it"""
+    with open(path, "r") as config_file:
+        return yaml.load(config_file, Loader=_Loader) or {}
+
+
+@functools.lru_cache(maxsize=8)
+def _encoding_for(model: str):
+    """tiktoken encoding for a model, falling back to the GPT-3.5/4 encoding"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=64)
+def _truncate_tokens(text: str, max_tokens: int, model: str, keep_end: bool = False) -> str:
+    """
+    Cut text to at most max_tokens tokens of the model's tokenizer
+    
+    Results are memoized, so a log embedded in several prompts is encoded once.
+    Without tiktoken the budget is converted to characters.
+    """
+    if tiktoken is None:
+        limit = max_tokens * _CHARS_PER_TOKEN
+        return text[-limit:] if keep_end else text[:limit]
+    
+    encoding = _encoding_for(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[-max_tokens:] if keep_end else tokens[:max_tokens])
+
+
+def openai_http_limits():
+    """Connection pool limits for OpenAI HTTP clients"""
+    import httpx
+    return httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS,
+                        max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS)
+
+
+@functools.lru_cache(maxsize=4)
+def _client_for(api_key: str):
+    """
+    One OpenAI client per API key for the whole process
+    
+    Analyzers share its keep-alive connection pool, so TLS setup is paid once.
+    DefaultHttpxClient keeps the SDK's timeouts and redirect settings.
+    """
+    from openai import DefaultHttpxClient
+    return OpenAI(
+        api_key=api_key,
+        http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE, limits=openai_http_limits())
+    )
+
+
+def retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying after a transient OpenAI error
+    
+    A Retry-After header on the error's response wins; otherwise the wait is
+    drawn from an exponentially growing window (full jitter).
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_WAIT)
+        except ValueError:
+            pass
+    return random.uniform(RETRY_MIN_WAIT, min(RETRY_MAX_WAIT, RETRY_MIN_WAIT * 2 ** (attempt + 1)))
+
+
+def _load_config(path: str = "config.yaml") -> Dict[str, Any]:
+    """Parsed config file, shared by every analyzer while the file is unchanged (do not mutate)"""
+    return _parse_config(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+
+# Model used when neither the caller nor openai.models.default in config.yaml names one
+DEFAULT_MODEL = "gpt-3.5-turbo"
+
+# Pods packed into one request by analyze_pods_multi, and the answer length
+# allowed per pod
+MULTI_POD_CHUNK_SIZE = 8
+MULTI_POD_TOKENS_PER_POD = 500
+
+# Prompt text is built once here; per-call values are filled into the
+# {slots} with str.format_map
+SYSTEM_PROMPT = """You are KubeGPT, an expert Kubernetes troubleshooting assistant with deep knowledge of:
+- Pod lifecycle and common failure modes
+- Container runtime issues (Docker, containerd, CRI-O)
+- Resource management and limits
+- Networking and service discovery
+- Storage and persistent volumes
+- Security and RBAC
+- Cluster components and architecture
+
+Your responses should be:
+- **Precise**: Use exact kubectl commands and specific file paths
+- **Actionable**: Provide steps that can be executed immediately
+- **Educational**: Explain WHY something is happening
+- **Safe**: Warn about potentially destructive operations
+- **Structured**: Use clear headings and bullet points
+
+Always prioritize immediate remediation steps and include specific commands.
+Consider production environment constraints and safety."""
+
+_ANALYSIS_TEMPLATE = """Analyze this Kubernetes pod and provide comprehensive diagnostics:
+
+**Pod Information:**
+- Name: {pod_name}
+- Namespace: {namespace}
+- Status: {status} (Phase: {phase})
+- Detected Issues: {issues}
+
+**Container Statuses:**
+{container_statuses}
+
+**Recent Logs:**
+```
+{recent_logs}
+```
+
+**Recent Events:**
+{recent_events}
+
+Provide:
+
+## 🔍 **Status Assessment**
+[Current health and state analysis]
+
+## ⚠️ **Issues Identified**
+[Specific problems found with severity levels]
+
+## 🎯 **Root Cause Analysis**
+[Likely causes of the issues]
+
+## 🔧 **Immediate Actions**
+[Specific kubectl commands to run NOW]
+
+## 📝 **Configuration Fixes**
+[YAML changes or kubectl patch commands]
+
+## 🛡️ **Prevention & Best Practices**
+[How to prevent similar issues]
+
+Be specific, actionable, and include exact kubectl commands."""
+
+_MULTI_POD_TEMPLATE = (
+    "Analyze each of the following Kubernetes pods. Respond with a JSON object that maps "
+    "each pod's \"key\" to a markdown analysis covering the root cause, immediate actions "
+    "with exact kubectl commands, and configuration fixes.\n\n"
+    "Pods:\n{pods}"
+)
+
+_LOG_ANALYSIS_TEMPLATE = """Analyze the following Kubernetes pod logs for '{pod_name}' and identify:
+
+1. **Error Patterns**: Any errors, exceptions, or warning messages
+2. **Root Causes**: Likely causes of the identified issues
+3. **Immediate Actions**: Specific steps to investigate further
+4. **kubectl Commands**: Useful commands to gather more information
+
+LOGS (most recent lines):
+```
+{logs}
+```
+
+Provide actionable insights with specific kubectl commands where applicable."""
+
+_YAML_FIX_TEMPLATE = """Based on the following Kubernetes pod issues, suggest specific YAML fixes:
+
+**Pod Name**: {pod_name}
+**Issues Found**: {issues}
+
+**Current Pod Spec (relevant parts)**:
+```yaml
+{pod_spec}
+```
+
+Provide:
+1. **Specific YAML patches** to address each issue
+2. **Explanations** for why each change helps
+3. **kubectl patch commands** to apply the fixes
+4. **Alternative approaches** if applicable
+
+Focus on practical, production-ready solutions."""
+
+_TROUBLESHOOTING_TEMPLATE = """Provide a step-by-step troubleshooting guide for this Kubernetes issue:
+
+**Issue**: {issue}
+**Pod**: {pod_name}
+**Namespace**: {namespace}
+**Current Status**: {status}
+
+Structure your response as:
+
+## 🔍 Initial Diagnosis
+[Immediate checks to perform]
+
+## 📋 Step-by-Step Investigation
+[Numbered steps with specific kubectl commands]
+
+## 🔧 Resolution Steps
+[Specific actions to resolve the issue]
+
+## 🛡️ Prevention
+[How to prevent this issue in the future]
+
+Include specific kubectl commands, file paths, and configuration examples."""
+
+# System messages, shared by every request of their kind (never mutated)
+_ANALYSIS_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_LOG_ANALYSIS_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a Kubernetes expert specializing in log analysis and troubleshooting. Provide specific, actionable recommendations."
+}
+_YAML_FIX_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a Kubernetes YAML expert. Provide specific, production-ready YAML fixes with clear explanations."
+}
+_TROUBLESHOOTING_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a senior Kubernetes administrator providing detailed troubleshooting guidance. Be specific and practical."
+}
+
 
 class AIAnalyzer:
     """
@@ -31,25 +332,39 @@ class AIAnalyzer:
     to provide intelligent analysis and recommendations for pod issues.
     """
     
-    def __init__(self, model: str = "gpt-3.5-turbo"):
+    def __init__(self, model: Optional[str] = None, use_cache: bool = True):
         """
         Initialize the AI analyzer
         
         Args:
-            model: AI model to use for analysis
+            model: AI model to use for analysis; tasks listed under openai.models
+                in config.yaml use their own model
+            use_cache: Reuse answers to identical prompts from the on-disk cache
         """
-        # Load API key from config.yaml
-        with open("config.yaml", "r") as config_file:
-            config = yaml.safe_load(config_file)
-            self.api_key = config.get("openai", {}).get("api_key", None)
+        # Load API key and per-task models from config.yaml
+        openai_config = _load_config().get("openai", {})
+        self.api_key = openai_config.get("api_key", None)
+        self.models = openai_config.get("models") or {}
 
-        self.model = model
+        self.model = model or self.models.get("default") or DEFAULT_MODEL
         self.client = None
+        self.cache = None
+        
+        # Requests being sent right now, so identical concurrent calls share one answer
+        self._inflight: Dict[Any, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        if use_cache:
+            try:
+                from .llm_cache import LLMCache
+                self.cache = LLMCache()
+            except Exception as e:
+                logger.warning(f"LLM response cache unavailable: {e}")
         
         if OPENAI_AVAILABLE and self.api_key:
             try:
-                self.client = OpenAI(api_key=self.api_key)
-                logger.info(f"AI analyzer initialized with model: {model}")
+                self.client = _client_for(self.api_key)
+                logger.info(f"AI analyzer initialized with model: {self.model}")
             except Exception as e:
                 logger.warning(f"Failed to initialize OpenAI client: {e}")
         else:
@@ -69,30 +384,8 @@ class AIAnalyzer:
             return self._fallback_analysis(pod_data)
         
         try:
-            # Prepare comprehensive context for AI analysis
-            analysis_context = self._prepare_analysis_context(pod_data)
-            
-            # Create AI prompt
-            prompt = self._create_analysis_prompt(analysis_context)
-            
             # Get AI analysis
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self._get_system_prompt()
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=1500,
-                temperature=0.3
-            )
-            
-            analysis = response.choices[0].message.content
+            analysis = self._cached_chat(self._pod_analysis_request(pod_data))
             logger.info("AI analysis completed successfully")
             return analysis
             
@@ -100,6 +393,131 @@ class AIAnalyzer:
             logger.error(f"AI analysis failed: {e}")
             return f"AI analysis failed: {e}\n\n{self._fallback_analysis(pod_data)}"
     
+    def stream_analyze_pod_issues(self, pod_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Analyze pod issues, yielding the answer in pieces as the model produces them
+        
+        Args:
+            pod_data: Complete pod information from diagnoser
+            
+        Returns:
+            Iterator of text fragments that together form the analysis
+        """
+        if not self.client:
+            yield self._fallback_analysis(pod_data)
+            return
+        
+        request = self._pod_analysis_request(pod_data)
+        if self.cache:
+            cached = self.cache.get(request)
+            if cached is not None:
+                yield cached
+                return
+        
+        parts = []
+        try:
+            for chunk in self._chat(request, stream=True):
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    parts.append(content)
+                    yield content
+        except Exception as e:
+            logger.error(f"AI analysis failed: {e}")
+            yield f"\n\nAI analysis failed: {e}\n\n{self._fallback_analysis(pod_data)}"
+            return
+        
+        logger.info("AI analysis completed successfully")
+        if self.cache and parts:
+            self.cache.set(request, "".join(parts))
+    
+    def analyze_pods_batch(self, pod_data_list: List[Dict[str, Any]], interactive: bool = False,
+                           timeout: Optional[float] = None) -> List[str]:
+        """
+        Analyze many pods, through the OpenAI Batch API unless results are needed now
+        
+        Batch requests cost half as much but may take up to the 24h batch window,
+        so interactive callers get the synchronous per-pod path instead.
+        
+        Args:
+            pod_data_list: Pod information from diagnoser, one entry per pod
+            interactive: Analyze each pod synchronously instead of batching
+            timeout: Seconds to wait for the batch before falling back
+            
+        Returns:
+            Analysis for each pod, in the order given
+        """
+        if interactive or not self.client or not pod_data_list:
+            return [self.analyze_pod_issues(pod_data) for pod_data in pod_data_list]
+        
+        from .openai_batch import build_request, run_batch
+        
+        # Only pods without a cached answer go into the batch
+        bodies = {str(index): self._pod_analysis_request(pod_data) for index, pod_data in enumerate(pod_data_list)}
+        results = {}
+        if self.cache:
+            for custom_id, body in bodies.items():
+                cached = self.cache.get(body)
+                if cached is not None:
+                    results[custom_id] = cached
+        
+        requests = [build_request(custom_id, body) for custom_id, body in bodies.items() if custom_id not in results]
+        if requests:
+            try:
+                answers = run_batch(self.client, requests, timeout)
+            except Exception as e:
+                logger.warning(f"Batch analysis failed, analyzing pods one by one: {e}")
+                answers = {}
+            
+            for custom_id, answer in answers.items():
+                if self.cache and answer:
+                    self.cache.set(bodies[custom_id], answer)
+            results.update(answers)
+        
+        # Requests the batch did not answer are sent synchronously
+        return [
+            results.get(str(index)) or self.analyze_pod_issues(pod_data)
+            for index, pod_data in enumerate(pod_data_list)
+        ]
+    
+    def analyze_pods_multi(self, pod_data_list: List[Dict[str, Any]], chunk_size: int = MULTI_POD_CHUNK_SIZE) -> List[str]:
+        """
+        Analyze pods several at a time, one chat request per group
+        
+        The system prompt and instructions are sent once per group instead of
+        once per pod, and the model answers with a JSON object keyed by pod.
+        
+        Args:
+            pod_data_list: Pod information from diagnoser, one entry per pod
+            chunk_size: Pods per request
+            
+        Returns:
+            Analysis for each pod, in the order given
+        """
+        if not self.client:
+            return [self._fallback_analysis(pod_data) for pod_data in pod_data_list]
+        
+        results = []
+        for start in range(0, len(pod_data_list), chunk_size):
+            chunk = pod_data_list[start:start + chunk_size]
+            keys = [f"{pod.get('namespace', 'default')}/{pod.get('name', 'Unknown')}" for pod in chunk]
+            
+            try:
+                answers = json.loads(self._cached_chat(self._multi_pod_request(chunk, keys)))
+                if not isinstance(answers, dict):
+                    answers = {}
+            except Exception as e:
+                logger.error(f"Multi-pod AI analysis failed: {e}")
+                answers = {}
+            
+            # Pods missing from the answer are analyzed on their own
+            for key, pod_data in zip(keys, chunk):
+                answer = answers.get(key)
+                results.append(answer if isinstance(answer, str) and answer else self.analyze_pod_issues(pod_data))
+        
+        return results
+    
     def analyze_logs_for_errors(self, logs: str, pod_name: str) -> str:
         """
         Analyze pod logs specifically for error patterns and root causes
@@ -115,39 +533,18 @@ class AIAnalyzer:
             return self._fallback_log_analysis(logs)
         
         try:
-            prompt = f"""
-            Analyze the following Kubernetes pod logs for '{pod_name}' and identify:
-            
-            1. **Error Patterns**: Any errors, exceptions, or warning messages
-            2. **Root Causes**: Likely causes of the identified issues
-            3. **Immediate Actions**: Specific steps to investigate further
-            4. **kubectl Commands**: Useful commands to gather more information
-            
-            LOGS (last 2000 characters):
-            ```
-            {logs[-2000:]}
-            ```
-            
-            Provide actionable insights with specific kubectl commands where applicable.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Kubernetes expert specializing in log analysis and troubleshooting. Provide specific, actionable recommendations."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            model = self._model_for("log_scan")
+            prompt = _LOG_ANALYSIS_TEMPLATE.format_map({
+                "pod_name": pod_name,
+                "logs": _truncate_tokens(logs, 500, model, keep_end=True)
+            })
+            
+            return self._cached_chat(dict(
+                model=model,
+                messages=[_LOG_ANALYSIS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 max_tokens=1000,
                 temperature=0.3
-            )
-            
-            return response.choices[0].message.content
+            ))
             
         except Exception as e:
             logger.error(f"AI log analysis failed: {e}")
@@ -169,44 +566,20 @@ class AIAnalyzer:
         
         try:
             pod_spec = pod_data.get("pod_info", {}).get("spec", {})
+            model = self._model_for("yaml_fix")
             
-            prompt = f"""
-            Based on the following Kubernetes pod issues, suggest specific YAML fixes:
-            
-            **Pod Name**: {pod_data.get('name', 'Unknown')}
-            **Issues Found**: {', '.join(issues)}
+            prompt = _YAML_FIX_TEMPLATE.format_map({
+                "pod_name": pod_data.get('name', 'Unknown'),
+                "issues": ', '.join(issues),
+                "pod_spec": _truncate_tokens(_prompt_json(pod_spec), 250, model)
+            })
             
-            **Current Pod Spec (relevant parts)**:
-            ```yaml
-            {json.dumps(pod_spec, indent=2)[:1000]}
-            ```
-            
-            Provide:
-            1. **Specific YAML patches** to address each issue
-            2. **Explanations** for why each change helps
-            3. **kubectl patch commands** to apply the fixes
-            4. **Alternative approaches** if applicable
-            
-            Focus on practical, production-ready solutions.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Kubernetes YAML expert. Provide specific, production-ready YAML fixes with clear explanations."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            return self._cached_chat(dict(
+                model=model,
+                messages=[_YAML_FIX_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 max_tokens=1200,
                 temperature=0.3
-            )
-            
-            return response.choices[0].message.content
+            ))
             
         except Exception as e:
             logger.error(f"AI YAML suggestion failed: {e}")
@@ -227,53 +600,123 @@ class AIAnalyzer:
             return self._fallback_troubleshooting_steps(issue_description)
         
         try:
-            prompt = f"""
-            Provide a step-by-step troubleshooting guide for this Kubernetes issue:
-            
-            **Issue**: {issue_description}
-            **Pod**: {pod_context.get('name', 'Unknown')}
-            **Namespace**: {pod_context.get('namespace', 'default')}
-            **Current Status**: {pod_context.get('status', 'Unknown')}
-            
-            Structure your response as:
-            
-            ## 🔍 Initial Diagnosis
-            [Immediate checks to perform]
-            
-            ## 📋 Step-by-Step Investigation
-            [Numbered steps with specific kubectl commands]
-            
-            ## 🔧 Resolution Steps
-            [Specific actions to resolve the issue]
-            
-            ## 🛡️ Prevention
-            [How to prevent this issue in the future]
-            
-            Include specific kubectl commands, file paths, and configuration examples.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a senior Kubernetes administrator providing detailed troubleshooting guidance. Be specific and practical."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+            prompt = _TROUBLESHOOTING_TEMPLATE.format_map({
+                "issue": issue_description,
+                "pod_name": pod_context.get('name', 'Unknown'),
+                "namespace": pod_context.get('namespace', 'default'),
+                "status": pod_context.get('status', 'Unknown')
+            })
+            
+            return self._cached_chat(dict(
+                model=self._model_for("troubleshooting"),
+                messages=[_TROUBLESHOOTING_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 max_tokens=1500,
                 temperature=0.3
-            )
-            
-            return response.choices[0].message.content
+            ))
             
         except Exception as e:
             logger.error(f"AI troubleshooting guide failed: {e}")
             return self._fallback_troubleshooting_steps(issue_description)
     
+    def _model_for(self, task: str) -> str:
+        """Model configured for a task (log_scan, root_cause, yaml_fix, troubleshooting)"""
+        return self.models.get(task) or self.model
+    
+    def _chat(self, request: Dict[str, Any], **options):
+        """
+        Call chat.completions.create, retrying rate limits, timeouts and connection errors
+        
+        The SDK's own retries are turned off for these calls so there is a
+        single retry policy.
+        """
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(OPENAI_RETRY_ATTEMPTS):
+            try:
+                return client.chat.completions.create(**request, **options)
+            except RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = retry_delay(e, attempt)
+                logger.warning(f"OpenAI request failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _cached_chat(self, request: Dict[str, Any], cache: bool = True) -> str:
+        """
+        Answer a chat-completion request, reusing a cached answer when there is one
+        
+        Args:
+            request: Keyword arguments for chat.completions.create
+            cache: Set to False to bypass the cache for this call
+        """
+        use_cache = cache and self.cache is not None
+        if use_cache:
+            cached = self.cache.get(request)
+            if cached is not None:
+                return cached
+        
+        # Wait for an identical request another thread already has in flight
+        key = (request_key(request), use_cache)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        
+        try:
+            response = self._chat(request)
+            content = response.choices[0].message.content
+            future.set_result(content)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        
+        if use_cache and content:
+            self.cache.set(request, content)
+        return content
+    
+    def _pod_analysis_request(self, pod_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Chat-completion parameters for analyzing one pod"""
+        # Prepare comprehensive context for AI analysis
+        analysis_context = self._prepare_analysis_context(pod_data)
+        
+        return {
+            "model": self._model_for("root_cause"),
+            "messages": [
+                _ANALYSIS_SYSTEM_MESSAGE,
+                {"role": "user", "content": self._create_analysis_prompt(analysis_context)}
+            ],
+            "max_tokens": 1500,
+            "temperature": 0.3
+        }
+    
+    def _multi_pod_request(self, pods: List[Dict[str, Any]], keys: List[str]) -> Dict[str, Any]:
+        """Chat-completion parameters for analyzing a group of pods in one answer"""
+        summaries = [
+            {
+                "key": key,
+                "status": pod.get("status", "Unknown"),
+                "issues": pod.get("issues", []),
+                "recent_logs": (pod.get("logs") or "")[-500:],
+                "recent_events": (pod.get("events") or [])[:3]
+            }
+            for key, pod in zip(keys, pods)
+        ]
+        
+        prompt = _MULTI_POD_TEMPLATE.format_map({"pods": _prompt_json(summaries)})
+        
+        return {
+            "model": self._model_for("root_cause"),
+            "messages": [_ANALYSIS_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": MULTI_POD_TOKENS_PER_POD * len(pods),
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"}
+        }
+    
     def _prepare_analysis_context(self, pod_data: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare structured context for AI analysis"""
         context = {
@@ -294,7 +737,7 @@ class AIAnalyzer:
         
         # Add recent logs (truncated)
         logs = pod_data.get("logs", "")
-        context["recent_logs"] = logs[-1500:] if logs else "No logs available"
+        context["recent_logs"] = _truncate_tokens(logs, 800, self._model_for("root_cause"), keep_end=True) if logs else "No logs available"
         
         # Add recent events
         events = pod_data.get("events", [])
@@ -304,71 +747,21 @@ class AIAnalyzer:
     
     def _create_analysis_prompt(self, context: Dict[str, Any]) -> str:
         """Create comprehensive analysis prompt for AI"""
-        return f"""
-        Analyze this Kubernetes pod and provide comprehensive diagnostics:
-        
-        **Pod Information:**
-        - Name: {context['pod_name']}
-        - Namespace: {context['namespace']}
-        - Status: {context['status']} (Phase: {context.get('phase', 'Unknown')})
-        - Detected Issues: {', '.join(context['issues']) if context['issues'] else 'None detected'}
-        
-        **Container Statuses:**
-        {json.dumps(context.get('container_statuses', []), indent=2)[:500]}
-        
-        **Recent Logs:**
-        ```
-        {context['recent_logs']}
-        ```
-        
-        **Recent Events:**
-        {json.dumps(context.get('recent_events', []), indent=2)[:500]}
-        
-        Provide:
-        
-        ## 🔍 **Status Assessment**
-        [Current health and state analysis]
-        
-        ## ⚠️ **Issues Identified**
-        [Specific problems found with severity levels]
-        
-        ## 🎯 **Root Cause Analysis**
-        [Likely causes of the issues]
-        
-        ## 🔧 **Immediate Actions**
-        [Specific kubectl commands to run NOW]
-        
-        ## 📝 **Configuration Fixes**
-        [YAML changes or kubectl patch commands]
-        
-        ## 🛡️ **Prevention & Best Practices**
-        [How to prevent similar issues]
-        
-        Be specific, actionable, and include exact kubectl commands.
-        """
+        model = self._model_for("root_cause")
+        return _ANALYSIS_TEMPLATE.format_map({
+            "pod_name": context['pod_name'],
+            "namespace": context['namespace'],
+            "status": context['status'],
+            "phase": context.get('phase', 'Unknown'),
+            "issues": ', '.join(context['issues']) if context['issues'] else 'None detected',
+            "container_statuses": _truncate_tokens(_prompt_json(context.get('container_statuses', [])), 200, model),
+            "recent_logs": context['recent_logs'],
+            "recent_events": _truncate_tokens(_prompt_json(context.get('recent_events', [])), 200, model)
+        })
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for AI analysis"""
-        return """
-        You are KubeGPT, an expert Kubernetes troubleshooting assistant with deep knowledge of:
-        - Pod lifecycle and common failure modes
-        - Container runtime issues (Docker, containerd, CRI-O)
-        - Resource management and limits
-        - Networking and service discovery
-        - Storage and persistent volumes
-        - Security and RBAC
-        - Cluster components and architecture
-        
-        Your responses should be:
-        - **Precise**: Use exact kubectl commands and specific file paths
-        - **Actionable**: Provide steps that can be executed immediately
-        - **Educational**: Explain WHY something is happening
-        - **Safe**: Warn about potentially destructive operations
-        - **Structured**: Use clear headings and bullet points
-        
-        Always prioritize immediate remediation steps and include specific commands.
-        Consider production environment constraints and safety.
-        """
+        return SYSTEM_PROMPT
     
     def _fallback_analysis(self, pod_data: Dict[str, Any]) -> str:
         """Provide basic analysis when AI is not available"""
@@ -404,13 +797,10 @@ class AIAnalyzer:
     
     def _fallback_log_analysis(self, logs: str) -> str:
         """Provide basic log analysis when AI is not available"""
-        error_patterns = ["error", "exception", "fatal", "panic", "failed"]
-        
         analysis = "## 📝 Basic Log Analysis (AI not available)\n\n"
         
-        for pattern in error_patterns:
-            if pattern.lower() in logs.lower():
-                analysis += f"- Found '{pattern}' patterns in logs\n"
+        for pattern in _find_error_patterns(logs):
+            analysis += f"- Found '{pattern}' patterns in logs\n"
         
         analysis += "\n**Recommended**: Configure OpenAI API key for detailed log analysis."
         
@@ -421,11 +811,12 @@ class AIAnalyzer:
         suggestions = "## 📝 Basic YAML Suggestions (AI not available)\n\n"
         
         for issue in issues:
-            if "memory" in issue.lower() or "oom" in issue.lower():
+            issue_lower = issue.lower()
+            if "memory" in issue_lower or "oom" in issue_lower:
                 suggestions += "- Consider increasing memory limits in pod spec\n"
-            elif "cpu" in issue.lower():
+            elif "cpu" in issue_lower:
                 suggestions += "- Review CPU requests and limits\n"
-            elif "image" in issue.lower():
+            elif "image" in issue_lower:
                 suggestions += "- Verify image name and registry access\n"
         
         suggestions += "\n**Recommended**: Configure OpenAI API key for detailed YAML fixes."
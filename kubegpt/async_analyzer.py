@@ -0,0 +1,209 @@
+"""
+Async AI Analyzer Module
+
+This module analyzes many pods concurrently with the async OpenAI client.
+Requests overlap their network and model latency, bounded by a semaphore and
+by a rate limiter that tracks the account's requests- and tokens-per-minute
+budget from the x-ratelimit-* response headers.
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, List, Mapping, Optional
+import logging
+
+from .analyzer import (AIAnalyzer, OPENAI_AVAILABLE, HTTP2_AVAILABLE, OPENAI_RETRY_ATTEMPTS, RETRYABLE_ERRORS,
+                       openai_http_limits, retry_delay)
+from .llm_cache import request_key
+
+logger = logging.getLogger(__name__)
+
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+# Default OpenAI budget per minute and number of requests in flight
+MAX_REQUESTS_PER_MIN = 500
+MAX_TOKENS_PER_MIN = 60000
+MAX_CONCURRENT_REQUESTS = 8
+
+# Rough prompt size estimate used before the API reports actual usage
+_CHARS_PER_TOKEN = 4
+
+
+class _RateLimiter:
+    """
+    Token buckets for requests and tokens per minute
+
+    Both buckets refill continuously. After each response they are lowered to
+    what the API reports as remaining, so other clients sharing the key count.
+    """
+
+    def __init__(self, requests_per_min: int, tokens_per_min: int):
+        self.capacity = {"requests": float(requests_per_min), "tokens": float(tokens_per_min)}
+        self.available = dict(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        for kind, capacity in self.capacity.items():
+            self.available[kind] = min(capacity, self.available[kind] + elapsed * capacity / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request using about this many tokens fits the budget"""
+        # Never ask for more than a full bucket, or the wait would not end
+        need = {"requests": 1.0, "tokens": min(float(tokens), self.capacity["tokens"])}
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = max(
+                    (need[kind] - self.available[kind]) * 60 / self.capacity[kind]
+                    for kind in need
+                )
+                if wait <= 0:
+                    for kind in need:
+                        self.available[kind] -= need[kind]
+                    return
+                await asyncio.sleep(wait)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Lower the buckets to the remaining budget reported by the API"""
+        for kind in self.capacity:
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if remaining is None:
+                continue
+            try:
+                self.available[kind] = min(self.available[kind], float(remaining))
+            except ValueError:
+                pass
+
+
+class AsyncAIAnalyzer(AIAnalyzer):
+    """
+    AIAnalyzer that analyzes many pods concurrently within the OpenAI rate limits
+    """
+
+    def __init__(self, model: Optional[str] = None, max_requests_per_min: int = MAX_REQUESTS_PER_MIN,
+                 max_tokens_per_min: int = MAX_TOKENS_PER_MIN, max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+                 use_cache: bool = True):
+        """
+        Initialize the analyzer
+
+        Args:
+            model: AI model to use for analysis (see AIAnalyzer)
+            max_requests_per_min: Requests-per-minute budget
+            max_tokens_per_min: Tokens-per-minute budget
+            max_concurrent_requests: Requests allowed in flight at once
+            use_cache: Reuse answers to identical prompts from the on-disk cache
+        """
+        super().__init__(model, use_cache=use_cache)
+        self.max_requests_per_min = max_requests_per_min
+        self.max_tokens_per_min = max_tokens_per_min
+        self.max_concurrent_requests = max_concurrent_requests
+        # Requests in flight on the running event loop, shared by identical callers
+        self._inflight_tasks: Dict[str, "asyncio.Task[str]"] = {}
+
+    def _create_async_client(self):
+        """
+        New async OpenAI client for the running event loop
+
+        Its connection pool belongs to the loop it is used on, and run_batch
+        starts a new loop on every call, so each analyze_pods call has its own.
+        """
+        if not (OPENAI_AVAILABLE and AsyncOpenAI and self.api_key):
+            return None
+        try:
+            from openai import DefaultAsyncHttpxClient
+            return AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE, limits=openai_http_limits())
+            )
+        except Exception as e:
+            logger.warning(f"Failed to initialize async OpenAI client: {e}")
+            return None
+
+    def run_batch(self, pod_data_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Analyze pods concurrently from synchronous code
+
+        Returns:
+            Analysis for each pod, in the order given
+        """
+        return asyncio.run(self.analyze_pods(pod_data_list))
+
+    async def analyze_pods(self, pod_data_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Analyze pods concurrently
+
+        Returns:
+            Analysis for each pod, in the order given
+        """
+        aclient = self._create_async_client()
+        if not aclient:
+            return [self._fallback_analysis(pod_data) for pod_data in pod_data_list]
+
+        # Created here so they belong to the running event loop
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        limiter = _RateLimiter(self.max_requests_per_min, self.max_tokens_per_min)
+
+        try:
+            return await asyncio.gather(*(
+                self._analyze_one(aclient, pod_data, semaphore, limiter) for pod_data in pod_data_list
+            ))
+        finally:
+            await aclient.close()
+
+    async def _achat(self, aclient, request: Dict[str, Any], limiter: _RateLimiter, tokens: int):
+        """Send one chat completion within the rate budget, retrying transient errors"""
+        completions = aclient.with_options(max_retries=0).chat.completions
+        for attempt in range(OPENAI_RETRY_ATTEMPTS):
+            await limiter.acquire(tokens)
+            try:
+                raw = await completions.with_raw_response.create(**request)
+            except RETRYABLE_ERRORS as e:
+                if attempt == OPENAI_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = retry_delay(e, attempt)
+                logger.warning(f"OpenAI request failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            limiter.update(raw.headers)
+            return raw.parse()
+
+    async def _complete(self, aclient, request: Dict[str, Any], semaphore: asyncio.Semaphore,
+                        limiter: _RateLimiter) -> str:
+        """Send a request once a concurrency slot is free and cache its answer"""
+        prompt_chars = sum(len(message["content"]) for message in request["messages"])
+        async with semaphore:
+            response = await self._achat(aclient, request, limiter, prompt_chars // _CHARS_PER_TOKEN + request["max_tokens"])
+        content = response.choices[0].message.content
+        if self.cache and content:
+            self.cache.set(request, content)
+        return content
+
+    async def _analyze_one(self, aclient, pod_data: Dict[str, Any], semaphore: asyncio.Semaphore,
+                           limiter: _RateLimiter) -> str:
+        """Analyze one pod once a concurrency slot and rate budget are free"""
+        request = self._pod_analysis_request(pod_data)
+        if self.cache:
+            cached = self.cache.get(request)
+            if cached is not None:
+                return cached
+
+        # Identical pods share one request instead of each sending their own
+        key = request_key(request)
+        task = self._inflight_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._complete(aclient, request, semaphore, limiter))
+            self._inflight_tasks[key] = task
+            task.add_done_callback(lambda _: self._inflight_tasks.pop(key, None))
+
+        try:
+            return await task
+        except Exception as e:
+            logger.error(f"AI analysis failed: {e}")
+            return f"AI analysis failed: {e}\n\n{self._fallback_analysis(pod_data)}"
@@ -5,19 +5,49 @@ This module provides the main command-line interface using Typer.
 It orchestrates pod diagnosis, analysis, and recommendations.
 """
 
+import functools
 import typer
 from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich import print as rprint
 
-from .diagnoser import PodDiagnoser
-from .analyzer import AIAnalyzer
-from .recommender import FixRecommender
+try:
+    import orjson
+    
+    def _dumps_json(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+except ImportError:
+    import json
+    
+    def _dumps_json(obj) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+# PodDiagnoser, AIAnalyzer and FixRecommender are imported only where they are
+# used so `kubegpt --help` does not pay for the AI SDK and k8s client
 
 # Initialize console for rich output
 console = Console()
 
+# Markup templates for table cells, looked up instead of branching per row
+_EVENT_TYPE_TMPL = {'Warning': '[red]{}[/red]'}
+_DEFAULT_EVENT_TYPE_TMPL = '[green]{}[/green]'
+_READY_CELL = {True: '[green]yes[/green]', False: '[red]no[/red]'}
+
+
+@functools.lru_cache(maxsize=8)
+def _diagnoser(namespace: Optional[str], verbose: bool = False, use_cache: bool = True, use_proxy: bool = False,
+               use_pykube: bool = False, use_informer: bool = False):
+    """
+    Get a shared PodDiagnoser for the given namespace and options
+    
+    Instances live for the rest of the process, so commands invoked together
+    reuse one verified kubectl connection (and proxy or informer, if enabled).
+    """
+    from .diagnoser import PodDiagnoser
+    return PodDiagnoser(namespace=namespace, verbose=verbose, use_cache=use_cache, use_proxy=use_proxy,
+                        use_pykube=use_pykube, use_informer=use_informer)
+
 # Create the main Typer app
 app = typer.Typer(
     name="kubegpt",
@@ -63,7 +93,11 @@ def diagnose(
     namespace: str = typer.Option("kube-lab", "--namespace", "-n", help="Kubernetes namespace"),
     use_ai: bool = typer.Option(False, "--ai", help="Use AI for intelligent analysis"),
     output_format: str = typer.Option("rich", "--format", "-f", help="Output format: rich, json, yaml"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output")
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always query the cluster and the AI model instead of reusing cached results"),
+    use_proxy: bool = typer.Option(False, "--proxy", help="Route API reads through a persistent kubectl proxy"),
+    use_pykube: bool = typer.Option(False, "--pykube", help="Read the API in-process with pykube-ng instead of kubectl"),
+    use_informer: bool = typer.Option(False, "--informer", help="Serve pod and event reads from a watch-backed in-memory cache")
 ) -> None:
     """
     🔍 Diagnose issues with a specific Kubernetes pod
@@ -76,9 +110,12 @@ def diagnose(
     """
     console.print(Panel(f"🔍 Diagnosing pod: [bold green]{pod_name}[/bold green] in namespace: [bold blue]{namespace}[/bold blue]"))
     
+    from .recommender import FixRecommender
+    
     try:
         # Step 1: Gather pod information
-        diagnoser = PodDiagnoser(namespace=namespace, verbose=verbose)
+        diagnoser = _diagnoser(namespace, verbose=verbose, use_cache=not no_cache, use_proxy=use_proxy,
+                               use_pykube=use_pykube, use_informer=use_informer)
         pod_data = diagnoser.diagnose_pod(pod_name)
         
         if not pod_data:
@@ -91,14 +128,21 @@ def diagnose(
         
         # Step 3: AI analysis (if enabled)
         ai_insights = None
+        analyzer = None
         if use_ai:
             console.print("🤖 Running AI analysis...")
-            analyzer = AIAnalyzer()
-            ai_insights = analyzer.analyze_pod_issues(pod_data)
+            from .analyzer import AIAnalyzer
+            analyzer = AIAnalyzer(use_cache=not no_cache)
+            if output_format == "json":
+                ai_insights = analyzer.analyze_pod_issues(pod_data)
         
         # Step 4: Display results
         _display_diagnosis_results(pod_data, recommendations, ai_insights, output_format)
         
+        # The rich view shows the AI analysis last, as the model writes it
+        if analyzer and output_format != "json":
+            _display_streamed_analysis(analyzer.stream_analyze_pod_issues(pod_data))
+        
     except Exception as e:
         console.print(f"[red]❌ Error during diagnosis: {e}[/red]")
         if verbose:
@@ -111,7 +155,13 @@ def scan(
     namespace: str = typer.Option("kube-lab", "--namespace", "-n", help="Kubernetes namespace to scan"),
     all_namespaces: bool = typer.Option(False, "--all", "-A", help="Scan all namespaces"),
     problematic_only: bool = typer.Option(True, "--problems-only", "-p", help="Show only problematic pods"),
-    use_ai: bool = typer.Option(False, "--ai", help="Use AI for analysis of problematic pods")
+    use_ai: bool = typer.Option(False, "--ai", help="Use AI for analysis of problematic pods"),
+    ai_batch: bool = typer.Option(False, "--ai-batch", help="Send AI analysis through the OpenAI Batch API (half price, results can take a while)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always query the AI model instead of reusing cached analyses"),
+    use_proxy: bool = typer.Option(False, "--proxy", help="Route API reads through a persistent kubectl proxy"),
+    use_pykube: bool = typer.Option(False, "--pykube", help="Read the API in-process with pykube-ng instead of kubectl"),
+    use_informer: bool = typer.Option(False, "--informer", help="Serve pod and event reads from a watch-backed in-memory cache"),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep watching and report pods as they become problematic")
 ) -> None:
     """
     🔍 Scan namespace(s) for problematic pods
@@ -121,8 +171,22 @@ def scan(
     target = "all namespaces" if all_namespaces else f"namespace: {namespace}"
     console.print(Panel(f"🔍 Scanning {target} for problematic pods"))
     
+    from .recommender import FixRecommender
+    
     try:
-        diagnoser = PodDiagnoser(namespace=None if all_namespaces else namespace)
+        diagnoser = _diagnoser(None if all_namespaces else namespace, use_proxy=use_proxy, use_pykube=use_pykube,
+                               use_informer=use_informer)
+        
+        if watch:
+            recommender = FixRecommender()
+            console.print("👀 Watching for pod state changes (Ctrl+C to stop)...")
+            try:
+                for pod_info in diagnoser.watch_for_problems(all_namespaces):
+                    _display_pod_summary(pod_info, recommender)
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Stopped watching[/yellow]")
+            return
+        
         problematic_pods = diagnoser.scan_for_problems(all_namespaces)
         
         if not problematic_pods:
@@ -130,9 +194,37 @@ def scan(
             return
         
         recommender = FixRecommender()
+        analyzer = None
+        
+        if use_ai or ai_batch:
+            # Fetch details for all problematic pods in one call per namespace
+            # instead of diagnosing each pod separately
+            by_namespace = {}
+            for pod_info in problematic_pods:
+                by_namespace.setdefault(pod_info.get('namespace') or namespace, []).append(pod_info)
+            
+            for pod_namespace, pods in by_namespace.items():
+                details = diagnoser.get_pods_bulk([pod['name'] for pod in pods], pod_namespace)
+                for pod in pods:
+                    pod['pod_info'] = details.get(pod['name'], {})
+            
+            from .async_analyzer import AsyncAIAnalyzer
+            analyzer = AsyncAIAnalyzer(use_cache=not no_cache)
+            
+            analyzed = [pod_info for pod_info in problematic_pods if pod_info.get('pod_info')]
+            if ai_batch:
+                # Analyze every pod in one batch job, then display them together
+                with console.status("Waiting for OpenAI batch analysis..."):
+                    analyses = analyzer.analyze_pods_batch(analyzed)
+            else:
+                # Analyze the pods concurrently rather than one after another
+                with console.status(f"Analyzing {len(analyzed)} pods with AI..."):
+                    analyses = analyzer.run_batch(analyzed)
+            for pod_info, analysis in zip(analyzed, analyses):
+                pod_info['ai_analysis'] = analysis
         
         for pod_info in problematic_pods:
-            _display_pod_summary(pod_info, recommender, use_ai)
+            _display_pod_summary(pod_info, recommender, analyzer)
             
     except Exception as e:
         console.print(f"[red]❌ Error during scan: {e}[/red]")
@@ -156,7 +248,7 @@ def logs(
     console.print(Panel(f"📝 Getting logs for pod: [bold green]{pod_name}[/bold green]"))
     
     try:
-        diagnoser = PodDiagnoser(namespace=namespace)
+        diagnoser = _diagnoser(namespace)
         
         if follow:
             diagnoser.follow_logs(pod_name, container)
@@ -168,6 +260,7 @@ def logs(
             logs = diagnoser.get_pod_logs(pod_name, container, tail)
             
             if analyze:
+                from .recommender import FixRecommender
                 recommender = FixRecommender()
                 log_analysis = recommender.analyze_logs(logs)
                 console.print(Panel(log_analysis, title="📊 Log Analysis"))
@@ -194,7 +287,7 @@ def events(
     console.print(Panel(f"📅 Getting events for {target}"))
     
     try:
-        diagnoser = PodDiagnoser(namespace=namespace)
+        diagnoser = _diagnoser(namespace)
         events = diagnoser.get_events(pod_name, recent)
         
         if not events:
@@ -213,7 +306,8 @@ def fix(
     pod_name: str = typer.Argument(..., help="Name of the pod to generate fixes for"),
     namespace: str = typer.Option("default", "--namespace", "-n", help="Kubernetes namespace"),
     interactive: bool = typer.Option(True, "--interactive", "-i", help="Interactive mode for applying fixes"),
-    dry_run: bool = typer.Option(True, "--dry-run", help="Show commands without executing them")
+    dry_run: bool = typer.Option(True, "--dry-run", help="Show commands without executing them"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always query the cluster instead of reusing recent kubectl output")
 ) -> None:
     """
     🔧 Generate and optionally apply fixes for pod issues
@@ -222,9 +316,11 @@ def fix(
     """
     console.print(Panel(f"🔧 Generating fixes for pod: [bold green]{pod_name}[/bold green]"))
     
+    from .recommender import FixRecommender
+    
     try:
         # Diagnose the pod first
-        diagnoser = PodDiagnoser(namespace=namespace)
+        diagnoser = _diagnoser(namespace, use_cache=not no_cache)
         pod_data = diagnoser.diagnose_pod(pod_name)
         
         if not pod_data:
@@ -245,18 +341,24 @@ def fix(
 def _display_diagnosis_results(pod_data: dict, recommendations: dict, ai_insights: Optional[str], output_format: str) -> None:
     """Display comprehensive diagnosis results"""
     if output_format == "json":
-        import json
         result = {
             "pod_data": pod_data,
             "recommendations": recommendations,
             "ai_insights": ai_insights
         }
-        console.print(json.dumps(result, indent=2, default=str))
+        console.print(_dumps_json(result))
         return
     
     # Rich format display
     console.print(Panel(f"📊 Pod Status: [bold]{pod_data.get('status', 'Unknown')}[/bold]"))
     
+    container_statuses = pod_data.get('pod_info', {}).get('status', {}).get('containerStatuses', [])
+    if container_statuses:
+        _display_container_statuses(container_statuses)
+    
+    if pod_data.get('pod_info', {}).get('describe'):
+        console.print(Panel(pod_data['pod_info']['describe'], title="📄 kubectl describe"))
+    
     if pod_data.get('issues'):
         console.print(Panel("\n".join([f"❌ {issue}" for issue in pod_data['issues']]), title="🚨 Issues Found"))
     
@@ -270,7 +372,44 @@ def _display_diagnosis_results(pod_data: dict, recommendations: dict, ai_insight
         console.print(Panel(ai_insights, title="🤖 AI Analysis"))
 
 
-def _display_pod_summary(pod_info: dict, recommender, use_ai: bool) -> None:
+def _display_streamed_analysis(chunks, title: str = "🤖 AI Analysis") -> None:
+    """Render text fragments in a panel that grows as they arrive"""
+    from rich.live import Live
+    
+    text = ""
+    with Live(Panel(text, title=title), console=console, refresh_per_second=8) as live:
+        for chunk in chunks:
+            text += chunk
+            live.update(Panel(text, title=title))
+
+
+def _display_container_statuses(container_statuses: list) -> None:
+    """Display container states from the pod JSON as a table"""
+    from rich.table import Table
+    
+    table = Table(title="📦 Containers")
+    table.add_column("Container", style="cyan")
+    table.add_column("Ready", style="white")
+    table.add_column("Restarts", style="white")
+    table.add_column("State", style="white")
+    table.add_column("Reason", style="yellow")
+    
+    for container in container_statuses:
+        state = container.get('state', {})
+        state_name = next(iter(state), 'unknown')
+        
+        table.add_row(
+            container.get('name', ''),
+            _READY_CELL[bool(container.get('ready', False))],
+            str(container.get('restartCount', 0)),
+            state_name,
+            state.get(state_name, {}).get('reason', '') if state_name != 'unknown' else ''
+        )
+    
+    console.print(table)
+
+
+def _display_pod_summary(pod_info: dict, recommender, analyzer=None) -> None:
     """Display summary of a problematic pod"""
     pod_name = pod_info.get('name', 'Unknown')
     status = pod_info.get('status', 'Unknown')
@@ -287,6 +426,10 @@ def _display_pod_summary(pod_info: dict, recommender, use_ai: bool) -> None:
         console.print("  🔧 Quick fixes:")
         for fix in quick_fixes:
             console.print(f"    • {fix}")
+    
+    if analyzer and pod_info.get('pod_info'):
+        analysis = pod_info.get('ai_analysis') or analyzer.analyze_pod_issues(pod_info)
+        console.print(Panel(analysis, title=f"🤖 AI Analysis: {pod_name}"))
 
 
 def _display_events(events: list) -> None:
@@ -302,13 +445,13 @@ def _display_events(events: list) -> None:
     
     for event in events:
         event_type = event.get('type', 'Unknown')
-        type_color = "red" if event_type == "Warning" else "green"
+        message = event.get('message', '')
         
         table.add_row(
-            f"[{type_color}]{event_type}[/{type_color}]",
+            _EVENT_TYPE_TMPL.get(event_type, _DEFAULT_EVENT_TYPE_TMPL).format(event_type),
             event.get('reason', ''),
             event.get('object', ''),
-            event.get('message', '')[:60] + "..." if len(event.get('message', '')) > 60 else event.get('message', ''),
+            message[:60] + "..." if len(message) > 60 else message,
             event.get('age', '')
         )
     
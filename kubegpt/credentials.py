@@ -0,0 +1,193 @@
+"""
+Credential Cache Module
+
+This module runs the kubeconfig's exec credential plugin (aws eks get-token,
+gke-gcloud-auth-plugin, ...) once and hands kubectl a minimal kubeconfig with
+the resulting bearer token, so every kubectl invocation does not spawn the
+plugin again. The token is refreshed shortly before it expires.
+
+The token is kept in a temporary kubeconfig readable only by the current
+user (kubegpt-*.kubeconfig in the system temp directory). It is removed when
+the process exits; a process that is killed leaves it behind until the temp
+directory is cleaned.
+"""
+
+import atexit
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Refresh tokens this many seconds before they expire
+EXPIRY_MARGIN = 60
+
+# Lifetime assumed for tokens that come without an expirationTimestamp
+DEFAULT_TOKEN_TTL = 300
+
+
+def _uses_exec_plugin() -> Optional[bool]:
+    """
+    Whether the current kubeconfig context authenticates with an exec plugin
+
+    Reads the kubeconfig files directly, so contexts with static tokens or
+    client certificates (kind, minikube, ...) cost no kubectl call.
+
+    Returns:
+        True or False, or None when the kubeconfig could not be read
+    """
+    try:
+        import yaml
+
+        paths = os.environ.get("KUBECONFIG") or os.path.join("~", ".kube", "config")
+        configs = []
+        for path in paths.split(os.pathsep):
+            path = os.path.expanduser(path)
+            if path and os.path.exists(path):
+                with open(path, "r") as f:
+                    configs.append(yaml.safe_load(f) or {})
+
+        # Like kubectl, the first file to set a value wins
+        def first(section: str, name: str) -> Dict[str, Any]:
+            for config in configs:
+                for entry in config.get(section) or []:
+                    if entry.get("name") == name:
+                        return entry
+            return {}
+
+        current = next((config["current-context"] for config in configs if config.get("current-context")), None)
+        if not current:
+            return False
+        user_name = (first("contexts", current).get("context") or {}).get("user")
+        return bool((first("users", user_name).get("user") or {}).get("exec"))
+    except Exception as e:
+        logger.debug(f"Could not read kubeconfig: {e}")
+        return None
+
+
+class CachedCredentials:
+    """
+    Bearer token from an exec credential plugin, written to a private kubeconfig
+    """
+
+    def __init__(self, kubeconfig: Dict[str, Any], timeout: int = 30):
+        """
+        Initialize the cache (call refresh() to obtain a token)
+
+        Args:
+            kubeconfig: Output of ``kubectl config view --raw --minify -o json``
+            timeout: Timeout for the credential plugin in seconds
+        """
+        self.kubeconfig = kubeconfig
+        self.timeout = timeout
+        self.path: Optional[str] = None
+        self.expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls) -> Optional["CachedCredentials"]:
+        """
+        Read the current kubeconfig context and fetch a token if it uses exec auth
+
+        Returns:
+            Warmed credentials, or None when the context does not use an exec plugin
+        """
+        if _uses_exec_plugin() is False:
+            return None
+
+        result = subprocess.run(
+            ["kubectl", "config", "view", "--raw", "--minify", "-o", "json"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=True
+        )
+        kubeconfig = json.loads(result.stdout)
+
+        users = kubeconfig.get("users") or [{}]
+        exec_config = (users[0].get("user") or {}).get("exec")
+        # Static tokens and client certificates are already cheap; plugins that
+        # need cluster info or a terminal are left to kubectl
+        if not exec_config or exec_config.get("provideClusterInfo") or exec_config.get("interactiveMode") == "Always":
+            return None
+
+        credentials = cls(kubeconfig)
+        credentials.refresh()
+        return credentials
+
+    def kubectl_args(self) -> List[str]:
+        """Arguments pointing kubectl at the cached credentials, refreshing them if needed"""
+        with self._lock:
+            if time.time() >= self.expires_at - EXPIRY_MARGIN:
+                self._refresh_locked()
+            return [f"--kubeconfig={self.path}"]
+
+    def refresh(self) -> None:
+        """Run the credential plugin and rewrite the private kubeconfig"""
+        with self._lock:
+            self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        """Refresh the token; the caller holds the lock"""
+        status = self._run_plugin()
+        token = status.get("token")
+        if not token:
+            raise RuntimeError("credential plugin did not return a token")
+
+        expiry = status.get("expirationTimestamp")
+        if expiry:
+            self.expires_at = datetime.fromisoformat(expiry.replace("Z", "+00:00")).timestamp()
+        else:
+            self.expires_at = time.time() + DEFAULT_TOKEN_TTL
+
+        kubeconfig = dict(self.kubeconfig)
+        user = dict(kubeconfig["users"][0])
+        user["user"] = {"token": token}
+        kubeconfig["users"] = [user]
+
+        if self.path is None:
+            fd, self.path = tempfile.mkstemp(prefix="kubegpt-", suffix=".kubeconfig")
+            os.close(fd)
+            atexit.register(self.close)
+
+        # mkstemp creates the file readable by the owner only
+        with open(self.path, "w") as f:
+            json.dump(kubeconfig, f)
+
+    def _run_plugin(self) -> Dict[str, Any]:
+        """Execute the exec credential plugin and return its ExecCredential status"""
+        exec_config = self.kubeconfig["users"][0]["user"]["exec"]
+
+        env = os.environ.copy()
+        for var in exec_config.get("env") or []:
+            env[var["name"]] = var["value"]
+        env["KUBERNETES_EXEC_INFO"] = json.dumps({
+            "apiVersion": exec_config.get("apiVersion", "client.authentication.k8s.io/v1beta1"),
+            "kind": "ExecCredential",
+            "spec": {"interactive": False}
+        })
+
+        result = subprocess.run(
+            [exec_config["command"]] + list(exec_config.get("args") or []),
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=self.timeout,
+            check=True
+        )
+        return json.loads(result.stdout).get("status", {})
+
+    def close(self) -> None:
+        """Remove the private kubeconfig"""
+        if self.path:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
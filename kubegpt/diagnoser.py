@@ -5,38 +5,244 @@ This module handles running kubectl commands and parsing their output
 to gather comprehensive information about Kubernetes pods.
 """
 
+import heapq
+import os
 import subprocess
 import json
 import yaml
 import re
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, List, NamedTuple, Optional, Any, Set, Tuple, Iterator
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+import dateutil.parser as _dtparser
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Read-only kubectl verbs whose output can be reused within a short window
+CACHEABLE_VERBS = {"get", "describe", "top", "cluster-info"}
+KUBECTL_CACHE_TTL = 30
+KUBECTL_CACHE_MAXSIZE = 256
+
+# stderr lines of a streamed kubectl command kept for its error message
+STDERR_TAIL_LINES = 20
+
+# Common error markers in container logs, fused so logs are scanned only once
+ERROR_PATTERNS = ("error", "exception", "fatal", "panic", "failed", "timeout")
+ERROR_PATTERN_RE = re.compile("|".join(ERROR_PATTERNS), re.IGNORECASE)
+
+# The markers are plain literals, so when pyahocorasick is available they are
+# matched with a single automaton pass over the lowercased text instead
+try:
+    import ahocorasick
+    _ERROR_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in ERROR_PATTERNS:
+        _ERROR_AUTOMATON.add_word(_pattern, _pattern)
+    _ERROR_AUTOMATON.make_automaton()
+except ImportError:
+    _ERROR_AUTOMATON = None
+
+
+def _contains_error_pattern(text: str) -> bool:
+    """Check whether text contains any of the ERROR_PATTERNS (case-insensitive)"""
+    if _ERROR_AUTOMATON is not None:
+        return next(_ERROR_AUTOMATON.iter(text.lower()), None) is not None
+    return ERROR_PATTERN_RE.search(text) is not None
+
+
+# Server-side projection of the only pod fields scan_for_problems looks at,
+# one tab-separated line per pod (nested values are printed as JSON)
+POD_STATUS_JSONPATH = (
+    'jsonpath={range .items[*]}{.metadata.name}{"\\t"}{.metadata.namespace}{"\\t"}'
+    '{.status.phase}{"\\t"}{.status.conditions}{"\\t"}{.status.containerStatuses}{"\\n"}{end}'
+)
+
+# Completed pods are never problematic, so the scan lets the API server drop
+# them. Running pods must still be fetched: CrashLoopBackOff and failing
+# readiness both happen under the Running phase.
+SCAN_FIELD_SELECTOR = "status.phase!=Succeeded"
+SCAN_CHUNK_SIZE = 500
+
+
+# Kubeconfig sources whose cluster connection was already verified in this process
+_KUBECTL_VERIFIED: Set[str] = set()
+
+# Exec-plugin credentials shared by every PodDiagnoser, keyed like _KUBECTL_VERIFIED
+_credentials: Dict[str, Any] = {}
+_credentials_lock = threading.Lock()
+
+# Process-wide cache shared by every PodDiagnoser: args tuple -> (expiry, output)
+_kubectl_cache: "OrderedDict[Tuple[str, ...], Tuple[float, str]]" = OrderedDict()
+_kubectl_cache_lock = threading.Lock()
+
+
+class PodSummary(NamedTuple):
+    """The only pod fields a scan needs; holds no reference to the full pod object"""
+    name: str
+    namespace: str
+    status: Dict[str, Any]
+
 
 class PodDiagnoser:
     """
     Handles kubectl operations and pod information gathering
     """
     
-    def __init__(self, namespace: str = "kube-lab", verbose: bool = False):
+    # Container state reasons that indicate a problem, mapped to issue text
+    _WAITING_MSGS = {
+        "CrashLoopBackOff": "is in CrashLoopBackOff",
+        "ImagePullBackOff": "has image pull issues",
+        "ErrImagePull": "has image pull issues"
+    }
+    _TERMINATED_MSGS = {
+        "OOMKilled": "was killed due to OOM (Out of Memory)"
+    }
+    
+    def __init__(self, namespace: str = "kube-lab", verbose: bool = False, use_cache: bool = True,
+                 use_informer: bool = False, use_proxy: bool = False, warm_credentials: bool = True,
+                 use_pykube: bool = False):
         """
         Initialize the diagnoser
         
         Args:
             namespace: Kubernetes namespace to work with
             verbose: Enable verbose logging
+            use_cache: Reuse recent output of read-only kubectl commands
+            use_informer: Serve pod and event lookups from a watch-backed in-memory cache
+            use_proxy: Send API reads through a persistent kubectl proxy
+            warm_credentials: Run an exec credential plugin once and reuse its token (kept in a
+                private temporary kubeconfig until exit; see kubegpt.credentials)
+            use_pykube: Send API reads through an in-process pykube-ng client instead
         """
         self.namespace = namespace
         self.verbose = verbose
+        self.use_cache = use_cache
+        self._informer = None
+        # HTTP transport for API reads (kubectl proxy or pykube), if any
+        self._proxy = None
+        self._credentials = self._load_credentials() if warm_credentials else None
         self._verify_kubectl()
+        
+        if use_informer:
+            self._start_informer()
+        
+        if use_pykube:
+            self._start_pykube()
+        elif use_proxy:
+            self._start_proxy()
+    
+    def _load_credentials(self):
+        """Get the shared cached exec-plugin credentials for the current kubeconfig, if any"""
+        key = self._context_key()
+        with _credentials_lock:
+            if key not in _credentials:
+                try:
+                    from .credentials import CachedCredentials
+                    _credentials[key] = CachedCredentials.load()
+                except Exception as e:
+                    logger.debug(f"Credential warm-up skipped: {e}")
+                    _credentials[key] = None
+                if self.verbose and _credentials[key]:
+                    logger.info("Using cached exec-plugin credentials")
+            return _credentials[key]
+    
+    def _kubectl_command(self, args: List[str]) -> List[str]:
+        """Build the kubectl command line, pointing at cached credentials when available"""
+        if self._credentials:
+            try:
+                return ["kubectl"] + self._credentials.kubectl_args() + args
+            except Exception as e:
+                logger.warning(f"Cached credentials unavailable, using kubeconfig: {e}")
+                self._credentials = None
+        return ["kubectl"] + args
+    
+    def _start_informer(self) -> None:
+        """Start the watch-backed pod cache, falling back to kubectl on failure"""
+        try:
+            from .informer import PodInformer
+            informer = PodInformer(namespace=self.namespace)
+            informer.start()
+            self._informer = informer
+            if self.verbose:
+                logger.info("Pod informer synced")
+        except Exception as e:
+            logger.warning(f"Pod informer unavailable, using kubectl: {e}")
+    
+    def _start_proxy(self) -> None:
+        """Start a persistent kubectl proxy, falling back to one-shot kubectl on failure"""
+        try:
+            from .proxy import KubectlProxy
+            self._proxy = KubectlProxy().start()
+            if self.verbose:
+                logger.info(f"kubectl proxy serving on port {self._proxy.port}")
+        except Exception as e:
+            logger.warning(f"kubectl proxy unavailable, using kubectl: {e}")
+    
+    def _start_pykube(self) -> None:
+        """Connect an in-process pykube-ng client, falling back to one-shot kubectl on failure"""
+        try:
+            from .pykube_transport import PykubeTransport
+            self._proxy = PykubeTransport().start()
+            if self.verbose:
+                logger.info("Using pykube for API reads")
+        except Exception as e:
+            logger.warning(f"pykube unavailable, using kubectl: {e}")
+    
+    def close(self) -> None:
+        """Release background resources held by the diagnoser"""
+        if self._informer:
+            self._informer.stop()
+            self._informer = None
+        
+        if self._proxy:
+            self._proxy.close()
+            self._proxy = None
+    
+    def __enter__(self) -> "PodDiagnoser":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _get_json(self, args: List[str], api_path: str) -> Dict[str, Any]:
+        """
+        Fetch an API object as parsed JSON
+        
+        Args:
+            args: kubectl arguments producing JSON output
+            api_path: Equivalent API server path, used when the proxy is running
+            
+        Returns:
+            Parsed JSON object
+        """
+        if self._proxy:
+            return self._proxy.get_json(api_path)
+        return _json_loads(self._run_kubectl(args))
+    
+    def _context_key(self) -> str:
+        """Identify the kubeconfig kubectl will use"""
+        return os.environ.get("KUBECONFIG", "")
     
     def _verify_kubectl(self) -> None:
         """Verify that kubectl is available and can connect to cluster"""
+        key = self._context_key()
+        if key in _KUBECTL_VERIFIED:
+            return
+        
         try:
             result = self._run_kubectl(["cluster-info"], capture_output=True)
+            _KUBECTL_VERIFIED.add(key)
             if self.verbose:
                 logger.info("kubectl connection verified")
         except Exception as e:
@@ -54,7 +260,45 @@ class PodDiagnoser:
         Returns:
             Command output as string
         """
-        cmd = ["kubectl"] + args
+        if self.use_cache and args and args[0] in CACHEABLE_VERBS:
+            return self._run_kubectl_cached(tuple(args), capture_output, timeout)
+        
+        return self._execute_kubectl(args, capture_output, timeout)
+    
+    def _run_kubectl_cached(self, args: Tuple[str, ...], capture_output: bool = True, timeout: int = 30) -> str:
+        """
+        Run a read-only kubectl command, reusing output from the last TTL window
+        
+        Args:
+            args: kubectl command arguments
+            capture_output: Whether to capture output
+            timeout: Command timeout in seconds
+            
+        Returns:
+            Command output as string
+        """
+        now = time.monotonic()
+        with _kubectl_cache_lock:
+            cached = _kubectl_cache.get(args)
+            if cached and cached[0] > now:
+                _kubectl_cache.move_to_end(args)
+                if self.verbose:
+                    logger.info(f"Cache hit: kubectl {' '.join(args)}")
+                return cached[1]
+        
+        output = self._execute_kubectl(list(args), capture_output, timeout)
+        
+        with _kubectl_cache_lock:
+            _kubectl_cache[args] = (now + KUBECTL_CACHE_TTL, output)
+            _kubectl_cache.move_to_end(args)
+            while len(_kubectl_cache) > KUBECTL_CACHE_MAXSIZE:
+                _kubectl_cache.popitem(last=False)
+        
+        return output
+    
+    def _execute_kubectl(self, args: List[str], capture_output: bool = True, timeout: int = 30) -> str:
+        """Spawn kubectl with the given arguments and return its output"""
+        cmd = self._kubectl_command(args)
         
         if self.verbose:
             logger.info(f"Running: {' '.join(cmd)}")
@@ -95,65 +339,134 @@ class PodDiagnoser:
         }
         
         try:
-            # Get pod information
-            pod_data["pod_info"] = self._get_pod_info(pod_name)
-            pod_data["status"] = pod_data["pod_info"].get("status", {}).get("phase", "Unknown")
-            
-            # Get pod logs (recent)
-            pod_data["logs"] = self.get_pod_logs(pod_name, tail=200)
-            
-            # Get related events
-            pod_data["events"] = self.get_events(pod_name, recent=20)
+            # kubectl calls are I/O bound, so run them side by side instead of
+            # paying each round-trip in sequence
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                logs_future = executor.submit(self.get_pod_logs, pod_name, None, 200)
+                usage_future = executor.submit(self._get_resource_usage, pod_name)
+                
+                if self._informer or self._proxy:
+                    # Served from the informer or the API proxy
+                    info_future = executor.submit(self._get_pod_info, pod_name)
+                    events_future = executor.submit(self.get_events, pod_name, 20)
+                    
+                    # Get pod information
+                    pod_data["pod_info"] = self._future_result(info_future, {}, "pod info")
+                    
+                    # Get related events
+                    pod_data["events"] = self._future_result(events_future, [], "events")
+                else:
+                    # Fetch only this pod and its events, letting the API server
+                    # filter, so the cost does not grow with the namespace
+                    pod_future = executor.submit(self._get_pod_json, pod_name)
+                    events_future = executor.submit(self._get_pod_event_items, pod_name)
+                    describe_future = executor.submit(self._describe_pod, pod_name) if self.verbose else None
+                    
+                    pod_json = self._future_result(pod_future, None, "pod info")
+                    event_items = self._future_result(events_future, [], "events")
+                    if pod_json is not None:
+                        describe_output = (
+                            self._future_result(describe_future, "", "pod description") if describe_future else None
+                        )
+                        pod_data["pod_info"] = self._build_pod_info(pod_json, describe_output)
+                    else:
+                        logger.error(f"Failed to get pod info for {pod_name}: pod not found")
+                    pod_data["events"] = self._format_events(event_items, pod_name, 20, presorted=False)
+                
+                pod_data["status"] = pod_data["pod_info"].get("status", {}).get("phase", "Unknown")
+                
+                # Get pod logs (recent)
+                pod_data["logs"] = self._future_result(logs_future, "", "logs")
+                
+                # Get resource usage if available
+                pod_data["resource_usage"] = self._future_result(usage_future, {}, "resource usage")
             
             # Analyze for common issues
             pod_data["issues"] = self._detect_common_issues(pod_data)
             
-            # Get resource usage if available
-            pod_data["resource_usage"] = self._get_resource_usage(pod_name)
-            
         except Exception as e:
             logger.error(f"Error diagnosing pod {pod_name}: {e}")
             pod_data["error"] = str(e)
         
         return pod_data
     
+    def _future_result(self, future, default: Any, what: str) -> Any:
+        """Collect a future's result, falling back to a default if it failed"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Failed to get {what}: {e}")
+            return default
+    
     def _get_pod_info(self, pod_name: str) -> Dict[str, Any]:
         """
-        Get detailed pod information using kubectl describe and get
+        Get detailed pod information using kubectl get
+        
+        The kubectl describe output is only fetched in verbose mode; issue
+        detection works off the JSON alone.
         
         Args:
             pod_name: Name of the pod
             
         Returns:
-            Dictionary containing pod details
+            Dictionary containing pod metadata, spec and status
         """
         try:
-            # Get pod details in JSON format
-            json_output = self._run_kubectl([
-                "get", "pod", pod_name,
-                "-n", self.namespace,
-                "-o", "json"
-            ])
-            pod_json = json.loads(json_output)
+            pod_json = self._informer.get_pod(self.namespace, pod_name) if self._informer else None
             
-            # Get human-readable description
-            describe_output = self._run_kubectl([
-                "describe", "pod", pod_name,
-                "-n", self.namespace
-            ])
+            if pod_json is None:
+                # Get pod details in JSON format
+                pod_json = self._get_json(
+                    ["get", "pod", pod_name, "-n", self.namespace, "-o", "json"],
+                    f"/api/v1/namespaces/{self.namespace}/pods/{pod_name}"
+                )
             
-            return {
-                "json": pod_json,
-                "describe": describe_output,
-                "metadata": pod_json.get("metadata", {}),
-                "spec": pod_json.get("spec", {}),
-                "status": pod_json.get("status", {})
-            }
+            describe_output = self._describe_pod(pod_name) if self.verbose else None
+            return self._build_pod_info(pod_json, describe_output)
             
         except Exception as e:
             logger.error(f"Failed to get pod info for {pod_name}: {e}")
             return {}
     
+    def _describe_pod(self, pod_name: str) -> str:
+        """Get the human-readable kubectl describe output for a pod"""
+        return self._run_kubectl([
+            "describe", "pod", pod_name,
+            "-n", self.namespace
+        ])
+    
+    def _build_pod_info(self, pod_json: Dict[str, Any], describe_output: Optional[str] = None) -> Dict[str, Any]:
+        """Assemble the pod info dictionary from the pod object and, if fetched, its description"""
+        pod_info = {
+            "metadata": pod_json.get("metadata", {}),
+            "spec": pod_json.get("spec", {}),
+            "status": pod_json.get("status", {})
+        }
+        if describe_output is not None:
+            pod_info["describe"] = describe_output
+        return pod_info
+    
+    def _get_pod_json(self, pod_name: str) -> Dict[str, Any]:
+        """Fetch a pod object with kubectl get"""
+        return _json_loads(self._run_kubectl(["get", "pod", pod_name, "-n", self.namespace, "-o", "json"]))
+    
+    def _get_pod_event_items(self, pod_name: str) -> List[Dict[str, Any]]:
+        """
+        Fetch the events involving a pod, selected by the API server
+        
+        Args:
+            pod_name: Name of the pod
+            
+        Returns:
+            Unsorted event objects
+        """
+        output = self._run_kubectl([
+            "get", "events", "-n", self.namespace,
+            "--field-selector", f"involvedObject.name={pod_name},involvedObject.kind=Pod",
+            "-o", "json"
+        ])
+        return _json_loads(output).get("items", [])
+    
     def get_pod_logs(self, pod_name: str, container: Optional[str] = None, tail: int = 100) -> str:
         """
         Get pod logs using kubectl logs
@@ -167,30 +480,91 @@ class PodDiagnoser:
             Log content as string
         """
         try:
-            cmd = ["logs", pod_name, "-n", self.namespace, f"--tail={tail}"]
-            
-            if container:
-                cmd.extend(["-c", container])
-            
-            # Also try to get previous container logs if current container is restarting
-            logs = self._run_kubectl(cmd)
-            
-            # If the pod is in a restart loop, try to get previous logs too
-            try:
-                prev_cmd = cmd + ["--previous"]
-                prev_logs = self._run_kubectl(prev_cmd)
-                if prev_logs:
-                    logs = f"=== PREVIOUS CONTAINER LOGS ===\n{prev_logs}\n\n=== CURRENT CONTAINER LOGS ===\n{logs}"
-            except:
-                # Previous logs might not be available
-                pass
-            
-            return logs
-            
+            return "".join(self.iter_pod_logs(pod_name, container, tail)).strip()
         except Exception as e:
             logger.error(f"Failed to get logs for {pod_name}: {e}")
             return f"Error getting logs: {e}"
     
+    def iter_pod_logs(self, pod_name: str, container: Optional[str] = None, tail: int = 100) -> Iterator[str]:
+        """
+        Stream pod logs line by line without buffering the whole output
+        
+        Previous container logs, when the container has restarted, are yielded
+        first under a "PREVIOUS CONTAINER LOGS" header.
+        
+        Args:
+            pod_name: Name of the pod
+            container: Specific container name (optional)
+            tail: Number of lines to retrieve
+            
+        Returns:
+            Iterator over log lines (newline-terminated)
+        """
+        cmd = ["logs", pod_name, "-n", self.namespace, f"--tail={tail}"]
+        
+        if container:
+            cmd.extend(["-c", container])
+        
+        # If the pod is in a restart loop, previous logs come first; they might
+        # not be available at all, so failures there are ignored
+        previous = self._stream_kubectl(cmd + ["--previous"], check=False)
+        first = next(previous, None)
+        if first is not None:
+            yield "=== PREVIOUS CONTAINER LOGS ===\n"
+            yield first
+            yield from previous
+            yield "\n=== CURRENT CONTAINER LOGS ===\n"
+        
+        yield from self._stream_kubectl(cmd)
+    
+    def _stream_kubectl(self, args: List[str], check: bool = True, timeout: int = 30) -> Iterator[str]:
+        """
+        Spawn kubectl and yield its stdout line by line
+        
+        Args:
+            args: kubectl arguments
+            check: Raise RuntimeError if kubectl exits non-zero
+            timeout: Seconds before the process is killed
+            
+        Returns:
+            Iterator over output lines
+        """
+        cmd = self._kubectl_command(args)
+        
+        if self.verbose:
+            logger.info(f"Running: {' '.join(cmd)}")
+        
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        
+        # stderr is read while stdout streams, so a flood of warnings cannot
+        # fill its pipe and stall kubectl; only the end is kept for errors
+        stderr_tail: "deque[str]" = deque(maxlen=STDERR_TAIL_LINES)
+        
+        def drain_stderr():
+            with process.stderr:
+                stderr_tail.extend(process.stderr)
+        
+        stderr_reader = threading.Thread(target=drain_stderr, daemon=True)
+        stderr_reader.start()
+        timer = threading.Timer(timeout, process.kill)
+        timer.start()
+        try:
+            for line in process.stdout:
+                yield line
+            returncode = process.wait()
+            stderr_reader.join(timeout=1)
+            if check and returncode != 0:
+                if not timer.is_alive():
+                    raise RuntimeError(f"kubectl command timed out after {timeout} seconds")
+                raise RuntimeError(f"kubectl command failed: {''.join(stderr_tail).strip()}")
+        finally:
+            # Also reached when the consumer stops iterating early
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+    
     def follow_logs(self, pod_name: str, container: Optional[str] = None) -> None:
         """
         Follow pod logs in real-time
@@ -206,7 +580,7 @@ class PodDiagnoser:
                 cmd.extend(["-c", container])
             
             # Run without capturing output to show logs in real-time
-            subprocess.run(["kubectl"] + cmd)
+            subprocess.run(self._kubectl_command(cmd))
             
         except KeyboardInterrupt:
             print("\nLog following stopped.")
@@ -225,36 +599,69 @@ class PodDiagnoser:
             List of event dictionaries
         """
         try:
-            cmd = ["get", "events", "-n", self.namespace, "--sort-by=.lastTimestamp", "-o", "json"]
-            
-            events_output = self._run_kubectl(cmd)
-            events_json = json.loads(events_output)
-            
-            events = []
-            for event in events_json.get("items", []):
-                # Filter by pod name if specified
-                if pod_name and event.get("involvedObject", {}).get("name") != pod_name:
-                    continue
+            # kubectl already returns events sorted by lastTimestamp (ascending);
+            # the informer and the raw API do not
+            presorted = not (self._informer or self._proxy)
+            if self._informer:
+                items = self._informer.list_events(self.namespace)
+            else:
+                cmd = ["get", "events", "-n", self.namespace, "--sort-by=.lastTimestamp", "-o", "json"]
                 
-                events.append({
-                    "type": event.get("type", "Unknown"),
-                    "reason": event.get("reason", ""),
-                    "message": event.get("message", ""),
-                    "object": f"{event.get('involvedObject', {}).get('kind', '')}/{event.get('involvedObject', {}).get('name', '')}",
-                    "first_timestamp": event.get("firstTimestamp", ""),
-                    "last_timestamp": event.get("lastTimestamp", ""),
-                    "count": event.get("count", 1),
-                    "age": self._calculate_age(event.get("lastTimestamp", ""))
-                })
-            
-            # Sort by timestamp (most recent first) and limit
-            events.sort(key=lambda x: x["last_timestamp"], reverse=True)
-            return events[:recent]
+                items = self._get_json(cmd, f"/api/v1/namespaces/{self.namespace}/events").get("items", [])
+            
+            return self._format_events(items, pod_name, recent, presorted)
             
         except Exception as e:
             logger.error(f"Failed to get events: {e}")
             return []
     
+    def _format_events(self, items: List[Dict[str, Any]], pod_name: Optional[str], recent: int,
+                       presorted: bool) -> List[Dict[str, Any]]:
+        """
+        Turn raw event objects into the most recent event dictionaries
+        
+        Args:
+            items: Event objects as returned by the API
+            pod_name: Keep only events involving this pod (optional)
+            recent: Number of recent events to keep
+            presorted: Whether items are already in ascending lastTimestamp order
+            
+        Returns:
+            List of event dictionaries, most recent first
+        """
+        # Filter by pod name if specified
+        if pod_name:
+            items = [
+                event for event in items
+                if event.get("involvedObject", {}).get("name") == pod_name
+                and event.get("involvedObject", {}).get("kind") == "Pod"
+            ]
+        
+        # Most recent first, limited before any per-event work is done
+        if recent <= 0:
+            items = []
+        elif presorted:
+            items = items[-recent:][::-1]
+        else:
+            items = heapq.nlargest(recent, items, key=lambda event: event.get("lastTimestamp") or "")
+        
+        now = datetime.now(timezone.utc)
+        events = []
+        for event in items:
+            involved = event.get("involvedObject", {})
+            events.append({
+                "type": event.get("type", "Unknown"),
+                "reason": event.get("reason", ""),
+                "message": event.get("message", ""),
+                "object": f"{involved.get('kind', '')}/{involved.get('name', '')}",
+                "first_timestamp": event.get("firstTimestamp", ""),
+                "last_timestamp": event.get("lastTimestamp", ""),
+                "count": event.get("count", 1),
+                "age": self._calculate_age(event.get("lastTimestamp", ""), now)
+            })
+        
+        return events
+    
     def scan_for_problems(self, all_namespaces: bool = False) -> List[Dict[str, Any]]:
         """
         Scan for problematic pods across namespace(s)
@@ -268,38 +675,168 @@ class PodDiagnoser:
         problematic_pods = []
         
         try:
-            cmd = ["get", "pods", "-o", "json"]
-            
-            if all_namespaces:
-                cmd.append("--all-namespaces")
-            else:
-                cmd.extend(["-n", self.namespace])
-            
-            pods_output = self._run_kubectl(cmd)
-            pods_json = json.loads(pods_output)
-            
-            for pod in pods_json.get("items", []):
-                pod_name = pod.get("metadata", {}).get("name", "")
-                pod_namespace = pod.get("metadata", {}).get("namespace", "")
-                pod_status = pod.get("status", {})
-                
+            for pod_name, pod_namespace, pod_status in self._list_pod_statuses(all_namespaces):
                 # Check for problematic conditions
                 issues = self._analyze_pod_status(pod_status)
                 
                 if issues:
-                    problematic_pods.append({
-                        "name": pod_name,
-                        "namespace": pod_namespace,
-                        "status": pod_status.get("phase", "Unknown"),
-                        "issues": issues,
-                        "containers": self._analyze_container_statuses(pod_status.get("containerStatuses", []))
-                    })
+                    problematic_pods.append(self._problem_entry(pod_name, pod_namespace, pod_status, issues))
             
         except Exception as e:
             logger.error(f"Failed to scan for problems: {e}")
         
         return problematic_pods
     
+    def watch_for_problems(self, all_namespaces: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Watch pods and report them whenever they become problematic
+        
+        Uses a single Kubernetes watch stream instead of repeated scans, so
+        short-lived failures between polls are not missed. A pod is reported
+        again only when its set of issues changes.
+        
+        Args:
+            all_namespaces: Whether to watch all namespaces
+            
+        Returns:
+            Iterator of problematic pod information, as in scan_for_problems
+        """
+        from .informer import PodInformer
+        informer = PodInformer(namespace=None if all_namespaces else self.namespace)
+        reported: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        
+        try:
+            for event_type, pod in informer.watch_pods():
+                metadata = pod.get("metadata", {})
+                key = (metadata.get("namespace", ""), metadata.get("name", ""))
+                pod_status = pod.get("status", {})
+                
+                if event_type == "DELETED" or pod_status.get("phase") == "Succeeded":
+                    reported.pop(key, None)
+                    continue
+                
+                entry = self._problem_entry(key[1], key[0], pod_status, self._analyze_pod_status(pod_status))
+                signature = tuple(entry["issues"]) + tuple(
+                    issue for container in entry["containers"] for issue in container["issues"]
+                )
+                
+                if not signature:
+                    reported.pop(key, None)
+                elif reported.get(key) != signature:
+                    reported[key] = signature
+                    yield entry
+        finally:
+            informer.stop()
+    
+    def _problem_entry(self, pod_name: str, pod_namespace: str, pod_status: Dict[str, Any],
+                       issues: List[str]) -> Dict[str, Any]:
+        """Build the problematic pod dictionary reported by scans"""
+        return {
+            "name": pod_name,
+            "namespace": pod_namespace,
+            "status": pod_status.get("phase", "Unknown"),
+            "issues": issues,
+            "containers": self._analyze_container_statuses(pod_status.get("containerStatuses", []))
+        }
+    
+    def _list_pod_statuses(self, all_namespaces: bool) -> List[PodSummary]:
+        """
+        List (name, namespace, status) summaries for pods in the namespace(s)
+        
+        When going through kubectl, only the status fields the scan needs are
+        projected server-side, so full pod specs are never transferred or parsed.
+        Completed (Succeeded) pods are filtered out by the API server as well.
+        """
+        if self._informer and (self._informer.namespace is None or not all_namespaces):
+            items = [
+                pod for pod in self._informer.list_pods(None if all_namespaces else self.namespace)
+                if pod.get("status", {}).get("phase") != "Succeeded"
+            ]
+        elif self._proxy:
+            api_path = "/api/v1/pods" if all_namespaces else f"/api/v1/namespaces/{self.namespace}/pods"
+            items = self._proxy.get_json(f"{api_path}?fieldSelector={quote(SCAN_FIELD_SELECTOR)}").get("items", [])
+        else:
+            cmd = [
+                "get", "pods", "-o", POD_STATUS_JSONPATH,
+                f"--field-selector={SCAN_FIELD_SELECTOR}",
+                f"--chunk-size={SCAN_CHUNK_SIZE}"
+            ]
+            
+            if all_namespaces:
+                cmd.append("--all-namespaces")
+            else:
+                cmd.extend(["-n", self.namespace])
+            
+            return [self._parse_pod_status_line(line) for line in self._run_kubectl(cmd).splitlines() if line]
+        
+        return [self._summarize_pod(pod) for pod in items]
+    
+    def _summarize_pod(self, pod: Dict[str, Any]) -> PodSummary:
+        """Copy out the fields a scan needs so the full pod object can be freed"""
+        metadata = pod.get("metadata", {})
+        status = pod.get("status", {})
+        
+        summary_status = {"phase": status.get("phase", "")}
+        if status.get("conditions"):
+            summary_status["conditions"] = status["conditions"]
+        if status.get("containerStatuses"):
+            summary_status["containerStatuses"] = status["containerStatuses"]
+        
+        return PodSummary(metadata.get("name", ""), metadata.get("namespace", ""), summary_status)
+    
+    def _parse_pod_status_line(self, line: str) -> PodSummary:
+        """Parse one line of POD_STATUS_JSONPATH output"""
+        name, namespace, phase, conditions, container_statuses = (line.split("\t") + [""] * 5)[:5]
+        
+        status = {"phase": phase}
+        if conditions:
+            status["conditions"] = _json_loads(conditions)
+        if container_statuses:
+            status["containerStatuses"] = _json_loads(container_statuses)
+        
+        return PodSummary(name, namespace, status)
+    
+    def get_pods_bulk(self, names: List[str], namespace: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several pods with a single kubectl call
+        
+        Args:
+            names: Pod names to fetch
+            namespace: Namespace of the pods (defaults to the diagnoser namespace)
+            
+        Returns:
+            Dictionary mapping pod name to its metadata, spec and status
+        """
+        if not names:
+            return {}
+        
+        try:
+            cmd = ["get", "pods"] + list(names) + [
+                "-n", namespace or self.namespace,
+                "--ignore-not-found",
+                "-o", "json"
+            ]
+            output = self._run_kubectl(cmd)
+            if not output:
+                return {}
+            
+            pods_json = _json_loads(output)
+            # A single name comes back as a bare Pod rather than a List
+            items = [pods_json] if pods_json.get("kind") == "Pod" else pods_json.get("items", [])
+            
+            return {
+                pod.get("metadata", {}).get("name", ""): {
+                    "metadata": pod.get("metadata", {}),
+                    "spec": pod.get("spec", {}),
+                    "status": pod.get("status", {})
+                }
+                for pod in items
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to fetch pods {', '.join(names)}: {e}")
+            return {}
+    
     def _get_resource_usage(self, pod_name: str) -> Dict[str, Any]:
         """
         Get resource usage for the pod (requires metrics-server)
@@ -352,17 +889,15 @@ class PodDiagnoser:
             for container in container_statuses:
                 state = container.get("state", {})
                 
-                # CrashLoopBackOff
-                if "waiting" in state and state["waiting"].get("reason") == "CrashLoopBackOff":
-                    issues.append(f"Container {container.get('name')} is in CrashLoopBackOff")
-                
-                # ImagePullBackOff / ErrImagePull
-                if "waiting" in state and state["waiting"].get("reason") in ["ImagePullBackOff", "ErrImagePull"]:
-                    issues.append(f"Container {container.get('name')} has image pull issues")
+                # CrashLoopBackOff / ImagePullBackOff / ErrImagePull
+                msg = self._WAITING_MSGS.get((state.get("waiting") or {}).get("reason"))
+                if msg:
+                    issues.append(f"Container {container.get('name')} {msg}")
                 
                 # OOMKilled
-                if "terminated" in state and state["terminated"].get("reason") == "OOMKilled":
-                    issues.append(f"Container {container.get('name')} was killed due to OOM (Out of Memory)")
+                msg = self._TERMINATED_MSGS.get((state.get("terminated") or {}).get("reason"))
+                if msg:
+                    issues.append(f"Container {container.get('name')} {msg}")
                 
                 # High restart count
                 restart_count = container.get("restartCount", 0)
@@ -416,16 +951,14 @@ class PodDiagnoser:
                 "issues": []
             }
             
-            state = container.get("state", {})
-            if "waiting" in state:
-                reason = state["waiting"].get("reason", "")
-                if reason in ["CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"]:
-                    container_info["issues"].append(f"Waiting: {reason}")
+            state = container_info["state"]
+            reason = (state.get("waiting") or {}).get("reason")
+            if reason in self._WAITING_MSGS:
+                container_info["issues"].append(f"Waiting: {reason}")
             
-            if "terminated" in state:
-                reason = state["terminated"].get("reason", "")
-                if reason == "OOMKilled":
-                    container_info["issues"].append("Terminated: OOMKilled")
+            reason = (state.get("terminated") or {}).get("reason")
+            if reason in self._TERMINATED_MSGS:
+                container_info["issues"].append(f"Terminated: {reason}")
             
             containers.append(container_info)
         
@@ -433,43 +966,43 @@ class PodDiagnoser:
     
     def _has_error_patterns_in_logs(self, logs: str) -> bool:
         """Check logs for common error patterns"""
-        error_patterns = [
-            r"error|Error|ERROR",
-            r"exception|Exception|EXCEPTION", 
-            r"fatal|Fatal|FATAL",
-            r"panic|Panic|PANIC",
-            r"failed|Failed|FAILED",
-            r"timeout|Timeout|TIMEOUT"
-        ]
-        
-        for pattern in error_patterns:
-            if re.search(pattern, logs):
-                return True
-        
-        return False
-    
-    def _calculate_age(self, timestamp: str) -> str:
-        """Calculate age from timestamp"""
+        return _contains_error_pattern(logs)
+    
+    def _calculate_age(self, timestamp: str, now: Optional[datetime] = None) -> str:
+        """Calculate age from timestamp, relative to now (current UTC time if not given)"""
         try:
             if not timestamp:
                 return "Unknown"
             
-            # Parse the timestamp (handle different formats)
-            from datetime import datetime
-            import dateutil.parser
+            if now is None:
+                now = datetime.now(timezone.utc)
             
-            event_time = dateutil.parser.parse(timestamp)
-            now = datetime.now(event_time.tzinfo)
-            
-            age = now - event_time
-            
-            if age.days > 0:
-                return f"{age.days}d"
-            elif age.seconds > 3600:
-                return f"{age.seconds // 3600}h"
-            elif age.seconds > 60:
-                return f"{age.seconds // 60}m"
-            else:
-                return f"{age.seconds}s"
-        except:
+            return _format_age(now - _parse_timestamp(timestamp))
+        except Exception:
             return "Unknown"
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an RFC 3339 timestamp as emitted by the API server into an aware datetime"""
+    try:
+        # Fast path for the usual "2024-01-01T00:00:00Z" form
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        # Handle different formats
+        parsed = _dtparser.parse(timestamp)
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _format_age(age: timedelta) -> str:
+    """Format a time difference kubectl-style (e.g. 5m, 3h, 2d)"""
+    if age.days > 0:
+        return f"{age.days}d"
+    elif age.seconds > 3600:
+        return f"{age.seconds // 3600}h"
+    elif age.seconds > 60:
+        return f"{age.seconds // 60}m"
+    else:
+        return f"{age.seconds}s"
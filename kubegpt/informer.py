@@ -0,0 +1,191 @@
+"""
+Pod Informer Module
+
+This module keeps an in-memory copy of pods and events using the Kubernetes
+Python client's list+watch API, so repeated lookups are served from memory
+instead of spawning kubectl for every query.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from kubernetes import client, config, watch
+    from kubernetes.client.rest import ApiException
+    KUBERNETES_AVAILABLE = True
+except ImportError:
+    KUBERNETES_AVAILABLE = False
+
+
+class PodInformer:
+    """
+    Watch-backed cache of pods and events for a namespace (or all namespaces)
+
+    Objects are stored in the same camelCase JSON shape that
+    ``kubectl get -o json`` produces, so callers can treat both sources alike.
+    """
+
+    def __init__(self, namespace: Optional[str] = None, watch_timeout: int = 300):
+        """
+        Initialize the informer
+
+        Args:
+            namespace: Namespace to watch, or None for all namespaces
+            watch_timeout: Server-side timeout for each watch request in seconds
+        """
+        if not KUBERNETES_AVAILABLE:
+            raise RuntimeError("kubernetes Python client is not installed")
+
+        try:
+            config.load_incluster_config()
+        except Exception:
+            config.load_kube_config()
+
+        self.namespace = namespace
+        self.watch_timeout = watch_timeout
+        self.v1 = client.CoreV1Api()
+
+        self._pods: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._events: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Run the initial list synchronously, then keep the cache fresh in the background"""
+        for list_func, kwargs, store in self._resources():
+            resource_version = self._relist(list_func, kwargs, store)
+            thread = threading.Thread(
+                target=self._watch_loop,
+                args=(list_func, kwargs, store, resource_version),
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Stop the background watch threads"""
+        self._stop.set()
+    
+    def watch_pods(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream pod changes in the foreground, without the background threads
+        
+        The first events are ADDED for every existing pod, so no separate LIST
+        is needed; expired watches are resumed or restarted transparently.
+        
+        Returns:
+            Iterator of (event type, kubectl-style pod JSON)
+        """
+        list_func, kwargs, _ = self._resources()[0]
+        resource_version = None
+        
+        while not self._stop.is_set():
+            try:
+                stream = watch.Watch().stream(
+                    list_func,
+                    resource_version=resource_version,
+                    timeout_seconds=self.watch_timeout,
+                    **kwargs
+                )
+                for event in stream:
+                    obj = event["object"]
+                    resource_version = obj.metadata.resource_version
+                    yield event["type"], self._serialize(obj)
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old - start over with a fresh sync
+                    resource_version = None
+                else:
+                    logger.warning(f"Watch failed, retrying: {e}")
+                    time.sleep(1)
+            except Exception as e:
+                logger.warning(f"Watch failed, retrying: {e}")
+                time.sleep(1)
+
+    def get_pod(self, namespace: str, name: str) -> Optional[Dict[str, Any]]:
+        """Get a pod from the cache"""
+        with self._lock:
+            return self._pods.get((namespace, name))
+
+    def list_pods(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List cached pods, optionally restricted to one namespace"""
+        with self._lock:
+            return [pod for (ns, _), pod in self._pods.items() if namespace is None or ns == namespace]
+
+    def list_events(self, namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List cached events, optionally restricted to one namespace"""
+        with self._lock:
+            return [event for (ns, _), event in self._events.items() if namespace is None or ns == namespace]
+
+    def _resources(self) -> List[Tuple[Callable, Dict[str, Any], Dict[Tuple[str, str], Dict[str, Any]]]]:
+        """List functions and their arguments paired with the store they populate"""
+        # Bound API methods are passed as-is: watch.Watch reads their docstring
+        # to know which model to deserialize events into
+        if self.namespace:
+            kwargs = {"namespace": self.namespace}
+            return [
+                (self.v1.list_namespaced_pod, kwargs, self._pods),
+                (self.v1.list_namespaced_event, kwargs, self._events)
+            ]
+        return [
+            (self.v1.list_pod_for_all_namespaces, {}, self._pods),
+            (self.v1.list_event_for_all_namespaces, {}, self._events)
+        ]
+
+    def _relist(self, list_func: Callable, kwargs: Dict[str, Any], store: Dict[Tuple[str, str], Dict[str, Any]]) -> str:
+        """Replace the store contents with a fresh LIST and return its resourceVersion"""
+        result = list_func(**kwargs)
+        items = {self._key(obj): self._serialize(obj) for obj in result.items}
+        with self._lock:
+            store.clear()
+            store.update(items)
+        return result.metadata.resource_version
+
+    def _watch_loop(self, list_func: Callable, kwargs: Dict[str, Any], store: Dict[Tuple[str, str], Dict[str, Any]],
+                    resource_version: Optional[str]) -> None:
+        """Apply watch events to the store until stopped, re-listing when the watch expires"""
+        while not self._stop.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist(list_func, kwargs, store)
+
+                stream = watch.Watch().stream(
+                    list_func,
+                    resource_version=resource_version,
+                    timeout_seconds=self.watch_timeout,
+                    **kwargs
+                )
+                for event in stream:
+                    if self._stop.is_set():
+                        return
+                    obj = event["object"]
+                    key = self._key(obj)
+                    with self._lock:
+                        if event["type"] == "DELETED":
+                            store.pop(key, None)
+                        else:
+                            store[key] = self._serialize(obj)
+                    resource_version = obj.metadata.resource_version
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old - start over from a fresh list
+                    resource_version = None
+                else:
+                    logger.warning(f"Watch failed, retrying: {e}")
+                    time.sleep(1)
+            except Exception as e:
+                logger.warning(f"Watch failed, retrying: {e}")
+                time.sleep(1)
+
+    def _key(self, obj) -> Tuple[str, str]:
+        """Cache key for an API object"""
+        return (obj.metadata.namespace, obj.metadata.name)
+
+    def _serialize(self, obj) -> Dict[str, Any]:
+        """Convert an API model into kubectl-style JSON"""
+        return self.v1.api_client.sanitize_for_serialization(obj)
@@ -0,0 +1,110 @@
+"""
+LLM Response Cache Module
+
+This module keeps AI answers on disk, keyed by a hash of the model, prompt
+and sampling parameters, so re-running a diagnosis on a pod whose state has
+not changed does not send the same prompt to OpenAI again. It uses diskcache
+when installed and a small SQLite table otherwise.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Where cached responses are stored
+DEFAULT_CACHE_DIR = os.path.join("~", ".kubegpt", "llm_cache")
+
+# Seconds a cached response is reused
+DEFAULT_TTL = 24 * 3600
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Stable hash of chat-completion parameters (model, messages, sampling options)"""
+    payload = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    On-disk cache of chat-completion answers with per-entry expiry
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL):
+        """
+        Open (or create) the cache
+
+        Args:
+            directory: Cache directory; ~ is expanded
+            ttl: Seconds an answer stays valid
+        """
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        if diskcache:
+            self._cache = diskcache.Cache(self.directory)
+            self._db = None
+        else:
+            self._cache = None
+            self._db = sqlite3.connect(os.path.join(self.directory, "cache.sqlite3"), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+            )
+            self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+
+    def get(self, request: Dict[str, Any]) -> Optional[str]:
+        """Cached answer for a request, or None"""
+        key = request_key(request)
+        with self._lock:
+            if self._cache is not None:
+                value = self._cache.get(key)
+            else:
+                row = self._db.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, time.time())
+                ).fetchone()
+                value = row[0] if row else None
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        logger.debug(f"LLM cache {'hit' if value is not None else 'miss'} "
+                     f"(hits={self.hits}, misses={self.misses})")
+        return value
+
+    def set(self, request: Dict[str, Any], value: str) -> None:
+        """Store the answer to a request"""
+        key = request_key(request)
+        with self._lock:
+            if self._cache is not None:
+                self._cache.set(key, value, expire=self.ttl)
+            else:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, time.time() + self.ttl)
+                )
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the underlying store"""
+        logger.info(f"LLM cache: {self.hits} hits, {self.misses} misses")
+        if self._cache is not None:
+            self._cache.close()
+        if self._db is not None:
+            self._db.close()
@@ -0,0 +1,132 @@
+"""
+OpenAI Batch Module
+
+This module submits many chat-completion requests as one OpenAI Batch API
+job instead of one synchronous call each. Batches are billed at half price
+and need no per-request round-trip, at the cost of latency: results arrive
+when the whole batch has finished.
+"""
+
+import json
+import time
+from typing import Dict, List, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Endpoint every request in a batch is sent to
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# First and longest wait between batch status checks, in seconds
+POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 60
+
+# Batch states after which no more progress will be made
+_FINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+
+def build_request(custom_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wrap chat-completion parameters as one line of a batch input file
+
+    Args:
+        custom_id: Identifier the result is returned under
+        body: Keyword arguments that would be passed to chat.completions.create
+
+    Returns:
+        Batch request object
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": CHAT_COMPLETIONS_ENDPOINT,
+        "body": body
+    }
+
+
+def submit_batch(client, requests: List[Dict[str, Any]]) -> str:
+    """
+    Upload the requests as a JSONL file and start a batch job
+
+    Returns:
+        ID of the created batch
+    """
+    content = "\n".join(json.dumps(request) for request in requests).encode()
+    input_file = client.files.create(file=("kubegpt-batch.jsonl", content), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=CHAT_COMPLETIONS_ENDPOINT,
+        completion_window="24h"
+    )
+    logger.info(f"Submitted OpenAI batch {batch.id} with {len(requests)} requests")
+    return batch.id
+
+
+def wait_for_batch(client, batch_id: str, timeout: Optional[float] = None):
+    """
+    Poll a batch with exponential backoff until it reaches a final state
+
+    Args:
+        client: OpenAI client
+        batch_id: ID returned by submit_batch
+        timeout: Seconds to wait before giving up, or None to wait for the batch window
+
+    Returns:
+        The completed batch object
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    interval = POLL_INTERVAL
+
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _FINAL_STATES:
+            break
+        if deadline is not None and time.monotonic() + interval > deadline:
+            raise TimeoutError(f"OpenAI batch {batch_id} still {batch.status} after {timeout}s")
+        time.sleep(interval)
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"OpenAI batch {batch_id} ended as {batch.status}")
+    return batch
+
+
+def read_results(client, batch) -> Dict[str, str]:
+    """
+    Download a completed batch's output file
+
+    Returns:
+        Message content by custom_id; failed requests are left out
+    """
+    results = {}
+    if not batch.output_file_id:
+        return results
+
+    output = client.files.content(batch.output_file_id).text
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response}")
+            continue
+        results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return results
+
+
+def run_batch(client, requests: List[Dict[str, Any]], timeout: Optional[float] = None) -> Dict[str, str]:
+    """
+    Submit requests as a batch, wait for it and return the answers
+
+    Args:
+        client: OpenAI client
+        requests: Requests created with build_request
+        timeout: Seconds to wait for the batch, or None to wait for the batch window
+
+    Returns:
+        Message content by custom_id
+    """
+    batch_id = submit_batch(client, requests)
+    batch = wait_for_batch(client, batch_id, timeout)
+    return read_results(client, batch)
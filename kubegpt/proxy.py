@@ -0,0 +1,135 @@
+"""
+Kubectl Proxy Module
+
+This module runs a long-lived ``kubectl proxy`` and talks to the API server
+through it over a pooled keep-alive HTTP session, so authentication and TLS
+setup are paid once instead of on every kubectl invocation.
+"""
+
+import atexit
+import queue
+import re
+import subprocess
+import threading
+from collections import deque
+from typing import Callable, Dict, Any, IO, Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+_SERVING_RE = re.compile(r"Starting to serve on [^:\s]+:(\d+)")
+
+# Seconds kubectl proxy has to report its port before start() gives up
+START_TIMEOUT = 15
+
+# stderr lines kept for error messages
+_STDERR_TAIL_LINES = 20
+
+
+def _drain(stream: IO[str], sink: Callable[[str], Any]) -> threading.Thread:
+    """Pass each line of a pipe to sink on a daemon thread, then "" at end of file"""
+    def run():
+        for line in iter(stream.readline, ""):
+            sink(line)
+        sink("")
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+class KubectlProxy:
+    """
+    Persistent ``kubectl proxy`` with a pooled requests session
+    """
+
+    def __init__(self, timeout: int = 30):
+        """
+        Initialize the proxy (call start() to launch it)
+
+        Args:
+            timeout: Request timeout in seconds
+        """
+        self.timeout = timeout
+        self.port: Optional[int] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._session: Optional[requests.Session] = None
+        self._stderr_tail: "deque[str]" = deque(maxlen=_STDERR_TAIL_LINES)
+
+    def start(self) -> "KubectlProxy":
+        """Launch kubectl proxy on a free local port and open the HTTP session"""
+        self._process = subprocess.Popen(
+            ["kubectl", "proxy", "--port=0"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        atexit.register(self.close)
+
+        # Both pipes are read for as long as kubectl runs, so it never blocks
+        # writing to a full pipe; the end of stderr is kept for error messages
+        stdout_lines: "queue.Queue[str]" = queue.Queue()
+        _drain(self._process.stdout, stdout_lines.put)
+        stderr_reader = _drain(self._process.stderr, self._stderr_tail.append)
+
+        # kubectl prints the chosen port once it is ready to serve; an auth
+        # prompt or a hung credential plugin would otherwise block here forever
+        try:
+            line = stdout_lines.get(timeout=START_TIMEOUT)
+        except queue.Empty:
+            line = ""
+        match = _SERVING_RE.search(line)
+        if not match:
+            if self._process.poll() is not None:
+                stderr_reader.join(timeout=1)
+            error = "".join(self._stderr_tail).strip() or line.strip() or f"no port reported within {START_TIMEOUT}s"
+            self.close()
+            raise RuntimeError(f"kubectl proxy failed to start: {error}")
+
+        self.port = int(match.group(1))
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+        self._session.mount("http://", adapter)
+        return self
+
+    def get_json(self, api_path: str) -> Dict[str, Any]:
+        """
+        GET an API path through the proxy
+
+        Args:
+            api_path: API server path, e.g. /api/v1/namespaces/default/pods
+
+        Returns:
+            Parsed JSON response
+        """
+        if not self._session:
+            raise RuntimeError("kubectl proxy is not running")
+
+        response = self._session.get(f"http://127.0.0.1:{self.port}{api_path}", timeout=self.timeout)
+        if response.status_code != 200:
+            raise RuntimeError(f"API request {api_path} failed: {response.status_code} {response.text.strip()}")
+        return response.json()
+
+    def close(self) -> None:
+        """Close the session and stop the proxy process"""
+        if self._session:
+            self._session.close()
+            self._session = None
+
+        if self._process:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+            self._process = None
+
+    def __enter__(self) -> "KubectlProxy":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
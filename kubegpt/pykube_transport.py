@@ -0,0 +1,65 @@
+"""
+Pykube Transport Module
+
+This module reads API objects in-process with pykube-ng, whose HTTP client
+keeps a pooled requests session, so no kubectl binary or proxy process is
+spawned per query. It exposes the same interface as KubectlProxy.
+"""
+
+from typing import Dict, Any, Optional
+import logging
+
+import pykube
+
+logger = logging.getLogger(__name__)
+
+
+class PykubeTransport:
+    """
+    In-process API reads through a pykube-ng HTTP client
+    """
+
+    def __init__(self, timeout: int = 30):
+        """
+        Initialize the transport (call start() to connect)
+
+        Args:
+            timeout: Request timeout in seconds
+        """
+        self.timeout = timeout
+        self._api: Optional[pykube.HTTPClient] = None
+
+    def start(self) -> "PykubeTransport":
+        """Load the in-cluster or local kubeconfig and create the HTTP client"""
+        self._api = pykube.HTTPClient(pykube.KubeConfig.from_env())
+        return self
+
+    def get_json(self, api_path: str) -> Dict[str, Any]:
+        """
+        GET an API path through the pooled session
+
+        Args:
+            api_path: API server path, e.g. /api/v1/namespaces/default/pods
+
+        Returns:
+            Parsed JSON response
+        """
+        if not self._api:
+            raise RuntimeError("pykube client is not connected")
+
+        response = self._api.session.get(f"{self._api.url.rstrip('/')}{api_path}", timeout=self.timeout)
+        if response.status_code != 200:
+            raise RuntimeError(f"API request {api_path} failed: {response.status_code} {response.text.strip()}")
+        return response.json()
+
+    def close(self) -> None:
+        """Close the HTTP session"""
+        if self._api:
+            self._api.session.close()
+            self._api = None
+
+    def __enter__(self) -> "PykubeTransport":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
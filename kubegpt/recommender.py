@@ -6,13 +6,415 @@ and best practices. It provides actionable kubectl commands and YAML suggestions
 """
 
 import re
-import json
-import yaml
-from typing import Dict, List, Any, Optional, Tuple
+import copy
+import hashlib
+import mmap
+import os
+import string
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# google-re2 matches in time linear in the log size whatever the pattern, so
+# logs cannot trigger catastrophic backtracking; the re module is the fallback
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Number of analyze_and_recommend results kept per recommender
+RECOMMENDATION_CACHE_MAXSIZE = 1024
+
+# Only this many trailing characters (bytes for log files) of a log are scanned
+_LOG_SCAN_WINDOW = 256 * 1024
+
+# Log issue categories: (tag, pattern, prefilter literals, description shown in log analysis).
+# Invariant: every possible match of the pattern contains at least one of the
+# lowercase literals, so a category whose literals are all absent is skipped.
+_LOG_CATEGORIES = [
+    ("oom", r"out of memory|oom|OutOfMemoryError", ("memory", "oom"),
+     "Memory issues detected - consider increasing memory limits"),
+    ("network", r"connection refused|connection timeout", ("connection",),
+     "Network connectivity issues detected"),
+    ("permission", r"permission denied|access denied", ("denied",),
+     "Permission/security issues detected"),
+    ("disk", r"no space left|disk full", ("no space left", "disk full"),
+     "Disk space issues detected"),
+    ("image", r"image.*not found|pull.*failed", ("image", "pull"),
+     "Container image issues detected"),
+    ("port", r"port.*already in use|address already in use", ("already in use",),
+     "Port conflict detected"),
+    ("startup", r"failed to start|startup failed|initialization failed", ("failed",),
+     "Application startup issues detected")
+]
+
+# Log patterns used to derive fixes: (tag, pattern, prefilter literals), same invariant
+_FIX_CATEGORIES = [
+    ("port", r"port.*already in use|address.*already in use", ("already in use",)),
+    ("network", r"connection refused|connection timeout", ("connection",)),
+    ("permission", r"permission denied|access denied", ("denied",)),
+    ("disk", r"disk.*full|no space left", ("disk", "no space left"))
+]
+
+
+# ASCII-only lowercasing table; logs are lowercased once with it and then matched
+# case-sensitively, instead of case-folding every character inside each regex
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _fuse_patterns(categories) -> "re.Pattern":
+    """
+    Compile (tag, pattern, ...) categories into one regex so logs are walked once
+    
+    Alternatives are wrapped in a lookahead, so every match is zero-width and a
+    match of one category can never consume text that another would match.
+    The pattern is lowercase and meant for text lowered with _ASCII_LOWER_TABLE.
+    """
+    alternatives = "|".join(f"(?P<{category[0]}>{category[1].lower()})" for category in categories)
+    return re.compile(f"(?=(?:{alternatives}))")
+
+
+def _compile_re2(categories) -> Optional[Dict[str, Any]]:
+    """Compile each category pattern with re2, or return None when it is not installed"""
+    if re2 is None:
+        return None
+    # re2 has no lookahead, so categories are searched one at a time instead of fused
+    return {category[0]: re2.compile(category[1].lower()) for category in categories}
+
+
+def _find_categories(pattern: "re.Pattern", text, text_lc: Optional[str], categories,
+                     re2_patterns: Optional[Dict[str, Any]] = None) -> set:
+    """
+    Collect the tags of a fused pattern that match text
+    
+    Cheap substring checks on the lowercased text rule out categories first;
+    the regex then runs over that same lowercased text, only when some
+    category is still possible, and stops once all of those have matched.
+    Without text_lc (e.g. for a mapped file) every category is a candidate and
+    the case-insensitive pattern runs over text itself. When re2_patterns is
+    given, the remaining candidates are searched with those instead of the
+    fused pattern.
+    """
+    if text_lc is None:
+        candidates = {category[0] for category in categories}
+        subject = text
+    else:
+        candidates = {category[0] for category in categories if any(literal in text_lc for literal in category[2])}
+        subject = text_lc
+    found = set()
+    if not candidates:
+        return found
+    
+    if re2_patterns is not None:
+        return {tag for tag in candidates if re2_patterns[tag].search(subject)}
+    
+    for match in pattern.finditer(subject):
+        found.add(match.lastgroup)
+        if len(found) == len(candidates):
+            break
+    return found
+
+
+_FUSED_LOG_RE = _fuse_patterns(_LOG_CATEGORIES)
+_FUSED_FIX_RE = _fuse_patterns(_FIX_CATEGORIES)
+_LOG_RE2 = _compile_re2(_LOG_CATEGORIES)
+_FIX_RE2 = _compile_re2(_FIX_CATEGORIES)
+
+# Whole log lines containing an error marker
+_ERROR_LINE_RE = re.compile(r"^[^\n]*(?:error|exception|fatal|panic)[^\n]*$", re.IGNORECASE | re.MULTILINE)
+
+# Bytes versions of the log patterns, for scanning memory-mapped log files
+_FUSED_LOG_RE_B = re.compile(_FUSED_LOG_RE.pattern.encode(), re.IGNORECASE)
+_ERROR_LINE_RE_B = re.compile(_ERROR_LINE_RE.pattern.encode(), re.IGNORECASE | re.MULTILINE)
+
+
+def _tail_lines(text, count: int, newline="\n"):
+    """Return the last count lines of text (str, bytes or mmap) without splitting all of it"""
+    start = len(text)
+    for _ in range(count):
+        start = text.rfind(newline, 0, start)
+        if start == -1:
+            return text
+    return text[start + 1:]
+
+
+# kubectl command templates, filled in per pod with str.format_map
+_DESCRIBE_POD = "kubectl describe pod {pod_name} -n {namespace}"
+
+_CRASHLOOP_COMMANDS = (
+    "kubectl logs {pod_name} -n {namespace} --previous",
+    _DESCRIBE_POD,
+    "kubectl get pod {pod_name} -n {namespace} -o yaml"
+)
+
+_IMAGEPULL_COMMANDS = (
+    _DESCRIBE_POD,
+    "kubectl get events -n {namespace} --sort-by=.lastTimestamp",
+    "kubectl get pod {pod_name} -n {namespace} -o jsonpath='{{.spec.containers[*].image}}'"
+)
+
+_OOM_COMMANDS = (
+    _DESCRIBE_POD,
+    "kubectl top pod {pod_name} -n {namespace}",
+    "kubectl logs {pod_name} -n {namespace} --previous"
+)
+
+_PENDING_COMMANDS = (
+    _DESCRIBE_POD,
+    "kubectl describe nodes",
+    "kubectl get events -n {namespace}",
+    "kubectl get pod {pod_name} -n {namespace} -o yaml"
+)
+
+_CRASHLOOP_FIX_COMMANDS = (
+    "kubectl logs {pod_name} -n {namespace} --previous",
+    "kubectl edit deployment <deployment-name> -n {namespace}"
+)
+
+_CRASHLOOP_VALIDATION = (
+    "kubectl get pod {pod_name} -n {namespace} -w",
+    _DESCRIBE_POD
+)
+
+_IMAGEPULL_FIX_COMMANDS = (
+    "kubectl create secret docker-registry <secret-name> --docker-server=<server> --docker-username=<username> --docker-password=<password>",
+    "kubectl patch pod {pod_name} -n {namespace} -p '{{\"spec\":{{\"imagePullSecrets\":[{{\"name\":\"<secret-name>\"}}]}}}}'"
+)
+
+_IMAGEPULL_VALIDATION = (
+    _DESCRIBE_POD,
+    "docker pull <image-name>"
+)
+
+_PORT_LOG_COMMANDS = (
+    "kubectl get svc -n {namespace}",
+)
+
+_NETWORK_LOG_COMMANDS = (
+    "kubectl get endpoints -n {namespace}",
+    "kubectl describe svc -n {namespace}"
+)
+
+_PERMISSION_LOG_COMMANDS = (
+    _DESCRIBE_POD,
+    "kubectl get rolebindings,clusterrolebindings -n {namespace}"
+)
+
+_DIAGNOSTIC_COMMANDS = (
+    "# Basic pod information",
+    "kubectl get pod {pod_name} -n {namespace} -o wide",
+    _DESCRIBE_POD,
+    "",
+    "# Logs and events",
+    "kubectl logs {pod_name} -n {namespace}",
+    "kubectl get events -n {namespace} --sort-by=.lastTimestamp",
+    "",
+    "# Resource usage (if metrics-server available)",
+    "kubectl top pod {pod_name} -n {namespace}",
+    "",
+    "# Network debugging",
+    "kubectl get svc,endpoints -n {namespace}",
+    "kubectl describe node $(kubectl get pod {pod_name} -n {namespace} -o jsonpath='{{.spec.nodeName}}')"
+)
+
+
+# YAML patch for CrashLoopBackOff issues
+_CRASHLOOP_YAML_PATCH = """
+# Potential fixes for CrashLoopBackOff:
+
+1. Increase resource limits:
+spec:
+  containers:
+  - name: <container-name>
+    resources:
+      limits:
+        memory: "512Mi"
+        cpu: "500m"
+      requests:
+        memory: "256Mi" 
+        cpu: "250m"
+
+2. Adjust probe timings:
+spec:
+  containers:
+  - name: <container-name>
+    livenessProbe:
+      initialDelaySeconds: 60
+      periodSeconds: 30
+      timeoutSeconds: 10
+    readinessProbe:
+      initialDelaySeconds: 30
+      periodSeconds: 15
+
+3. Add debug command (temporary):
+spec:
+  containers:
+  - name: <container-name>
+    command: ["/bin/sh"]
+    args: ["-c", "sleep 3600"]  # Keep container running for debugging
+"""
+
+# YAML patch for image pull issues
+_IMAGEPULL_YAML_PATCH = """
+# Fixes for image pull issues:
+
+1. Add image pull secrets:
+spec:
+  imagePullSecrets:
+  - name: <registry-secret>
+
+2. Use specific image tag (avoid 'latest'):
+spec:
+  containers:
+  - name: <container-name>
+    image: <registry>/<image>:<specific-tag>
+    imagePullPolicy: IfNotPresent
+
+3. Create registry secret:
+kubectl create secret docker-registry <secret-name> \\
+  --docker-server=<registry-url> \\
+  --docker-username=<username> \\
+  --docker-password=<password> \\
+  --docker-email=<email>
+"""
+
+# YAML patch for memory issues
+_MEMORY_YAML_PATCH = """
+# Fixes for OOM (Out of Memory) issues:
+
+1. Increase memory limits:
+spec:
+  containers:
+  - name: <container-name>
+    resources:
+      limits:
+        memory: "1Gi"  # Increase as needed
+      requests:
+        memory: "512Mi"
+
+2. Add memory monitoring:
+spec:
+  containers:
+  - name: <container-name>
+    env:
+    - name: JAVA_OPTS  # For Java apps
+      value: "-Xmx800m -XX:+UseG1GC"
+"""
+
+# YAML patch for scheduling issues
+_SCHEDULING_YAML_PATCH = """
+# Fixes for pod scheduling issues:
+
+1. Reduce resource requests:
+spec:
+  containers:
+  - name: <container-name>
+    resources:
+      requests:
+        memory: "128Mi"  # Reduce if too high
+        cpu: "100m"
+
+2. Add node selector (if needed):
+spec:
+  nodeSelector:
+    kubernetes.io/os: linux
+
+3. Add tolerations (if needed):
+spec:
+  tolerations:
+  - key: "node-role.kubernetes.io/master"
+    operator: "Exists"
+    effect: "NoSchedule"
+"""
+
+
+# generate_fixes result keys and the per-issue keys they are collected from
+_FIX_SECTIONS = (
+    ("immediate_actions", "immediate"),
+    ("configuration_changes", "config"),
+    ("yaml_patches", "yaml"),
+    ("kubectl_commands", "commands"),
+    ("validation_steps", "validation")
+)
+
+# Quick fix suggestions per issue category
+_QUICK_FIXES = {
+    "crashloopbackoff": (
+        "Check logs for startup errors: kubectl logs <pod> --previous",
+        "Verify resource limits are not too restrictive"
+    ),
+    "imagepull": (
+        "Verify image name and tag are correct",
+        "Check registry access and credentials"
+    ),
+    "oom": (
+        "Increase memory limits in pod specification",
+        "Review application memory usage patterns"
+    ),
+    "pending": (
+        "Check node resources: kubectl describe nodes",
+        "Verify scheduling constraints and tolerations"
+    )
+}
+
+
+def _iter_commands(templates, context: Dict[str, str]) -> Iterator[str]:
+    """Fill in command templates for one pod, one at a time"""
+    for template in templates:
+        yield template.format_map(context)
+
+
+def _format_commands(templates, context: Dict[str, str]) -> List[str]:
+    """Fill in command templates for one pod"""
+    return list(_iter_commands(templates, context))
+
+
+class Recommendations:
+    """
+    Fixed-schema result of FixRecommender.analyze_and_recommend
+    
+    Fields are slots filled in by attribute; as_dict() produces the dictionary
+    returned to callers.
+    """
+    
+    __slots__ = ("summary", "issues_analyzed", "commands", "yaml_patches", "quick_fixes",
+                 "preventive_measures", "confidence_score", "error")
+    
+    def __init__(self):
+        self.summary = ""
+        self.issues_analyzed: List[Dict[str, Any]] = []
+        self.commands: List[str] = []
+        self.yaml_patches: List[str] = []
+        self.quick_fixes: List[str] = []
+        self.preventive_measures: List[str] = []
+        self.confidence_score = 0.0
+        self.error: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to the result dictionary; "error" is only present when set"""
+        result = {
+            "summary": self.summary,
+            "issues_analyzed": self.issues_analyzed,
+            "commands": self.commands,
+            "yaml_patches": self.yaml_patches,
+            "quick_fixes": self.quick_fixes,
+            "preventive_measures": self.preventive_measures,
+            "confidence_score": self.confidence_score
+        }
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
 
 class FixRecommender:
     """
@@ -22,72 +424,157 @@ class FixRecommender:
     and their solutions, providing actionable kubectl commands and YAML patches.
     """
     
-    def __init__(self):
-        """Initialize the fix recommender with known issue patterns"""
+    def __init__(self, log_scan_window: int = _LOG_SCAN_WINDOW):
+        """
+        Initialize the fix recommender with known issue patterns
+        
+        Args:
+            log_scan_window: Size of the log tail scanned for issue patterns
+        """
+        self.log_scan_window = log_scan_window
         self.issue_patterns = self._initialize_issue_patterns()
         self.fix_templates = self._initialize_fix_templates()
+        
+        # Keywords in category order; the category name itself is also a keyword
+        self._keyword_to_category = {}
+        for category, meta in self.issue_patterns.items():
+            for keyword in [category] + meta["keywords"]:
+                self._keyword_to_category.setdefault(keyword, category)
+        
+        # With pyahocorasick all keywords are found in one pass over the issue;
+        # values carry the keyword's priority so the first keyword still wins
+        self._keyword_automaton = None
+        if ahocorasick is not None:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for priority, (keyword, category) in enumerate(self._keyword_to_category.items()):
+                self._keyword_automaton.add_word(keyword, (priority, category))
+            self._keyword_automaton.make_automaton()
+        
+        self._analysis_handlers = {
+            "crashloopbackoff": self._crashloop_analysis,
+            "imagepull": self._imagepull_analysis,
+            "oom": self._oom_analysis,
+            "pending": self._pending_analysis
+        }
+        self._fix_handlers = {
+            "crashloopbackoff": self._crashloop_fixes,
+            "imagepull": self._imagepull_fixes
+        }
+        
+        # Recent results keyed by _fingerprint(pod_data)
+        self._cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def analyze_and_recommend(self, pod_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze pod data and recommend comprehensive fixes
         
+        Results are memoized by the inputs they depend on, so pods sharing the
+        same issues and logs (or one pod seen repeatedly) are analyzed once.
+        
         Args:
             pod_data: Complete pod information from diagnoser
             
         Returns:
             Dictionary containing recommendations, commands, and YAML suggestions
         """
-        recommendations = {
-            "summary": "",
-            "issues_analyzed": [],
-            "commands": [],
-            "yaml_patches": [],
-            "quick_fixes": [],
-            "preventive_measures": [],
-            "confidence_score": 0.0
-        }
+        fingerprint = self._fingerprint(pod_data)
+        
+        with self._cache_lock:
+            cached = self._cache.get(fingerprint)
+            if cached is not None:
+                self._cache.move_to_end(fingerprint)
+                return copy.deepcopy(cached)
+        
+        recommendations = self._analyze_and_recommend(pod_data)
+        if "error" in recommendations:
+            return recommendations
+        
+        with self._cache_lock:
+            self._cache[fingerprint] = recommendations
+            while len(self._cache) > RECOMMENDATION_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+        
+        # Callers get their own copy so they cannot alter the cached one
+        return copy.deepcopy(recommendations)
+    
+    def analyze_and_recommend_batch(self, pods: List[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze many pods concurrently
+        
+        The issue tables and compiled patterns are read-only and the result
+        cache is locked, so pods can be analyzed from several threads.
+        
+        Args:
+            pods: Pod information from the diagnoser, one entry per pod
+            max_workers: Number of worker threads (defaults to the CPU count)
+            
+        Returns:
+            Recommendations for each pod, in the same order as pods
+        """
+        if len(pods) <= 1:
+            return [self.analyze_and_recommend(pod_data) for pod_data in pods]
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.analyze_and_recommend, pods))
+    
+    def clear_cache(self) -> None:
+        """Forget memoized analyze_and_recommend results"""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _fingerprint(self, pod_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Key covering every pod_data field analyze_and_recommend reads"""
+        logs = self._scan_window(pod_data.get("logs") or "")
+        return (
+            pod_data.get("name", "unknown"),
+            pod_data.get("namespace", "default"),
+            tuple(pod_data.get("issues", [])),
+            hashlib.blake2b(logs.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        )
+    
+    def _analyze_and_recommend(self, pod_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached analyze_and_recommend"""
+        recommendations = Recommendations()
         
         try:
             # Analyze each detected issue
             issues = pod_data.get("issues", [])
-            pod_info = pod_data.get("pod_info", {})
             logs = pod_data.get("logs", "")
-            events = pod_data.get("events", [])
             
-            for issue in issues:
-                issue_analysis = self._analyze_specific_issue(issue, pod_data)
-                recommendations["issues_analyzed"].append(issue_analysis)
-                
-                # Add commands and fixes
-                if issue_analysis.get("commands"):
-                    recommendations["commands"].extend(issue_analysis["commands"])
-                
-                if issue_analysis.get("yaml_patch"):
-                    recommendations["yaml_patches"].append(issue_analysis["yaml_patch"])
-                
-                if issue_analysis.get("quick_fixes"):
-                    recommendations["quick_fixes"].extend(issue_analysis["quick_fixes"])
+            # Collect per-issue lists and flatten them once at the end
+            issues_analyzed = [self._analyze_specific_issue(issue, issue.lower(), pod_data) for issue in issues]
+            commands = [analysis["commands"] for analysis in issues_analyzed]
+            quick_fixes = [analysis["quick_fixes"] for analysis in issues_analyzed]
             
             # Analyze logs for additional insights
             log_recommendations = self._analyze_logs_for_fixes(logs, pod_data)
-            if log_recommendations:
-                recommendations["commands"].extend(log_recommendations.get("commands", []))
-                recommendations["quick_fixes"].extend(log_recommendations.get("fixes", []))
+            commands.append(log_recommendations["commands"])
+            quick_fixes.append(log_recommendations["fixes"])
             
             # Add general diagnostic commands
-            recommendations["commands"].extend(self._get_diagnostic_commands(pod_data))
+            commands.append(self._iter_diagnostic_commands(pod_data))
+            
+            recommendations.issues_analyzed = issues_analyzed
+            recommendations.commands = list(chain.from_iterable(commands))
+            recommendations.yaml_patches = [analysis["yaml_patch"] for analysis in issues_analyzed if analysis["yaml_patch"]]
+            recommendations.quick_fixes = list(chain.from_iterable(quick_fixes))
+            
+            issue_count = len(issues_analyzed)
+            command_count = len(recommendations.commands)
+            fix_count = len(recommendations.quick_fixes)
             
             # Generate summary
-            recommendations["summary"] = self._generate_summary(recommendations)
+            recommendations.summary = self._generate_summary(issue_count, command_count)
             
             # Calculate confidence score
-            recommendations["confidence_score"] = self._calculate_confidence_score(recommendations)
+            recommendations.confidence_score = self._calculate_confidence_score(issue_count, command_count, fix_count)
             
         except Exception as e:
             logger.error(f"Error in analyze_and_recommend: {e}")
-            recommendations["error"] = str(e)
+            recommendations.error = str(e)
         
-        return recommendations
+        return recommendations.as_dict()
     
     def generate_fixes(self, pod_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -99,26 +586,15 @@ class FixRecommender:
         Returns:
             Dictionary containing detailed fix instructions
         """
-        fixes = {
-            "immediate_actions": [],
-            "configuration_changes": [],
-            "yaml_patches": [],
-            "kubectl_commands": [],
-            "validation_steps": []
-        }
-        
-        issues = pod_data.get("issues", [])
+        # One set of fixes per category, however many issues fall into it
+        categories = dict.fromkeys(self.classify_batch(pod_data.get("issues", [])))
+        issue_fixes = [self._get_fixes_for_category(category, pod_data) for category in categories]
         
-        for issue in issues:
-            issue_fixes = self._get_fixes_for_issue(issue, pod_data)
-            
-            fixes["immediate_actions"].extend(issue_fixes.get("immediate", []))
-            fixes["configuration_changes"].extend(issue_fixes.get("config", []))
-            fixes["yaml_patches"].extend(issue_fixes.get("yaml", []))
-            fixes["kubectl_commands"].extend(issue_fixes.get("commands", []))
-            fixes["validation_steps"].extend(issue_fixes.get("validation", []))
-        
-        return fixes
+        # The result schema is fixed by _FIX_SECTIONS
+        return {
+            key: list(chain.from_iterable(issue_fix[issue_key] for issue_fix in issue_fixes))
+            for key, issue_key in _FIX_SECTIONS
+        }
     
     def get_quick_fixes(self, pod_info: Dict[str, Any]) -> List[str]:
         """
@@ -130,27 +606,20 @@ class FixRecommender:
         Returns:
             List of quick fix suggestions
         """
-        quick_fixes = []
-        issues = pod_info.get("issues", [])
+        categories = dict.fromkeys(self.classify_batch(pod_info.get("issues", [])))
+        return list(chain.from_iterable(_QUICK_FIXES.get(category, ()) for category in categories))
+    
+    def classify_batch(self, issues: List[str]) -> List[Optional[str]]:
+        """
+        Resolve the category of many issues at once
         
-        for issue in issues:
-            if "crashloopbackoff" in issue.lower():
-                quick_fixes.append("Check logs for startup errors: kubectl logs <pod> --previous")
-                quick_fixes.append("Verify resource limits are not too restrictive")
-            
-            elif "imagepull" in issue.lower():
-                quick_fixes.append("Verify image name and tag are correct")
-                quick_fixes.append("Check registry access and credentials")
-            
-            elif "oom" in issue.lower():
-                quick_fixes.append("Increase memory limits in pod specification")
-                quick_fixes.append("Review application memory usage patterns")
+        Args:
+            issues: Issue descriptions
             
-            elif "pending" in issue.lower():
-                quick_fixes.append("Check node resources: kubectl describe nodes")
-                quick_fixes.append("Verify scheduling constraints and tolerations")
-        
-        return quick_fixes
+        Returns:
+            Category name (or None) for each issue, in order
+        """
+        return [self._classify(issue.lower()) for issue in issues]
     
     def analyze_logs(self, logs: str) -> str:
         """
@@ -162,46 +631,74 @@ class FixRecommender:
         Returns:
             Log analysis summary
         """
-        analysis = "## 📝 Log Analysis\n\n"
+        logs = self._scan_window(logs)
         
         # Check for common error patterns
-        error_patterns = {
-            r"out of memory|oom|OutOfMemoryError": "Memory issues detected - consider increasing memory limits",
-            r"connection refused|connection timeout": "Network connectivity issues detected",
-            r"permission denied|access denied": "Permission/security issues detected",
-            r"no space left|disk full": "Disk space issues detected",
-            r"image.*not found|pull.*failed": "Container image issues detected",
-            r"port.*already in use|address already in use": "Port conflict detected",
-            r"failed to start|startup failed|initialization failed": "Application startup issues detected"
-        }
+        found = _find_categories(_FUSED_LOG_RE, logs, logs.translate(_ASCII_LOWER_TABLE), _LOG_CATEGORIES, _LOG_RE2)
+        
+        # Extract recent error lines
+        error_lines = [line.strip() for line in _ERROR_LINE_RE.findall(_tail_lines(logs, 50))]  # Check last 50 lines
+        
+        return self._format_log_analysis(found, error_lines)
+    
+    def analyze_logs_file(self, path: str) -> str:
+        """
+        Analyze a log file without reading it into memory
+        
+        The file is memory-mapped and scanned with bytes patterns; only the
+        matched error lines are decoded.
+        
+        Args:
+            path: Path to a pod log file
+            
+        Returns:
+            Log analysis summary, as produced by analyze_logs
+        """
+        with open(path, "rb") as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return self.analyze_logs("")
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Only the pages of the scan window are read from disk
+                window = mm[-self.log_scan_window:] if len(mm) > self.log_scan_window else mm
+                found = _find_categories(_FUSED_LOG_RE_B, window, None, _LOG_CATEGORIES)
+                tail = _tail_lines(window, 50, b"\n")
+                error_lines = [line.decode("utf-8", "replace").strip() for line in _ERROR_LINE_RE_B.findall(tail)]
+        
+        return self._format_log_analysis(found, error_lines)
+    
+    def _scan_window(self, logs: str) -> str:
+        """Bound pattern analysis to the tail of the log, where the latest failures are"""
+        if len(logs) > self.log_scan_window:
+            return logs[-self.log_scan_window:]
+        return logs
+    
+    def _format_log_analysis(self, found: set, error_lines: List[str]) -> str:
+        """Render the log categories and error lines found by analyze_logs"""
+        parts = ["## 📝 Log Analysis\n\n"]
         
-        found_patterns = []
-        for pattern, description in error_patterns.items():
-            if re.search(pattern, logs, re.IGNORECASE):
-                found_patterns.append(f"• {description}")
+        found_patterns = [f"• {description}" for tag, _, _, description in _LOG_CATEGORIES if tag in found]
         
         if found_patterns:
-            analysis += "**Issues Found in Logs:**\n" + "\n".join(found_patterns) + "\n\n"
+            parts.append("**Issues Found in Logs:**\n")
+            parts.append("\n".join(found_patterns))
+            parts.append("\n\n")
         else:
-            analysis += "**No obvious error patterns found in logs.**\n\n"
-        
-        # Extract recent error lines
-        error_lines = []
-        for line in logs.split('\n')[-50:]:  # Check last 50 lines
-            if re.search(r"error|exception|fatal|panic", line, re.IGNORECASE):
-                error_lines.append(line.strip())
+            parts.append("**No obvious error patterns found in logs.**\n\n")
         
         if error_lines:
-            analysis += "**Recent Error Lines:**\n"
+            parts.append("**Recent Error Lines:**\n")
             for line in error_lines[-5:]:  # Show last 5 error lines
-                analysis += f"```\n{line}\n```\n"
+                parts.append("```\n")
+                parts.append(line)
+                parts.append("\n```\n")
         
-        return analysis
+        return "".join(parts)
     
-    def _analyze_specific_issue(self, issue: str, pod_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_specific_issue(self, issue: str, issue_lower: str, pod_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze a specific issue and provide targeted recommendations"""
-        pod_name = pod_data.get("name", "unknown")
-        namespace = pod_data.get("namespace", "default")
+        context = self._command_context(pod_data)
         
         issue_analysis = {
             "issue": issue,
@@ -212,91 +709,15 @@ class FixRecommender:
             "explanation": ""
         }
         
-        issue_lower = issue.lower()
-        
-        # CrashLoopBackOff analysis
-        if "crashloopbackoff" in issue_lower:
-            issue_analysis.update({
-                "severity": "high",
-                "commands": [
-                    f"kubectl logs {pod_name} -n {namespace} --previous",
-                    f"kubectl describe pod {pod_name} -n {namespace}",
-                    f"kubectl get pod {pod_name} -n {namespace} -o yaml"
-                ],
-                "quick_fixes": [
-                    "Check previous container logs for startup errors",
-                    "Verify application configuration and environment variables",
-                    "Review resource limits and requests",
-                    "Check liveness and readiness probe configurations"
-                ],
-                "explanation": "Pod is crashing repeatedly. This usually indicates application startup issues, configuration problems, or resource constraints.",
-                "yaml_patch": self._generate_crashloop_yaml_patch(pod_data)
-            })
-        
-        # ImagePull issues
-        elif "imagepull" in issue_lower:
-            issue_analysis.update({
-                "severity": "high",
-                "commands": [
-                    f"kubectl describe pod {pod_name} -n {namespace}",
-                    "kubectl get events -n {namespace} --sort-by=.lastTimestamp",
-                    f"kubectl get pod {pod_name} -n {namespace} -o jsonpath='{{.spec.containers[*].image}}'"
-                ],
-                "quick_fixes": [
-                    "Verify image name and tag are correct",
-                    "Check registry credentials and access",
-                    "Ensure registry is accessible from cluster",
-                    "Try pulling image manually: docker pull <image>"
-                ],
-                "explanation": "Cannot pull container image. Check image name, registry access, and credentials.",
-                "yaml_patch": self._generate_imagepull_yaml_patch(pod_data)
-            })
-        
-        # OOM (Out of Memory) issues
-        elif "oom" in issue_lower:
-            issue_analysis.update({
-                "severity": "high",
-                "commands": [
-                    f"kubectl describe pod {pod_name} -n {namespace}",
-                    f"kubectl top pod {pod_name} -n {namespace}",
-                    f"kubectl logs {pod_name} -n {namespace} --previous"
-                ],
-                "quick_fixes": [
-                    "Increase memory limits in pod specification",
-                    "Review application memory usage and optimize if possible",
-                    "Check for memory leaks in application",
-                    "Consider using memory profiling tools"
-                ],
-                "explanation": "Container was killed due to out of memory. Increase memory limits or optimize application memory usage.",
-                "yaml_patch": self._generate_memory_yaml_patch(pod_data)
-            })
-        
-        # Pending state issues
-        elif "pending" in issue_lower:
-            issue_analysis.update({
-                "severity": "medium",
-                "commands": [
-                    f"kubectl describe pod {pod_name} -n {namespace}",
-                    "kubectl describe nodes",
-                    "kubectl get events -n {namespace}",
-                    f"kubectl get pod {pod_name} -n {namespace} -o yaml"
-                ],
-                "quick_fixes": [
-                    "Check node resources and availability",
-                    "Verify scheduling constraints (nodeSelector, affinity)",
-                    "Check persistent volume claims if used",
-                    "Review resource requests vs available node capacity"
-                ],
-                "explanation": "Pod cannot be scheduled. Usually due to insufficient resources, scheduling constraints, or node issues.",
-                "yaml_patch": self._generate_scheduling_yaml_patch(pod_data)
-            })
+        handler = self._analysis_handlers.get(self._classify(issue_lower))
+        if handler:
+            issue_analysis.update(handler(context))
         
         return issue_analysis
     
     def _analyze_logs_for_fixes(self, logs: str, pod_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze logs and suggest specific fixes"""
-        pod_name = pod_data.get("name", "unknown")
-        namespace = pod_data.get("namespace", "default")
+        context = self._command_context(pod_data)
         
         recommendations = {
             "commands": [],
@@ -306,35 +727,32 @@ class FixRecommender:
         if not logs:
             return recommendations
         
+        logs = self._scan_window(logs)
+        
         # Specific log pattern analysis
-        if re.search(r"port.*already in use|address.*already in use", logs, re.IGNORECASE):
+        found = _find_categories(_FUSED_FIX_RE, logs, logs.translate(_ASCII_LOWER_TABLE), _FIX_CATEGORIES, _FIX_RE2)
+        
+        if "port" in found:
             recommendations["fixes"].append("Port conflict detected - check for duplicate services")
-            recommendations["commands"].append(f"kubectl get svc -n {namespace}")
+            recommendations["commands"].extend(_iter_commands(_PORT_LOG_COMMANDS, context))
         
-        if re.search(r"connection refused|connection timeout", logs, re.IGNORECASE):
+        if "network" in found:
             recommendations["fixes"].append("Network connectivity issues - check service endpoints")
-            recommendations["commands"].extend([
-                f"kubectl get endpoints -n {namespace}",
-                f"kubectl describe svc -n {namespace}"
-            ])
+            recommendations["commands"].extend(_iter_commands(_NETWORK_LOG_COMMANDS, context))
         
-        if re.search(r"permission denied|access denied", logs, re.IGNORECASE):
+        if "permission" in found:
             recommendations["fixes"].append("Permission issues - check RBAC and security context")
-            recommendations["commands"].extend([
-                f"kubectl describe pod {pod_name} -n {namespace}",
-                f"kubectl get rolebindings,clusterrolebindings -n {namespace}"
-            ])
+            recommendations["commands"].extend(_iter_commands(_PERMISSION_LOG_COMMANDS, context))
         
-        if re.search(r"disk.*full|no space left", logs, re.IGNORECASE):
+        if "disk" in found:
             recommendations["fixes"].append("Disk space issues - check node disk usage")
             recommendations["commands"].append("kubectl describe nodes")
         
         return recommendations
     
-    def _get_fixes_for_issue(self, issue: str, pod_data: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Get detailed fixes for a specific issue"""
-        pod_name = pod_data.get("name", "unknown")
-        namespace = pod_data.get("namespace", "default")
+    def _get_fixes_for_category(self, category: Optional[str], pod_data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Get detailed fixes for an issue category"""
+        context = self._command_context(pod_data)
         
         fixes = {
             "immediate": [],
@@ -344,200 +762,140 @@ class FixRecommender:
             "validation": []
         }
         
-        issue_lower = issue.lower()
-        
-        if "crashloopbackoff" in issue_lower:
-            fixes.update({
-                "immediate": [
-                    "Check previous container logs for error messages",
-                    "Verify application startup sequence and dependencies"
-                ],
-                "config": [
-                    "Review environment variables and configuration files",
-                    "Check resource limits and requests",
-                    "Validate liveness and readiness probe settings"
-                ],
-                "commands": [
-                    f"kubectl logs {pod_name} -n {namespace} --previous",
-                    f"kubectl edit deployment <deployment-name> -n {namespace}"
-                ],
-                "validation": [
-                    f"kubectl get pod {pod_name} -n {namespace} -w",
-                    f"kubectl describe pod {pod_name} -n {namespace}"
-                ]
-            })
-        
-        elif "imagepull" in issue_lower:
-            fixes.update({
-                "immediate": [
-                    "Verify container image name and tag",
-                    "Check registry accessibility"
-                ],
-                "config": [
-                    "Update image pull secrets if using private registry",
-                    "Verify image exists in the specified registry"
-                ],
-                "commands": [
-                    f"kubectl create secret docker-registry <secret-name> --docker-server=<server> --docker-username=<username> --docker-password=<password>",
-                    f"kubectl patch pod {pod_name} -n {namespace} -p '{{\"spec\":{{\"imagePullSecrets\":[{{\"name\":\"<secret-name>\"}}]}}}}'"
-                ],
-                "validation": [
-                    f"kubectl describe pod {pod_name} -n {namespace}",
-                    "docker pull <image-name>"
-                ]
-            })
+        handler = self._fix_handlers.get(category)
+        if handler:
+            fixes.update(handler(context))
         
         return fixes
     
-    def _get_diagnostic_commands(self, pod_data: Dict[str, Any]) -> List[str]:
-        """Get general diagnostic commands for the pod"""
-        pod_name = pod_data.get("name", "unknown")
-        namespace = pod_data.get("namespace", "default")
-        
-        return [
-            f"# Basic pod information",
-            f"kubectl get pod {pod_name} -n {namespace} -o wide",
-            f"kubectl describe pod {pod_name} -n {namespace}",
-            f"",
-            f"# Logs and events",
-            f"kubectl logs {pod_name} -n {namespace}",
-            f"kubectl get events -n {namespace} --sort-by=.lastTimestamp",
-            f"",
-            f"# Resource usage (if metrics-server available)",
-            f"kubectl top pod {pod_name} -n {namespace}",
-            f"",
-            f"# Network debugging",
-            f"kubectl get svc,endpoints -n {namespace}",
-            f"kubectl describe node $(kubectl get pod {pod_name} -n {namespace} -o jsonpath='{{.spec.nodeName}}')"
-        ]
-    
-    def _generate_crashloop_yaml_patch(self, pod_data: Dict[str, Any]) -> str:
-        """Generate YAML patch for CrashLoopBackOff issues"""
-        return """
-# Potential fixes for CrashLoopBackOff:
-
-1. Increase resource limits:
-spec:
-  containers:
-  - name: <container-name>
-    resources:
-      limits:
-        memory: "512Mi"
-        cpu: "500m"
-      requests:
-        memory: "256Mi" 
-        cpu: "250m"
-
-2. Adjust probe timings:
-spec:
-  containers:
-  - name: <container-name>
-    livenessProbe:
-      initialDelaySeconds: 60
-      periodSeconds: 30
-      timeoutSeconds: 10
-    readinessProbe:
-      initialDelaySeconds: 30
-      periodSeconds: 15
-
-3. Add debug command (temporary):
-spec:
-  containers:
-  - name: <container-name>
-    command: ["/bin/sh"]
-    args: ["-c", "sleep 3600"]  # Keep container running for debugging
-"""
+    def _classify(self, issue_lower: str) -> Optional[str]:
+        """
+        Resolve the issue category from its keywords
+        
+        Args:
+            issue_lower: Issue description, already lowercased by the caller
+            
+        Returns:
+            Category name from issue_patterns, or None if no keyword matches
+        """
+        if self._keyword_automaton is not None:
+            matches = [value for _, value in self._keyword_automaton.iter(issue_lower)]
+            return min(matches)[1] if matches else None
+        
+        for keyword, category in self._keyword_to_category.items():
+            if keyword in issue_lower:
+                return category
+        return None
     
-    def _generate_imagepull_yaml_patch(self, pod_data: Dict[str, Any]) -> str:
-        """Generate YAML patch for image pull issues"""
-        return """
-# Fixes for image pull issues:
-
-1. Add image pull secrets:
-spec:
-  imagePullSecrets:
-  - name: <registry-secret>
-
-2. Use specific image tag (avoid 'latest'):
-spec:
-  containers:
-  - name: <container-name>
-    image: <registry>/<image>:<specific-tag>
-    imagePullPolicy: IfNotPresent
-
-3. Create registry secret:
-kubectl create secret docker-registry <secret-name> \\
-  --docker-server=<registry-url> \\
-  --docker-username=<username> \\
-  --docker-password=<password> \\
-  --docker-email=<email>
-"""
+    def _crashloop_analysis(self, context: Dict[str, str]) -> Dict[str, Any]:
+        """CrashLoopBackOff analysis"""
+        return {
+            "severity": "high",
+            "commands": _format_commands(_CRASHLOOP_COMMANDS, context),
+            "quick_fixes": [
+                "Check previous container logs for startup errors",
+                "Verify application configuration and environment variables",
+                "Review resource limits and requests",
+                "Check liveness and readiness probe configurations"
+            ],
+            "explanation": "Pod is crashing repeatedly. This usually indicates application startup issues, configuration problems, or resource constraints.",
+            "yaml_patch": _CRASHLOOP_YAML_PATCH
+        }
     
-    def _generate_memory_yaml_patch(self, pod_data: Dict[str, Any]) -> str:
-        """Generate YAML patch for memory issues"""
-        return """
-# Fixes for OOM (Out of Memory) issues:
-
-1. Increase memory limits:
-spec:
-  containers:
-  - name: <container-name>
-    resources:
-      limits:
-        memory: "1Gi"  # Increase as needed
-      requests:
-        memory: "512Mi"
-
-2. Add memory monitoring:
-spec:
-  containers:
-  - name: <container-name>
-    env:
-    - name: JAVA_OPTS  # For Java apps
-      value: "-Xmx800m -XX:+UseG1GC"
-"""
+    def _imagepull_analysis(self, context: Dict[str, str]) -> Dict[str, Any]:
+        """ImagePull issues analysis"""
+        return {
+            "severity": "high",
+            "commands": _format_commands(_IMAGEPULL_COMMANDS, context),
+            "quick_fixes": [
+                "Verify image name and tag are correct",
+                "Check registry credentials and access",
+                "Ensure registry is accessible from cluster",
+                "Try pulling image manually: docker pull <image>"
+            ],
+            "explanation": "Cannot pull container image. Check image name, registry access, and credentials.",
+            "yaml_patch": _IMAGEPULL_YAML_PATCH
+        }
     
-    def _generate_scheduling_yaml_patch(self, pod_data: Dict[str, Any]) -> str:
-        """Generate YAML patch for scheduling issues"""
-        return """
-# Fixes for pod scheduling issues:
-
-1. Reduce resource requests:
-spec:
-  containers:
-  - name: <container-name>
-    resources:
-      requests:
-        memory: "128Mi"  # Reduce if too high
-        cpu: "100m"
-
-2. Add node selector (if needed):
-spec:
-  nodeSelector:
-    kubernetes.io/os: linux
-
-3. Add tolerations (if needed):
-spec:
-  tolerations:
-  - key: "node-role.kubernetes.io/master"
-    operator: "Exists"
-    effect: "NoSchedule"
-"""
+    def _oom_analysis(self, context: Dict[str, str]) -> Dict[str, Any]:
+        """OOM (Out of Memory) issues analysis"""
+        return {
+            "severity": "high",
+            "commands": _format_commands(_OOM_COMMANDS, context),
+            "quick_fixes": [
+                "Increase memory limits in pod specification",
+                "Review application memory usage and optimize if possible",
+                "Check for memory leaks in application",
+                "Consider using memory profiling tools"
+            ],
+            "explanation": "Container was killed due to out of memory. Increase memory limits or optimize application memory usage.",
+            "yaml_patch": _MEMORY_YAML_PATCH
+        }
+    
+    def _pending_analysis(self, context: Dict[str, str]) -> Dict[str, Any]:
+        """Pending state issues analysis"""
+        return {
+            "severity": "medium",
+            "commands": _format_commands(_PENDING_COMMANDS, context),
+            "quick_fixes": [
+                "Check node resources and availability",
+                "Verify scheduling constraints (nodeSelector, affinity)",
+                "Check persistent volume claims if used",
+                "Review resource requests vs available node capacity"
+            ],
+            "explanation": "Pod cannot be scheduled. Usually due to insufficient resources, scheduling constraints, or node issues.",
+            "yaml_patch": _SCHEDULING_YAML_PATCH
+        }
+    
+    def _crashloop_fixes(self, context: Dict[str, str]) -> Dict[str, List[str]]:
+        """Detailed fixes for CrashLoopBackOff"""
+        return {
+            "immediate": [
+                "Check previous container logs for error messages",
+                "Verify application startup sequence and dependencies"
+            ],
+            "config": [
+                "Review environment variables and configuration files",
+                "Check resource limits and requests",
+                "Validate liveness and readiness probe settings"
+            ],
+            "commands": _format_commands(_CRASHLOOP_FIX_COMMANDS, context),
+            "validation": _format_commands(_CRASHLOOP_VALIDATION, context)
+        }
+    
+    def _imagepull_fixes(self, context: Dict[str, str]) -> Dict[str, List[str]]:
+        """Detailed fixes for image pull issues"""
+        return {
+            "immediate": [
+                "Verify container image name and tag",
+                "Check registry accessibility"
+            ],
+            "config": [
+                "Update image pull secrets if using private registry",
+                "Verify image exists in the specified registry"
+            ],
+            "commands": _format_commands(_IMAGEPULL_FIX_COMMANDS, context),
+            "validation": _format_commands(_IMAGEPULL_VALIDATION, context)
+        }
+    
+    def _iter_diagnostic_commands(self, pod_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield general diagnostic commands for the pod"""
+        return _iter_commands(_DIAGNOSTIC_COMMANDS, self._command_context(pod_data))
     
-    def _generate_summary(self, recommendations: Dict[str, Any]) -> str:
+    def _command_context(self, pod_data: Dict[str, Any]) -> Dict[str, str]:
+        """Values substituted into the command templates for a pod"""
+        return {
+            "pod_name": pod_data.get("name", "unknown"),
+            "namespace": pod_data.get("namespace", "default")
+        }
+    
+    def _generate_summary(self, issue_count: int, command_count: int) -> str:
         """Generate a summary of the recommendations"""
-        issue_count = len(recommendations.get("issues_analyzed", []))
-        command_count = len(recommendations.get("commands", []))
-        
         return f"Found {issue_count} issues with {command_count} recommended diagnostic commands and specific fixes provided."
     
-    def _calculate_confidence_score(self, recommendations: Dict[str, Any]) -> float:
+    def _calculate_confidence_score(self, issues: int, commands: int, fixes: int) -> float:
         """Calculate confidence score for the recommendations"""
         # Simple scoring based on number of specific recommendations
-        issues = len(recommendations.get("issues_analyzed", []))
-        commands = len(recommendations.get("commands", []))
-        fixes = len(recommendations.get("quick_fixes", []))
-        
         if issues == 0:
             return 0.0
         
@@ -559,7 +917,8 @@ spec:
                 "category": "configuration"
             },
             "oom": {
-                "keywords": ["oomkilled", "out of memory", "memory"],
+                # Not bare "memory": "Insufficient memory" is a scheduling problem
+                "keywords": ["oomkilled", "out of memory"],
                 "severity": "high",
                 "category": "resources"
             },
@@ -9,6 +9,12 @@ and running basic tests.
 import subprocess
 import sys
 import os
+import re
+import json
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 
 def print_banner():
@@ -20,114 +26,147 @@ def print_banner():
 
 def check_python():
     """Check Python version"""
-    print("\n🐍 Checking Python version...")
+    name = "🐍 Checking Python version..."
     version = sys.version_info
     if version.major >= 3 and version.minor >= 8:
-        print(f"   ✅ Python {version.major}.{version.minor}.{version.micro} - OK")
-        return True
+        return name, True, f"   ✅ Python {version.major}.{version.minor}.{version.micro} - OK"
     else:
-        print(f"   ❌ Python {version.major}.{version.minor}.{version.micro} - Need 3.8+")
+        return name, False, f"   ❌ Python {version.major}.{version.minor}.{version.micro} - Need 3.8+"
+
+# OpenAI API keys: legacy sk-... and project-scoped sk-proj-...
+OPENAI_KEY_RE = re.compile(r"^sk-(?:proj-)?[A-Za-z0-9_\-]{20,}$")
+
+# Distribution names of packages whose import name differs
+DISTRIBUTION_NAMES = {'yaml': 'PyYAML'}
+
+@functools.lru_cache(maxsize=None)
+def _installed(package):
+    """Check that a package is installed from its metadata, without importing it"""
+    try:
+        distribution(DISTRIBUTION_NAMES.get(package, package))
+        return True
+    except PackageNotFoundError:
         return False
 
+@functools.lru_cache(maxsize=None)
+def _pending_requirements(path, mtime_ns):
+    """
+    Distributions pip would install for a requirements file, or None if pip cannot tell
+    
+    Resolved with a dry run, so nothing is downloaded or installed; memoized
+    per file modification time.
+    """
+    result = subprocess.run([sys.executable, "-m", "pip", "install", "--dry-run", "--quiet",
+                             "--report", "-", "-r", path],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    try:
+        report = json.loads(result.stdout)
+    except ValueError:
+        return None
+    return tuple(item["metadata"]["name"] for item in report.get("install", []))
+
 def check_dependencies():
     """Check if required Python packages are installed"""
-    print("\n📦 Checking Python dependencies...")
+    name = "📦 Checking Python dependencies..."
+    lines = []
     
     required_packages = ['typer', 'rich', 'openai', 'yaml', 'requests']
     missing_packages = []
     
     for package in required_packages:
-        try:
-            if package == 'yaml':
-                import yaml
-            else:
-                __import__(package)
-            print(f"   ✅ {package} - installed")
-        except ImportError:
-            print(f"   ❌ {package} - missing")
+        if _installed(package):
+            lines.append(f"   ✅ {package} - installed")
+        else:
+            lines.append(f"   ❌ {package} - missing")
             missing_packages.append(package)
     
     if missing_packages:
-        print(f"\n🔧 Installing missing packages: {', '.join(missing_packages)}")
+        # Older pips without --dry-run/--report fall through to the install
+        if (os.path.exists("requirements.txt")
+                and _pending_requirements("requirements.txt", os.stat("requirements.txt").st_mtime_ns) == ()):
+            lines.append("   ✅ requirements.txt - already satisfied")
+            return name, True, "\n".join(lines)
+        
+        lines.append(f"\n🔧 Installing missing packages: {', '.join(missing_packages)}")
         try:
             subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
                          check=True, capture_output=True)
-            print("   ✅ Dependencies installed successfully!")
-            return True
+            lines.append("   ✅ Dependencies installed successfully!")
+            return name, True, "\n".join(lines)
         except subprocess.CalledProcessError as e:
-            print(f"   ❌ Failed to install dependencies: {e}")
-            return False
+            lines.append(f"   ❌ Failed to install dependencies: {e}")
+            return name, False, "\n".join(lines)
     
-    return True
+    return name, True, "\n".join(lines)
 
 def check_kubectl():
     """Check if kubectl is available and working"""
-    print("\n⚙️ Checking kubectl...")
+    name = "⚙️ Checking kubectl..."
     
+    # The client check and the cluster probe run side by side, sharing one timeout
+    commands = (['kubectl', 'version', '--client'], ['kubectl', 'cluster-info'])
+    procs = []
     try:
-        # Check if kubectl is installed
-        result = subprocess.run(['kubectl', 'version', '--client'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            print("   ✅ kubectl - installed")
-        else:
-            print("   ❌ kubectl - not found")
-            return False
-        
-        # Check cluster connection
-        result = subprocess.run(['kubectl', 'cluster-info'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            print("   ✅ Kubernetes cluster - connected")
-            return True
-        else:
-            print("   ⚠️ Kubernetes cluster - not connected")
-            print("   💡 You can still use KubeGPT in demo mode")
-            return True
-            
+        for command in commands:
+            procs.append(subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        deadline = time.monotonic() + 10
+        version_code, cluster_code = (
+            proc.wait(timeout=max(0, deadline - time.monotonic())) for proc in procs
+        )
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        print("   ❌ kubectl - not found or not responding")
-        print("   💡 Install kubectl: https://kubernetes.io/docs/tasks/tools/")
-        return False
+        for proc in procs:
+            proc.kill()
+        return name, False, ("   ❌ kubectl - not found or not responding\n"
+                             "   💡 Install kubectl: https://kubernetes.io/docs/tasks/tools/")
+    
+    # Check if kubectl is installed
+    if version_code != 0:
+        return name, False, "   ❌ kubectl - not found"
+    
+    # Check cluster connection
+    if cluster_code == 0:
+        return name, True, "   ✅ kubectl - installed\n   ✅ Kubernetes cluster - connected"
+    return name, True, ("   ✅ kubectl - installed\n"
+                        "   ⚠️ Kubernetes cluster - not connected\n"
+                        "   💡 You can still use KubeGPT in demo mode")
 
 def check_openai_key():
     """Check if OpenAI API key is configured"""
-    print("\n🤖 Checking AI configuration...")
+    name = "🤖 Checking AI configuration..."
     
     api_key = os.getenv('OPENAI_API_KEY')
     if api_key:
-        if api_key.startswith('sk-') and len(api_key) > 20:
-            print("   ✅ OpenAI API key - configured")
-            return True
+        if OPENAI_KEY_RE.match(api_key):
+            return name, True, "   ✅ OpenAI API key - configured"
         else:
-            print("   ⚠️ OpenAI API key - invalid format")
-            return False
+            return name, False, "   ⚠️ OpenAI API key - invalid format"
     else:
-        print("   ⚠️ OpenAI API key - not configured")
-        print("   💡 Set OPENAI_API_KEY environment variable for AI features")
-        return False
+        return name, False, ("   ⚠️ OpenAI API key - not configured\n"
+                             "   💡 Set OPENAI_API_KEY environment variable for AI features")
 
 def run_basic_test():
     """Run basic KubeGPT functionality test"""
-    print("\n🧪 Running basic functionality test...")
+    name = "🧪 Running basic functionality test..."
     
     try:
         # Test help command
         result = subprocess.run([sys.executable, 'kubegpt.py', '--help'], 
                               capture_output=True, text=True, timeout=15)
         if result.returncode == 0:
-            print("   ✅ KubeGPT CLI - working")
-            return True
+            return name, True, "   ✅ KubeGPT CLI - working"
         else:
-            print(f"   ❌ KubeGPT CLI - error: {result.stderr}")
-            return False
+            return name, False, f"   ❌ KubeGPT CLI - error: {result.stderr}"
             
     except subprocess.TimeoutExpired:
-        print("   ❌ KubeGPT CLI - timeout")
-        return False
+        return name, False, "   ❌ KubeGPT CLI - timeout"
     except Exception as e:
-        print(f"   ❌ KubeGPT CLI - error: {e}")
-        return False
+        return name, False, f"   ❌ KubeGPT CLI - error: {e}"
+
+def check_dependencies_and_cli():
+    """Install missing dependencies, then test the CLI that needs them"""
+    return [check_dependencies(), run_basic_test()]
 
 def suggest_next_steps():
     """Suggest what to do next"""
@@ -143,20 +182,26 @@ def main():
     """Main function"""
     print_banner()
     
-    # Check all prerequisites
-    all_good = True
-    
-    if not check_python():
-        all_good = False
-    
-    if not check_dependencies():
-        all_good = False
+    # Independent checks run concurrently; the CLI test waits for the
+    # dependency install it relies on
+    print("\n⏳ Checking prerequisites...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        python_check = executor.submit(check_python)
+        setup_checks = executor.submit(check_dependencies_and_cli)
+        kubectl_check = executor.submit(check_kubectl)
+        ai_check = executor.submit(check_openai_key)
+        
+        dependencies_result, cli_result = setup_checks.result()
+        results = [python_check.result(), dependencies_result, kubectl_check.result(),
+                   ai_check.result(), cli_result]
     
-    kubectl_ok = check_kubectl()
-    ai_ok = check_openai_key()
+    for name, _, message in results:
+        print(f"\n{name}")
+        print(message)
     
-    if not run_basic_test():
-        all_good = False
+    all_good = python_check.result()[1] and dependencies_result[1] and cli_result[1]
+    kubectl_ok = kubectl_check.result()[1]
+    ai_ok = ai_check.result()[1]
     
     # Summary
     print("\n" + "="*70)
@@ -5,13 +5,303 @@ Uses OpenAI GPT models to provide intelligent analysis of Kubernetes pod issues.
 """
 
 import os
+import ssl
 import json
+import time
+import random
+import asyncio
+import functools
+import atexit
+import hashlib
 import logging
-from typing import Dict, Any, Optional
-from openai import OpenAI
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+# openai (and httpx, pydantic, anyio behind it) is imported when a client is
+# created, so importing this module does not pay for it
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Pod containers, conditions and events are embedded in prompts as indented
+# JSON; orjson encodes them much faster than the stdlib when it is installed
+try:
+    import orjson
+
+    def _prompt_json(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+except ImportError:
+    def _prompt_json(data: Any) -> str:
+        return json.dumps(data, indent=2, default=str)
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool of the HTTP client shared by every analyzer
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 60
+
+_http_client: Optional["httpx.Client"] = None
+_http_client_lock = threading.Lock()
+
+# Set once a background request has opened the shared client's first connection
+_connection_warmed = threading.Event()
+
+# Answers kept for repeated identical requests, and how long they stay valid
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 6 * 3600
+
+# Least recently used first; values are (expiry time, answer)
+_response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Token budgets for pod data in prompts
+ANALYSIS_LOG_TOKENS = 500
+LOG_ANALYSIS_TOKENS = 750
+EVENTS_TOKENS = 750
+
+# Map-reduce log analysis: tokens per chunk, and chunks kept (the most recent) per log
+LOG_CHUNK_TOKENS = 1500
+MAX_LOG_CHUNKS = 20
+
+# Characters per token assumed when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+
+# System prompts, fixed so every request of a kind starts with identical text
+SYSTEM_PROMPT = """You are KubeGPT, an expert Kubernetes troubleshooting assistant. You specialize in:
+- Diagnosing pod failures and issues
+- Analyzing logs and events
+- Providing actionable troubleshooting steps
+- Recommending best practices
+- Explaining complex Kubernetes concepts clearly
+
+Your responses should be:
+- Clear and concise
+- Technically accurate
+- Actionable with specific commands when helpful
+- Focused on practical solutions
+- Structured with clear sections
+
+Always consider the context of production environments and provide safe, tested recommendations."""
+
+TROUBLESHOOTING_SYSTEM_PROMPT = """You are a senior Kubernetes administrator and troubleshooting expert. Your role is to provide:
+- Step-by-step troubleshooting procedures
+- Relevant kubectl commands with proper syntax
+- Common pitfalls and how to avoid them
+- Best practices for resolution
+- Clear explanations of what each step accomplishes
+
+Structure your responses with:
+1. Immediate diagnostic steps
+2. Progressive troubleshooting approach
+3. Specific commands to run
+4. Expected outputs and what they mean
+5. Resolution steps
+6. Verification procedures
+
+Always prioritize safe operations and include warnings for potentially disruptive commands."""
+
+LOG_SYSTEM_PROMPT = "You are a Kubernetes expert specializing in log analysis and troubleshooting."
+EVENTS_SYSTEM_PROMPT = "You are a Kubernetes expert specializing in event analysis and cluster troubleshooting."
+
+# Attempts per chat completion, and the bounds of the jittered backoff between them
+OPENAI_RETRY_ATTEMPTS = 4
+RETRY_MIN_WAIT = 1
+RETRY_MAX_WAIT = 30
+
+# Consecutive failed calls after which OpenAI requests are skipped, and for how many seconds
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET = 60
+
+# Log analyses are also reused for prompts whose embeddings are this similar
+# (needs numpy); the cache keeps the newest entries in a file per chat model
+SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_SIZE = 500
+SEMANTIC_CACHE_DIR = os.path.join("~", ".kubegpt", "semantic_cache")
+
+# Batch API endpoint, and the first and longest wait between status checks in seconds
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_POLL_INTERVAL = 5
+BATCH_MAX_POLL_INTERVAL = 60
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_ssl_context() -> ssl.SSLContext:
+    """TLS context shared by the sync and async HTTP clients"""
+    return ssl.create_default_context()
+
+
+def _http_limits() -> "httpx.Limits":
+    """Connection pool limits of the analyzers' HTTP clients"""
+    import httpx
+    return httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS, keepalive_expiry=KEEPALIVE_EXPIRY)
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding_for(model: str):
+    """tiktoken encoding for a model, loaded once"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Keep the start of text up to max_tokens, noting how much was cut"""
+    if tiktoken is None:
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        return f"{text[:max_chars]}...[truncated {len(text) - max_chars} chars]"
+    
+    encoding = _encoding_for(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return f"{encoding.decode(tokens[:max_tokens])}...[truncated {len(tokens) - max_tokens} tokens]"
+
+
+def _split_tokens(text: str, chunk_tokens: int, model: str) -> List[str]:
+    """Split text into consecutive pieces of at most chunk_tokens"""
+    if tiktoken is None:
+        size = chunk_tokens * _CHARS_PER_TOKEN
+        return [text[i:i + size] for i in range(0, len(text), size)]
+    
+    encoding = _encoding_for(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    return [encoding.decode(tokens[i:i + chunk_tokens]) for i in range(0, len(tokens), chunk_tokens)]
+
+
+def _shared_http_client() -> "httpx.Client":
+    """
+    HTTP client shared by all analyzers
+    
+    The TLS context is built once and connections stay open between requests,
+    instead of each OpenAI client creating its own. API keys are sent per
+    request, so sharing the pool does not share credentials.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            from openai import DefaultHttpxClient
+            _http_client = DefaultHttpxClient(verify=_shared_ssl_context(), limits=_http_limits())
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+@functools.lru_cache(maxsize=None)
+def _semantic_cache(model: str):
+    """Semantic cache of log analyses made with a chat model, or None without numpy"""
+    try:
+        from .semantic_cache import SemanticCache
+    except ImportError:
+        return None
+    cache = SemanticCache(os.path.join(SEMANTIC_CACHE_DIR, f"log-analyses-{model}.npz"),
+                          SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_SIZE, RESPONSE_CACHE_TTL)
+    atexit.register(cache.save)
+    return cache
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying: the Retry-After header if sent, else jittered exponential backoff"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_WAIT)
+        except ValueError:
+            pass
+    return random.uniform(RETRY_MIN_WAIT, min(RETRY_MAX_WAIT, RETRY_MIN_WAIT * 2 ** (attempt + 1)))
+
+
+def _openai_errors() -> Tuple[Tuple[type, ...], type]:
+    """
+    Transient OpenAI errors worth retrying, and the base class of all API errors
+    
+    Transient are 429s, 5xx responses and connection failures (APITimeoutError
+    is an APIConnectionError).
+    """
+    from openai import APIError, APIConnectionError, InternalServerError, RateLimitError
+    return (RateLimitError, InternalServerError, APIConnectionError), APIError
+
+
+class _CircuitBreaker:
+    """Stops calling the API for a while after repeated failures"""
+    
+    def __init__(self, threshold: int, reset_after: float):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def check(self):
+        """Raise instead of calling the API while the breaker is open"""
+        with self._lock:
+            if self.failures >= self.threshold and time.monotonic() - self.opened_at < self.reset_after:
+                raise RuntimeError(f"OpenAI calls paused for {self.reset_after}s after "
+                                   f"{self.failures} consecutive failures")
+    
+    def record(self, success: bool):
+        """Count a call; a success closes the breaker"""
+        with self._lock:
+            if success:
+                self.failures = 0
+            else:
+                self.failures += 1
+                if self.failures >= self.threshold:
+                    self.opened_at = time.monotonic()
+
+
+# Shared by all analyzers, since they all talk to the same API
+_circuit_breaker = _CircuitBreaker(CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET)
+
+
+def _cached_response(key: str) -> Optional[str]:
+    """Unexpired cached answer for a request key, or None"""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            _response_cache.move_to_end(key)
+            return entry[1]
+    return None
+
+
+def _store_response(key: str, content: str) -> None:
+    """Cache an answer, evicting the least recently used beyond RESPONSE_CACHE_SIZE"""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, content)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+class PodInfo(NamedTuple):
+    """The pod_info fields an analysis prompt uses, read as attributes"""
+    name: str = 'Unknown'
+    namespace: str = 'Unknown'
+    status: str = 'Unknown'
+    node: str = 'Unknown'
+    age: str = 'Unknown'
+    containers: Sequence[Dict[str, Any]] = ()
+    conditions: Sequence[Dict[str, Any]] = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PodInfo":
+        """PodInfo from a KubernetesClient.get_pod_info dict; missing fields get defaults"""
+        return cls(**{field: data[field] for field in cls._fields if field in data})
+
+
+def _pod_info(pod_data: Dict[str, Any]) -> PodInfo:
+    """pod_data['pod_info'] as a PodInfo, whether given as one or as a dict"""
+    pod_info: Union[PodInfo, Dict[str, Any]] = pod_data.get('pod_info') or {}
+    return pod_info if isinstance(pod_info, PodInfo) else PodInfo.from_dict(pod_info)
+
 
 class GPTAnalyzer:
     """AI-powered analyzer for Kubernetes pod diagnostics"""
@@ -22,14 +312,32 @@ class GPTAnalyzer:
         self.api_key = self._get_api_key()
         
         if self.api_key:
-            self.client = OpenAI(api_key=self.api_key)
+            from openai import OpenAI
+            self.client = OpenAI(api_key=self.api_key, http_client=_shared_http_client())
+            if not _connection_warmed.is_set():
+                _connection_warmed.set()
+                threading.Thread(target=self._warm_connection, daemon=True).start()
             self.model = config.get('openai.model', 'gpt-3.5-turbo')
+            # Per-task models from openai.models (shared with the kubegpt CLI):
+            # light log/event summaries, heavier root-cause analysis
+            self.root_cause_model = config.get('openai.models.root_cause') or self.model
+            self.log_scan_model = config.get('openai.models.log_scan') or self.model
+            self.troubleshooting_model = config.get('openai.models.troubleshooting') or self.model
             self.max_tokens = config.get('openai.max_tokens', 1000)
             self.temperature = config.get('openai.temperature', 0.3)
+            # Reusing analyses of similar logs costs an embeddings call per miss
+            self.semantic_cache = bool(config.get('openai.semantic_cache', False))
         else:
             self.client = None
             logger.warning("OpenAI API key not found. AI analysis will be disabled.")
     
+    def _warm_connection(self):
+        """Open the TLS connection to the API ahead of the first real request"""
+        try:
+            self.client.models.list()
+        except Exception as e:
+            logger.debug(f"OpenAI connection warm-up failed: {e}")
+    
     def _get_api_key(self) -> Optional[str]:
         """Get OpenAI API key from config or environment"""
         # First try config
@@ -55,65 +363,38 @@ class GPTAnalyzer:
             prompt = self._create_analysis_prompt(pod_data)
             
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self._get_system_prompt()
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            analysis = response.choices[0].message.content
-            return analysis
+            return self._complete(SYSTEM_PROMPT, prompt, self.root_cause_model)
             
         except Exception as e:
             logger.error(f"Error during AI analysis: {e}")
             return f"AI analysis failed: {e}"
     
+    def analyze_pod_issues_stream(self, pod_data: Dict[str, Any]) -> Iterator[str]:
+        """Analyze pod issues, yielding the answer in pieces as the model writes it"""
+        if not self.client:
+            yield "AI analysis is not available. Please configure OpenAI API key."
+            return
+        
+        try:
+            yield from self._complete_stream(SYSTEM_PROMPT, self._create_analysis_prompt(pod_data),
+                                             self.root_cause_model)
+        except Exception as e:
+            logger.error(f"Error during AI analysis: {e}")
+            yield f"\n\nAI analysis failed: {e}"
+    
+    def logs_exceed_prompt(self, logs: str) -> bool:
+        """Whether analyze_pod_issues would only see the start of these logs"""
+        return len(_split_tokens(logs, ANALYSIS_LOG_TOKENS, self.root_cause_model)) > 1
+    
     def analyze_logs(self, logs: str, pod_name: str) -> str:
         """Analyze pod logs specifically"""
         if not self.client:
             return "AI log analysis is not available. Please configure OpenAI API key."
         
         try:
-            prompt = f"""
-            Please analyze the following logs from Kubernetes pod '{pod_name}' and identify any issues or errors:
-            
-            LOGS:
-            {logs[:3000]}  # Limit log size
+            prompt = self._create_log_prompt(logs, pod_name)
             
-            Please provide:
-            1. Summary of any errors or warnings found
-            2. Potential root causes
-            3. Recommended solutions
-            4. Any patterns or recurring issues
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Kubernetes expert specializing in log analysis and troubleshooting."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            return response.choices[0].message.content
+            return self._complete_similar(LOG_SYSTEM_PROMPT, prompt, self.log_scan_model, pod_name)
             
         except Exception as e:
             logger.error(f"Error during log analysis: {e}")
@@ -125,38 +406,9 @@ class GPTAnalyzer:
             return "AI event analysis is not available. Please configure OpenAI API key."
         
         try:
-            events_text = json.dumps(events[:10], indent=2)  # Limit to recent 10 events
-            
-            prompt = f"""
-            Please analyze the following Kubernetes events{' for ' + context if context else ''}:
-            
-            EVENTS:
-            {events_text}
-            
-            Please provide:
-            1. Summary of significant events
-            2. Any warning or error events that need attention
-            3. Potential issues or patterns
-            4. Recommended actions
-            """
+            prompt = self._create_events_prompt(events, context)
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Kubernetes expert specializing in event analysis and cluster troubleshooting."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            return response.choices[0].message.content
+            return self._complete(EVENTS_SYSTEM_PROMPT, prompt, self.log_scan_model)
             
         except Exception as e:
             logger.error(f"Error during event analysis: {e}")
@@ -168,63 +420,259 @@ class GPTAnalyzer:
             return "AI troubleshooting is not available. Please configure OpenAI API key."
         
         try:
-            prompt = f"""
-            I'm experiencing the following Kubernetes issue:
-            {issue_description}
+            prompt = self._create_troubleshooting_prompt(issue_description)
             
-            Please provide detailed troubleshooting steps including:
-            1. Initial diagnostic commands to run
-            2. Common causes and how to check for them
-            3. Step-by-step resolution process
-            4. Prevention strategies
-            5. Relevant kubectl commands with examples
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": self._get_troubleshooting_system_prompt()
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            return response.choices[0].message.content
+            return self._complete(TROUBLESHOOTING_SYSTEM_PROMPT, prompt, self.troubleshooting_model)
             
         except Exception as e:
             logger.error(f"Error getting troubleshooting steps: {e}")
             return f"Troubleshooting analysis failed: {e}"
     
+    def get_troubleshooting_steps_stream(self, issue_description: str) -> Iterator[str]:
+        """Get troubleshooting steps, yielding the answer in pieces as the model writes it"""
+        if not self.client:
+            yield "AI troubleshooting is not available. Please configure OpenAI API key."
+            return
+        
+        try:
+            yield from self._complete_stream(TROUBLESHOOTING_SYSTEM_PROMPT,
+                                             self._create_troubleshooting_prompt(issue_description),
+                                             self.troubleshooting_model)
+        except Exception as e:
+            logger.error(f"Error getting troubleshooting steps: {e}")
+            yield f"\n\nTroubleshooting analysis failed: {e}"
+    
+    def analyze_pod_issues_batch(self, pod_datas: List[Dict[str, Any]],
+                                 timeout: Optional[float] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Analyze many pods through the OpenAI Batch API
+        
+        Batch requests cost half as much as synchronous ones but complete
+        within a 24h window, so this suits offline namespace scans. Pods
+        answered before are served from the response cache; pods the batch
+        does not answer, or all of them if it fails or times out, are
+        analyzed synchronously instead.
+        
+        Args:
+            pod_datas: Pod data, one entry per pod
+            timeout: Seconds to wait for the batch, or None to wait for the batch window
+        
+        Yields:
+            (namespace/name, analysis) pairs; cached pods come first
+        """
+        if not self.client:
+            for pod_data in pod_datas:
+                yield self._batch_id(pod_data), "AI analysis is not available. Please configure OpenAI API key."
+            return
+        
+        system, model = SYSTEM_PROMPT, self.root_cause_model
+        pending = {}
+        for pod_data in pod_datas:
+            custom_id = self._batch_id(pod_data)
+            prompt = self._create_analysis_prompt(pod_data)
+            cached = _cached_response(self._cache_key(system, prompt, model))
+            if cached is not None:
+                yield custom_id, cached
+            else:
+                pending[custom_id] = (pod_data, prompt)
+        
+        if not pending:
+            return
+        
+        try:
+            answers = self._run_batch({custom_id: prompt for custom_id, (_, prompt) in pending.items()},
+                                      system, model, timeout)
+        except Exception as e:
+            logger.warning(f"Batch analysis failed, analyzing pods one by one: {e}")
+            answers = {}
+        
+        for custom_id, (pod_data, prompt) in pending.items():
+            content = answers.get(custom_id)
+            if content is None:
+                yield custom_id, self.analyze_pod_issues(pod_data)
+                continue
+            _store_response(self._cache_key(system, prompt, model), content)
+            yield custom_id, content
+    
+    def _run_batch(self, prompts: Dict[str, str], system: str, model: str,
+                   timeout: Optional[float]) -> Dict[str, str]:
+        """
+        Send user prompts as one batch and wait for it with exponential backoff
+        
+        Returns:
+            Answer by custom_id; requests that failed are left out
+        """
+        lines = (
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": self._request_body(system, prompt, model)
+            })
+            for custom_id, prompt in prompts.items()
+        )
+        input_file = self.client.files.create(file=("kubegpt-batch.jsonl", "\n".join(lines).encode()), purpose="batch")
+        batch = self.client.batches.create(input_file_id=input_file.id, endpoint=BATCH_ENDPOINT,
+                                           completion_window="24h")
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(prompts)} requests")
+        
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = BATCH_POLL_INTERVAL
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if deadline is not None and time.monotonic() + interval > deadline:
+                raise TimeoutError(f"OpenAI batch {batch.id} still {batch.status} after {timeout}s")
+            time.sleep(interval)
+            interval = min(interval * 2, BATCH_MAX_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended as {batch.status}")
+        
+        answers = {}
+        if not batch.output_file_id:
+            return answers
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"Batch analysis of {record.get('custom_id')} failed: {record.get('error') or response}")
+                continue
+            answers[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return answers
+    
+    def _batch_id(self, pod_data: Dict[str, Any]) -> str:
+        """Batch custom_id for a pod: namespace/name"""
+        pod_info = _pod_info(pod_data)
+        return f"{pod_info.namespace}/{pod_info.name}"
+    
+    def _cache_key(self, system: str, user: str, model: str) -> str:
+        """Response cache key for a request with a model and this analyzer's sampling settings"""
+        return hashlib.blake2b(
+            f"{model}|{self.temperature}|{self.max_tokens}|{system}|{user}".encode(), digest_size=16
+        ).hexdigest()
+    
+    def _request_body(self, system: str, user: str, model: str) -> Dict[str, Any]:
+        """chat.completions.create parameters for a system and user prompt"""
+        return {
+            "model": model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system
+                },
+                {
+                    "role": "user",
+                    "content": user
+                }
+            ],
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature
+        }
+    
+    def _chat(self, request: Dict[str, Any], **options):
+        """
+        Call chat.completions.create, retrying rate limits, server errors, timeouts and connection errors
+        
+        The SDK's own retries are turned off for these calls so there is a
+        single retry policy. Calls that still fail, or fail with an error that
+        is not retried, count toward the circuit breaker.
+        """
+        retryable, api_error = _openai_errors()
+        _circuit_breaker.check()
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(OPENAI_RETRY_ATTEMPTS):
+            try:
+                response = client.chat.completions.create(**request, **options)
+            except retryable as e:
+                if attempt == OPENAI_RETRY_ATTEMPTS - 1:
+                    _circuit_breaker.record(False)
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"OpenAI request failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            except api_error:
+                _circuit_breaker.record(False)
+                raise
+            _circuit_breaker.record(True)
+            return response
+    
+    def _complete(self, system: str, user: str, model: str) -> str:
+        """Send a chat completion, answering repeated identical requests from memory"""
+        key = self._cache_key(system, user, model)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
+        
+        response = self._chat(self._request_body(system, user, model))
+        content = response.choices[0].message.content
+        _store_response(key, content)
+        return content
+    
+    def _complete_similar(self, system: str, user: str, model: str, subject: str) -> str:
+        """
+        _complete that also reuses the answer to a semantically near-identical prompt
+        
+        Only answers about the same subject (e.g. pod) with the same model and
+        sampling settings are reused, since the answer names its subject.
+        Used when openai.semantic_cache is enabled.
+        """
+        if not self.semantic_cache:
+            return self._complete(system, user, model)
+        
+        cached = _cached_response(self._cache_key(system, user, model))
+        if cached is not None:
+            return cached
+        
+        cache = _semantic_cache(model)
+        scope = self._cache_key(system, subject, model)
+        embedding = None
+        if cache is not None:
+            try:
+                embedding = self.client.embeddings.create(model=SEMANTIC_CACHE_MODEL, input=user).data[0].embedding
+                similar = cache.get(embedding, scope)
+                if similar is not None:
+                    return similar
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed: {e}")
+        
+        content = self._complete(system, user, model)
+        if embedding is not None and content:
+            cache.add(embedding, scope, content)
+        return content
+    
+    def _complete_stream(self, system: str, user: str, model: str) -> Iterator[str]:
+        """Streaming _complete: yields content fragments, or the cached answer in one piece"""
+        key = self._cache_key(system, user, model)
+        cached = _cached_response(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        for chunk in self._chat(self._request_body(system, user, model), stream=True):
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                parts.append(content)
+                yield content
+        
+        if parts:
+            _store_response(key, "".join(parts))
+    
     def _create_analysis_prompt(self, pod_data: Dict[str, Any]) -> str:
         """Create a comprehensive analysis prompt"""
-        pod_info = pod_data.get('pod_info', {})
-        logs = pod_data.get('logs', '')[:2000]  # Limit log size
+        pod_info = _pod_info(pod_data)
+        logs = _truncate_tokens(pod_data.get('logs', ''), ANALYSIS_LOG_TOKENS, self.root_cause_model)
         events = pod_data.get('events', [])[:5]  # Limit to recent 5 events
         
+        # Instructions come before any pod data so every request starts with
+        # the same text, which OpenAI's automatic prompt caching can reuse
         prompt = f"""
-        Please analyze the following Kubernetes pod data and provide a comprehensive diagnostic report:
-
-        POD INFORMATION:
-        - Name: {pod_info.get('name', 'Unknown')}
-        - Namespace: {pod_info.get('namespace', 'Unknown')}
-        - Status: {pod_info.get('status', 'Unknown')}
-        - Node: {pod_info.get('node', 'Unknown')}
-        - Age: {pod_info.get('age', 'Unknown')}
-        - Containers: {json.dumps(pod_info.get('containers', []), indent=2)}
-        - Conditions: {json.dumps(pod_info.get('conditions', []), indent=2)}
-
-        RECENT LOGS:
-        {logs}
-
-        RECENT EVENTS:
-        {json.dumps(events, indent=2)}
+        Please analyze the Kubernetes pod data below and provide a comprehensive diagnostic report.
 
         Please provide:
         1. **Status Assessment**: Current health status of the pod
@@ -235,47 +683,274 @@ class GPTAnalyzer:
         6. **Monitoring**: What to monitor going forward
         
         Please be specific and actionable in your recommendations.
+
+        POD INFORMATION:
+        - Name: {pod_info.name}
+        - Namespace: {pod_info.namespace}
+        - Status: {pod_info.status}
+        - Node: {pod_info.node}
+        - Age: {pod_info.age}
+        - Containers: {_prompt_json(pod_info.containers)}
+        - Conditions: {_prompt_json(pod_info.conditions)}
+
+        RECENT LOGS:
+        {logs}
+
+        RECENT EVENTS:
+        {_truncate_tokens(_prompt_json(events), EVENTS_TOKENS, self.root_cause_model)}
         """
         
         return prompt
     
-    def _get_system_prompt(self) -> str:
-        """Get system prompt for general pod analysis"""
-        return """
-        You are KubeGPT, an expert Kubernetes troubleshooting assistant. You specialize in:
-        - Diagnosing pod failures and issues
-        - Analyzing logs and events
-        - Providing actionable troubleshooting steps
-        - Recommending best practices
-        - Explaining complex Kubernetes concepts clearly
-        
-        Your responses should be:
-        - Clear and concise
-        - Technically accurate
-        - Actionable with specific commands when helpful
-        - Focused on practical solutions
-        - Structured with clear sections
-        
-        Always consider the context of production environments and provide safe, tested recommendations.
+    def _create_log_prompt(self, logs: str, pod_name: str) -> str:
+        """Create the log analysis prompt (fixed instructions first, pod data last)"""
+        prompt = f"""
+        Please analyze the logs from the Kubernetes pod below and identify any issues or errors.
+        
+        Please provide:
+        1. Summary of any errors or warnings found
+        2. Potential root causes
+        3. Recommended solutions
+        4. Any patterns or recurring issues
+        
+        POD: {pod_name}
+        
+        LOGS:
+        {_truncate_tokens(logs, LOG_ANALYSIS_TOKENS, self.log_scan_model)}
+        """
+        
+        return prompt
+    
+    def _create_events_prompt(self, events: list, context: str = "") -> str:
+        """Create the event analysis prompt"""
+        # Limit to recent 10 events
+        events_text = _truncate_tokens(_prompt_json(events[:10]), EVENTS_TOKENS, self.log_scan_model)
+        context_text = f"CONTEXT: {context}" if context else ""
+        
+        prompt = f"""
+        Please analyze the Kubernetes events below.
+        
+        Please provide:
+        1. Summary of significant events
+        2. Any warning or error events that need attention
+        3. Potential issues or patterns
+        4. Recommended actions
+        
+        {context_text}
+        EVENTS:
+        {events_text}
+        """
+        
+        return prompt
+    
+    def _create_troubleshooting_prompt(self, issue_description: str) -> str:
+        """Create the troubleshooting prompt"""
+        prompt = f"""
+        Please provide detailed troubleshooting steps for the Kubernetes issue below, including:
+        1. Initial diagnostic commands to run
+        2. Common causes and how to check for them
+        3. Step-by-step resolution process
+        4. Prevention strategies
+        5. Relevant kubectl commands with examples
+        
+        ISSUE:
+        {issue_description}
+        """
+        
+        return prompt
+
+
+class AsyncGPTAnalyzer(GPTAnalyzer):
+    """
+    GPTAnalyzer whose analyses are coroutines
+    
+    Several analyses of the same pod can be awaited together with
+    analyze_pod, so they take one round trip instead of one each.
+    """
+    
+    def __init__(self, config):
+        """Initialize the analyzer with an async OpenAI client"""
+        super().__init__(config)
+        
+        if self.api_key:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+            
+            # Async connections belong to the event loop that opened them, so
+            # this client is per analyzer; only the TLS context is shared
+            self.aclient = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(verify=_shared_ssl_context(), limits=_http_limits())
+            )
+        else:
+            self.aclient = None
+    
+    async def analyze_pod(self, pod_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Analyze a pod's state, logs and events concurrently
+        
+        Returns:
+            Analyses under 'pod', 'logs' and 'events'
+        """
+        pod_name = _pod_info(pod_data).name
+        pod_analysis, log_analysis, event_analysis = await asyncio.gather(
+            self.analyze_pod_issues(pod_data),
+            self.analyze_logs(pod_data.get('logs', ''), pod_name),
+            self.analyze_events(pod_data.get('events', []), f"pod {pod_name}")
+        )
+        return {'pod': pod_analysis, 'logs': log_analysis, 'events': event_analysis}
+    
+    async def analyze_pod_issues(self, pod_data: Dict[str, Any]) -> str:
+        """Analyze pod issues using GPT and provide recommendations"""
+        if not self.aclient:
+            return "AI analysis is not available. Please configure OpenAI API key."
+        
+        try:
+            return await self._acomplete(SYSTEM_PROMPT, self._create_analysis_prompt(pod_data),
+                                         self.root_cause_model)
+        except Exception as e:
+            logger.error(f"Error during AI analysis: {e}")
+            return f"AI analysis failed: {e}"
+    
+    async def analyze_logs(self, logs: str, pod_name: str) -> str:
+        """Analyze pod logs specifically"""
+        if not self.aclient:
+            return "AI log analysis is not available. Please configure OpenAI API key."
+        
+        try:
+            return await self._acomplete(LOG_SYSTEM_PROMPT, self._create_log_prompt(logs, pod_name),
+                                         self.log_scan_model)
+        except Exception as e:
+            logger.error(f"Error during log analysis: {e}")
+            return f"Log analysis failed: {e}"
+    
+    async def analyze_events(self, events: list, context: str = "") -> str:
+        """Analyze Kubernetes events"""
+        if not self.aclient:
+            return "AI event analysis is not available. Please configure OpenAI API key."
+        
+        try:
+            return await self._acomplete(EVENTS_SYSTEM_PROMPT, self._create_events_prompt(events, context),
+                                         self.log_scan_model)
+        except Exception as e:
+            logger.error(f"Error during event analysis: {e}")
+            return f"Event analysis failed: {e}"
+    
+    async def get_troubleshooting_steps(self, issue_description: str) -> str:
+        """Get troubleshooting steps for a specific issue"""
+        if not self.aclient:
+            return "AI troubleshooting is not available. Please configure OpenAI API key."
+        
+        try:
+            return await self._acomplete(TROUBLESHOOTING_SYSTEM_PROMPT,
+                                         self._create_troubleshooting_prompt(issue_description),
+                                         self.troubleshooting_model)
+        except Exception as e:
+            logger.error(f"Error getting troubleshooting steps: {e}")
+            return f"Troubleshooting analysis failed: {e}"
+    
+    async def analyze_logs_mapreduce(self, logs: str, pod_name: str) -> str:
+        """
+        Analyze a full log instead of only its first LOG_ANALYSIS_TOKENS
+        
+        The log is split into LOG_CHUNK_TOKENS pieces whose errors are
+        summarized concurrently, then the summaries are analyzed together.
+        Short logs take the single-call analyze_logs path.
+        """
+        if not self.aclient:
+            return "AI log analysis is not available. Please configure OpenAI API key."
+        
+        chunks = _split_tokens(logs, LOG_CHUNK_TOKENS, self.log_scan_model)
+        if len(chunks) <= 1:
+            return await self.analyze_logs(logs, pod_name)
+        if len(chunks) > MAX_LOG_CHUNKS:
+            logger.info(f"Analyzing the last {MAX_LOG_CHUNKS} of {len(chunks)} log chunks for {pod_name}")
+            chunks = chunks[-MAX_LOG_CHUNKS:]
+        
+        try:
+            summaries = await asyncio.gather(*(
+                self._acomplete(LOG_SYSTEM_PROMPT, self._create_log_chunk_prompt(chunk, pod_name, i, len(chunks)),
+                                self.log_scan_model)
+                for i, chunk in enumerate(chunks, 1)
+            ))
+            return await self._acomplete(LOG_SYSTEM_PROMPT, self._create_log_reduce_prompt(summaries, pod_name),
+                                         self.root_cause_model)
+        except Exception as e:
+            logger.error(f"Error during log analysis: {e}")
+            return f"Log analysis failed: {e}"
+    
+    def _create_log_chunk_prompt(self, chunk: str, pod_name: str, index: int, total: int) -> str:
+        """Create the prompt summarizing one log chunk (map step)"""
+        prompt = f"""
+        Summarize the errors and warnings in this part of a Kubernetes pod's logs.
+        List each distinct problem once with a representative log line and how often it occurs.
+        If there are none, answer "No errors".
+        
+        POD: {pod_name}
+        PART: {index} of {total}
+        
+        LOGS:
+        {chunk}
         """
+        
+        return prompt
     
-    def _get_troubleshooting_system_prompt(self) -> str:
-        """Get system prompt for troubleshooting guidance"""
-        return """
-        You are a senior Kubernetes administrator and troubleshooting expert. Your role is to provide:
-        - Step-by-step troubleshooting procedures
-        - Relevant kubectl commands with proper syntax
-        - Common pitfalls and how to avoid them
-        - Best practices for resolution
-        - Clear explanations of what each step accomplishes
-        
-        Structure your responses with:
-        1. Immediate diagnostic steps
-        2. Progressive troubleshooting approach
-        3. Specific commands to run
-        4. Expected outputs and what they mean
-        5. Resolution steps
-        6. Verification procedures
-        
-        Always prioritize safe operations and include warnings for potentially disruptive commands.
+    def _create_log_reduce_prompt(self, summaries: List[str], pod_name: str) -> str:
+        """Create the prompt analyzing all chunk summaries (reduce step)"""
+        summaries_text = "\n\n".join(f"PART {i}:\n{summary}" for i, summary in enumerate(summaries, 1))
+        
+        prompt = f"""
+        Below are error summaries of consecutive parts of a Kubernetes pod's logs, oldest first.
+        Analyze them together and identify the issues affecting the pod.
+        
+        Please provide:
+        1. Summary of any errors or warnings found
+        2. Potential root causes
+        3. Recommended solutions
+        4. Any patterns or recurring issues
+        
+        POD: {pod_name}
+        
+        SUMMARIES:
+        {summaries_text}
         """
+        
+        return prompt
+    
+    async def aclose(self):
+        """Close the async HTTP client"""
+        if self.aclient:
+            await self.aclient.close()
+    
+    async def _achat(self, request: Dict[str, Any]):
+        """Async _chat: same retries and circuit breaker"""
+        retryable, api_error = _openai_errors()
+        _circuit_breaker.check()
+        completions = self.aclient.with_options(max_retries=0).chat.completions
+        for attempt in range(OPENAI_RETRY_ATTEMPTS):
+            try:
+                response = await completions.create(**request)
+            except retryable as e:
+                if attempt == OPENAI_RETRY_ATTEMPTS - 1:
+                    _circuit_breaker.record(False)
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"OpenAI request failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            except api_error:
+                _circuit_breaker.record(False)
+                raise
+            _circuit_breaker.record(True)
+            return response
+    
+    async def _acomplete(self, system: str, user: str, model: str) -> str:
+        """Async _complete, sharing the same response cache"""
+        key = self._cache_key(system, user, model)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._achat(self._request_body(system, user, model))
+        content = response.choices[0].message.content
+        _store_response(key, content)
+        return content
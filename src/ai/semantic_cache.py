@@ -0,0 +1,128 @@
+"""
+Semantic response cache for KubeGPT
+
+Reuses an AI answer when a new prompt's embedding is nearly identical to a
+cached one, e.g. the same log excerpt with only timestamps changed. Entries
+are kept in memory and saved to a .npz file with numpy.
+"""
+
+import os
+import time
+import threading
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Answers keyed by L2-normalized embeddings, matched by cosine similarity within a scope"""
+
+    def __init__(self, path: str, threshold: float = 0.95, max_entries: int = 500,
+                 ttl: float = 6 * 3600, save_every: int = 20):
+        """
+        Open the cache, loading any unexpired entries saved at path
+
+        Args:
+            path: .npz file the cache is persisted to; ~ is expanded
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Entries kept; the oldest are evicted first
+            ttl: Seconds an entry is reused
+            save_every: Entries added between saves; call save() for the rest
+        """
+        self.path = os.path.expanduser(path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._scopes = np.empty(0, dtype=str)
+        self._expires = np.empty(0, dtype=np.float64)
+        self._answers: List[str] = []
+        self._unsaved = 0
+
+        if os.path.exists(self.path):
+            try:
+                with np.load(self.path) as data:
+                    vectors, scopes, expires = data['vectors'], data['scopes'], data['expires']
+                    answers = data['answers'].tolist()
+                self._vectors, self._scopes, self._expires, self._answers = vectors, scopes, expires, answers
+                self._drop_expired()
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable semantic cache {self.path}: {e}")
+
+    def get(self, embedding: List[float], scope: str) -> Optional[str]:
+        """
+        Answer whose embedding is most similar to this one, if above the threshold
+
+        Args:
+            embedding: Embedding of the prompt
+            scope: Only entries added with the same scope (pod, model settings) can match
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if not self._answers or self._vectors.shape[1] != vector.shape[0]:
+                return None
+            similarities = np.where((self._scopes == scope) & (self._expires > time.time()),
+                                    self._vectors @ vector, -1.0)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+                return self._answers[best]
+        return None
+
+    def add(self, embedding: List[float], scope: str, answer: str):
+        """Store an answer, saving the cache every save_every additions"""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if not self._answers or self._vectors.shape[1] != vector.shape[0]:
+                # First entry, or the embedding model changed
+                self._vectors = vector[np.newaxis, :]
+                self._scopes = np.array([scope])
+                self._expires = np.array([time.time() + self.ttl])
+                self._answers = [answer]
+            else:
+                self._vectors = np.vstack([self._vectors, vector])[-self.max_entries:]
+                self._scopes = np.append(self._scopes, scope)[-self.max_entries:]
+                self._expires = np.append(self._expires, time.time() + self.ttl)[-self.max_entries:]
+                self._answers = (self._answers + [answer])[-self.max_entries:]
+
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self._save()
+
+    def save(self):
+        """Write entries added since the last save to disk"""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def _save(self):
+        """Write the unexpired entries to disk (lock held)"""
+        self._drop_expired()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # np.savez appends .npz unless the name already ends with it
+            np.savez(self.path, vectors=self._vectors, scopes=self._scopes, expires=self._expires,
+                     answers=np.array(self._answers))
+            self._unsaved = 0
+        except OSError as e:
+            logger.warning(f"Could not save semantic cache {self.path}: {e}")
+
+    def _drop_expired(self):
+        """Forget entries past their expiry"""
+        live = self._expires > time.time()
+        if not live.all():
+            self._vectors = self._vectors[live]
+            self._scopes = self._scopes[live]
+            self._expires = self._expires[live]
+            self._answers = [answer for answer, keep in zip(self._answers, live) if keep]
+
+    def _normalize(self, embedding: List[float]) -> np.ndarray:
+        """Embedding as a unit-length float32 vector"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
@@ -3,26 +3,63 @@ CLI Commands for KubeGPT
 """
 
 import click
-import json
-import yaml
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
+from rich.markup import escape
 
-from kubernetes.kubernetes_client import KubernetesClient
-from ai.gpt_analyzer import GPTAnalyzer
 from utils.config import Config
+from utils.console import console
 from utils.logger import setup_logger
 
-console = Console()
+try:
+    import orjson
+    
+    def _dumps_json(data, compact: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option, default=str).decode()
+except ImportError:
+    import json
+    
+    def _dumps_json(data, compact: bool = False) -> str:
+        if compact:
+            return json.dumps(data, separators=(',', ':'), default=str)
+        return json.dumps(data, indent=2, default=str)
+
+# The Kubernetes client, the AI analyzer and the YAML dumper are imported
+# where they are used, so --help and commands that skip them start faster
+
 logger = setup_logger()
 
+# Log level markers, matched case-insensitively anywhere in a line
+_LEVEL_RE = re.compile(r'ERROR|FATAL|WARN|INFO', re.IGNORECASE)
+
+# Line colour per level, in priority order when a line mentions several
+_LEVEL_COLOR = {'ERROR': 'red', 'FATAL': 'red', 'WARN': 'yellow', 'INFO': 'blue'}
+
+# Formatted log lines sent to the console per print call
+_LOG_PRINT_BATCH = 50
+
+# Namespace-wide AI analysis: pods whose data is fetched at once, and the
+# default wait for the OpenAI batch before falling back to one request per pod
+_AI_FETCH_WORKERS = 4
+_AI_BATCH_TIMEOUT = 600
+
+# Prebuilt styled cells for common values, so tables skip markup parsing per row
+_POD_STATUS_TEXT = {'Running': Text('Running', style='green')}
+_EVENT_TYPE_TEXT = {
+    'Normal': Text('Normal', style='green'),
+    'Warning': Text('Warning', style='red')
+}
+
 @click.group()
 @click.option('--config', '-c', default='config.yaml', help='Configuration file path')
 @click.option('--namespace', '-n', default=None, help='Kubernetes namespace')
-@click.option('--output', '-o', type=click.Choice(['table', 'json', 'yaml']), default='table', help='Output format')
+@click.option('--output', '-o', type=click.Choice(['table', 'json', 'yaml']), default='table', help='Output format (prefer json when piping to other tools)')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.pass_context
 def cli(ctx, config, namespace, output, verbose):
@@ -43,6 +80,7 @@ def cli(ctx, config, namespace, output, verbose):
     
     # Initialize Kubernetes client
     try:
+        from kubernetes.kubernetes_client import KubernetesClient
         ctx.obj['k8s_client'] = KubernetesClient(ctx.obj['config'])
     except Exception as e:
         console.print(f"[red]Error connecting to Kubernetes: {e}[/red]")
@@ -53,8 +91,10 @@ def cli(ctx, config, namespace, output, verbose):
 @click.option('--pod-name', '-p', help='Pod name to analyze')
 @click.option('--container', help='Specific container name in the pod')
 @click.option('--use-ai', is_flag=True, help='Use AI for intelligent analysis')
+@click.option('--batch-timeout', type=float, default=_AI_BATCH_TIMEOUT, show_default=True,
+              help='Seconds to wait for the namespace AI batch before analyzing the remaining pods one by one')
 @click.pass_context
-def analyze(ctx, pod_name, container, use_ai):
+def analyze(ctx, pod_name, container, use_ai, batch_timeout):
     """Analyze pod health and diagnose issues"""
     k8s_client = ctx.obj['k8s_client']
     namespace = ctx.obj['namespace']
@@ -62,31 +102,62 @@ def analyze(ctx, pod_name, container, use_ai):
     
     try:
         if pod_name:
-            # Analyze specific pod
-            pod_info = k8s_client.get_pod_info(pod_name, namespace)
-            pod_logs = k8s_client.get_pod_logs(pod_name, namespace, container)
-            pod_events = k8s_client.get_pod_events(pod_name, namespace)
+            if use_ai:
+                # Created first so its API connection warms up while the pod is fetched
+                from ai.gpt_analyzer import GPTAnalyzer
+                gpt_analyzer = GPTAnalyzer(ctx.obj['config'])
             
-            analysis_data = {
-                'pod_info': pod_info,
-                'logs': pod_logs,
-                'events': pod_events
-            }
+            # Analyze specific pod
+            analysis_data = _pod_analysis_data(k8s_client, pod_name, namespace, container)
             
             if use_ai:
-                gpt_analyzer = GPTAnalyzer(ctx.obj['config'])
+                if output_format == 'table':
+                    # Show the pod right away and the analysis as it is written
+                    _display_analysis(analysis_data, output_format, pod_name)
+                    console.print("\n")
+                    _display_streamed_analysis(gpt_analyzer.analyze_pod_issues_stream(analysis_data))
+                    if gpt_analyzer.client and gpt_analyzer.logs_exceed_prompt(analysis_data['logs']):
+                        console.print("\n")
+                        with console.status("Analyzing the full logs with AI..."):
+                            log_analysis = _analyze_full_logs(ctx.obj['config'], analysis_data['logs'], pod_name)
+                        console.print(Panel(log_analysis, title="[bold blue]AI Log Analysis[/bold blue]"))
+                    return
+                
                 ai_analysis = gpt_analyzer.analyze_pod_issues(analysis_data)
                 analysis_data['ai_analysis'] = ai_analysis
+                if gpt_analyzer.client and gpt_analyzer.logs_exceed_prompt(analysis_data['logs']):
+                    analysis_data['ai_log_analysis'] = _analyze_full_logs(ctx.obj['config'], analysis_data['logs'], pod_name)
             
             _display_analysis(analysis_data, output_format, pod_name)
         else:
             # Analyze all pods in namespace
             pods = k8s_client.list_pods(namespace)
             
+            if not use_ai:
+                if output_format == 'table':
+                    _display_pods_table(pods)
+                else:
+                    _display_output(pods, output_format)
+                return
+            
+            # Unhealthy pods are analyzed together through the Batch API, at
+            # half the cost of one request each
+            from ai.gpt_analyzer import GPTAnalyzer
+            gpt_analyzer = GPTAnalyzer(ctx.obj['config'])
+            unhealthy = [pod for pod in pods if _needs_analysis(pod)]
+            with ThreadPoolExecutor(max_workers=_AI_FETCH_WORKERS) as executor:
+                pod_datas = list(executor.map(
+                    lambda pod: _pod_analysis_data(k8s_client, pod['name'], namespace), unhealthy
+                ))
+            analyses = dict(gpt_analyzer.analyze_pod_issues_batch(pod_datas, timeout=batch_timeout))
+            
             if output_format == 'table':
                 _display_pods_table(pods)
+                for custom_id, analysis in analyses.items():
+                    console.print("\n")
+                    console.print(Panel(analysis, title=f"[bold blue]AI Analysis: {escape(custom_id)}[/bold blue]"))
             else:
-                _display_output(pods, output_format)
+                _display_output({'pods': pods, 'ai_analysis': analyses}, output_format)
                 
     except Exception as e:
         console.print(f"[red]Error during analysis: {e}[/red]")
@@ -109,13 +180,12 @@ def logs(ctx, pod_name, container, follow, tail):
         if follow:
             console.print(f"[green]Following logs for pod {pod_name}...[/green]")
             k8s_client.follow_pod_logs(pod_name, namespace, container)
+        elif output_format == 'table':
+            # Print lines as they stream in rather than waiting for the whole log
+            _display_logs_formatted(k8s_client.iter_pod_logs(pod_name, namespace, container, tail=tail), pod_name)
         else:
             logs_data = k8s_client.get_pod_logs(pod_name, namespace, container, tail=tail)
-            
-            if output_format == 'table':
-                _display_logs_formatted(logs_data, pod_name)
-            else:
-                _display_output(logs_data, output_format)
+            _display_output(logs_data, output_format)
                 
     except Exception as e:
         console.print(f"[red]Error getting logs: {e}[/red]")
@@ -168,6 +238,48 @@ def health_check(ctx):
         logger.error(f"Health check error: {e}")
 
 
+def _pod_analysis_data(k8s_client, pod_name, namespace, container=None):
+    """Pod info, logs and events of a pod; the three API calls are independent,
+    so they run concurrently and the wait is the slowest of them"""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pod_info = executor.submit(k8s_client.get_pod_info, pod_name, namespace)
+        pod_logs = executor.submit(k8s_client.get_pod_logs, pod_name, namespace, container)
+        pod_events = executor.submit(k8s_client.get_pod_events, pod_name, namespace)
+        
+        return {
+            'pod_info': pod_info.result(),
+            'logs': pod_logs.result(),
+            'events': pod_events.result()
+        }
+
+
+def _analyze_full_logs(config, logs, pod_name):
+    """AI analysis of logs too long for the pod analysis prompt: chunks are
+    summarized concurrently, then the summaries are analyzed together"""
+    import asyncio
+    from ai.gpt_analyzer import AsyncGPTAnalyzer
+    
+    analyzer = AsyncGPTAnalyzer(config)
+    
+    async def analyze():
+        try:
+            return await analyzer.analyze_logs_mapreduce(logs, pod_name)
+        finally:
+            # The async client's connections belong to this event loop
+            await analyzer.aclose()
+    
+    return asyncio.run(analyze())
+
+
+def _needs_analysis(pod):
+    """Whether a pod from list_pods is worth an AI analysis: not finished
+    and either not running, not fully ready, or restarting"""
+    if pod['status'] == 'Succeeded':
+        return False
+    ready, _, total = str(pod['ready']).partition('/')
+    return pod['status'] != 'Running' or ready != total or pod['restarts'] > 0
+
+
 def _display_analysis(data, output_format, pod_name):
     """Display pod analysis results"""
     if output_format == 'table':
@@ -195,10 +307,21 @@ def _display_analysis(data, output_format, pod_name):
         _display_output(data, output_format)
 
 
+def _display_streamed_analysis(chunks, title: str = "[bold blue]AI Analysis[/bold blue]"):
+    """Render text fragments in a panel that grows as they arrive"""
+    from rich.live import Live
+    
+    text = ""
+    with Live(Panel(text, title=title), console=console, refresh_per_second=8) as live:
+        for chunk in chunks:
+            text += chunk
+            live.update(Panel(text, title=title))
+
+
 def _display_pods_table(pods):
     """Display pods in table format"""
     table = Table(title="Pods Overview")
-    table.add_column("Name", style="cyan")
+    table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Status", style="white")
     table.add_column("Ready", style="green")
     table.add_column("Restarts", style="yellow")
@@ -206,10 +329,10 @@ def _display_pods_table(pods):
     table.add_column("Node", style="blue")
     
     for pod in pods:
-        status_color = "green" if pod['status'] == "Running" else "red"
+        status = _POD_STATUS_TEXT.get(pod['status']) or Text(str(pod['status']), style='red')
         table.add_row(
             pod['name'],
-            f"[{status_color}]{pod['status']}[/{status_color}]",
+            status,
             pod['ready'],
             str(pod['restarts']),
             pod['age'],
@@ -219,21 +342,32 @@ def _display_pods_table(pods):
     console.print(table)
 
 
-def _display_logs_formatted(logs, pod_name):
-    """Display logs in formatted way"""
+def _display_logs_formatted(lines, pod_name):
+    """Display log lines in formatted way, printing each as it is produced"""
     console.print(Panel(f"[bold green]Logs for Pod: {pod_name}[/bold green]"))
     
-    for line in logs.split('\n'):
+    batch = []
+    for line in lines:
         if line.strip():
             # Color code log levels
-            if 'ERROR' in line.upper() or 'FATAL' in line.upper():
-                console.print(f"[red]{line}[/red]")
-            elif 'WARN' in line.upper():
-                console.print(f"[yellow]{line}[/yellow]")
-            elif 'INFO' in line.upper():
-                console.print(f"[blue]{line}[/blue]")
-            else:
-                console.print(line)
+            color = _log_level_color(line)
+            batch.append(f"[{color}]{escape(line)}[/{color}]" if color else escape(line))
+            
+            if len(batch) >= _LOG_PRINT_BATCH:
+                console.print("\n".join(batch))
+                batch = []
+    
+    if batch:
+        console.print("\n".join(batch))
+
+
+def _log_level_color(line):
+    """Colour for the most severe log level mentioned in a line, or None"""
+    levels = {match.upper() for match in _LEVEL_RE.findall(line)}
+    for level, color in _LEVEL_COLOR.items():
+        if level in levels:
+            return color
+    return None
 
 
 def _display_events_table(events):
@@ -245,13 +379,16 @@ def _display_events_table(events):
     table.add_column("Message", style="white")
     table.add_column("Age", style="blue")
     
-    for event in events:
-        type_color = "red" if event['type'] == "Warning" else "green"
+    # Truncate the whole message column up front
+    messages = [message if len(message) <= 50 else message[:50] + "..." for message in (event['message'] for event in events)]
+    
+    for event, message in zip(events, messages):
+        event_type = _EVENT_TYPE_TEXT.get(event['type']) or Text(str(event['type']), style='green')
         table.add_row(
-            f"[{type_color}]{event['type']}[/{type_color}]",
+            event_type,
             event['reason'],
             event['object'],
-            event['message'][:50] + "..." if len(event['message']) > 50 else event['message'],
+            message,
             event['age']
         )
     
@@ -291,8 +428,17 @@ def _display_health_table(health_data):
 def _display_output(data, output_format):
     """Display data in specified format"""
     if output_format == 'json':
-        console.print(json.dumps(data, indent=2, default=str))
+        if sys.stdout.isatty():
+            console.print(_dumps_json(data))
+        else:
+            # Piped to another program: compact JSON, written as-is
+            click.echo(_dumps_json(data, compact=True))
     elif output_format == 'yaml':
-        console.print(yaml.dump(data, default_flow_style=False))
+        import yaml
+        try:
+            from yaml import CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeDumper as Dumper
+        console.print(yaml.dump(data, Dumper=Dumper, default_flow_style=False))
     else:
         console.print(str(data))
@@ -0,0 +1,214 @@
+"""
+Cluster state cache for KubeGPT
+
+Keeps pods and events in memory using list+watch streams, so queries are
+answered from local dictionaries instead of a REST list per call. A periodic
+re-list recovers from any watch events that were missed; it is merged by
+resourceVersion, so a snapshot older than events already applied does not
+bring back deleted objects or older states.
+"""
+
+import threading
+import time
+from typing import List, Dict, Optional, Any, Callable, Tuple
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ClusterStateCache:
+    """Watch-backed cache of pods and events across all namespaces"""
+
+    def __init__(self, v1, resync_period: int = 60, watch_timeout: int = 300):
+        """Initialize the cache (call start() to populate it)"""
+        self.v1 = v1
+        self.resync_period = resync_period
+        self.watch_timeout = watch_timeout
+
+        self._pods: Dict[Tuple[str, str], Any] = {}
+        self._events: Dict[Tuple[str, str], Any] = {}
+        self._events_by_pod: Dict[Tuple[str, str], Dict[Tuple[str, str], Any]] = {}
+        # resourceVersion at which watched objects were deleted
+        self._deleted_pods: Dict[Tuple[str, str], int] = {}
+        self._deleted_events: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """List pods and events, then keep them fresh from background threads"""
+        resources = [
+            (self.v1.list_pod_for_all_namespaces, self._replace_pods, self._apply_pod_event),
+            (self.v1.list_event_for_all_namespaces, self._replace_events, self._apply_event_event)
+        ]
+
+        for list_func, replace, apply in resources:
+            resource_version = self._relist(list_func, replace)
+            self._spawn(self._watch_loop, list_func, replace, apply, resource_version)
+
+        self._spawn(self._resync_loop, resources)
+
+    def stop(self):
+        """Stop the background threads"""
+        self._stop.set()
+
+    def get_pod(self, namespace: str, name: str) -> Optional[Any]:
+        """Get a cached pod"""
+        with self._lock:
+            return self._pods.get((namespace, name))
+
+    def list_pods(self, namespace: str) -> List[Any]:
+        """List cached pods in a namespace"""
+        with self._lock:
+            return [pod for (ns, _), pod in self._pods.items() if ns == namespace]
+
+    def list_events(self, namespace: str) -> List[Any]:
+        """List cached events in a namespace"""
+        with self._lock:
+            return [event for (ns, _), event in self._events.items() if ns == namespace]
+
+    def get_pod_events(self, namespace: str, pod_name: str) -> List[Any]:
+        """List cached events whose involved object is the given pod"""
+        with self._lock:
+            return list(self._events_by_pod.get((namespace, pod_name), {}).values())
+
+    def _spawn(self, target: Callable, *args):
+        """Run target on a daemon thread"""
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _relist(self, list_func: Callable, replace: Callable) -> str:
+        """Replace a store with a fresh list and return its resourceVersion"""
+        result = list_func()
+        replace(result.items, result.metadata.resource_version)
+        return result.metadata.resource_version
+
+    def _watch_loop(self, list_func: Callable, replace: Callable, apply: Callable, resource_version: Optional[str]):
+        """Apply watch events until stopped, re-listing when the watch expires"""
+        while not self._stop.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist(list_func, replace)
+
+                w = watch.Watch()
+                for event in w.stream(list_func, resource_version=resource_version,
+                                      timeout_seconds=self.watch_timeout):
+                    if self._stop.is_set():
+                        return
+                    obj = event['object']
+                    apply(event['type'], obj)
+                    resource_version = obj.metadata.resource_version
+            except ApiException as e:
+                if e.status == 410:
+                    # resourceVersion too old - start over from a fresh list
+                    resource_version = None
+                else:
+                    logger.warning(f"Watch failed, retrying: {e}")
+                    time.sleep(1)
+            except Exception as e:
+                logger.warning(f"Watch failed, retrying: {e}")
+                time.sleep(1)
+
+    def _resync_loop(self, resources: List[Tuple[Callable, Callable, Callable]]):
+        """Periodically re-list everything to recover from missed watch events"""
+        while not self._stop.wait(self.resync_period):
+            for list_func, replace, _ in resources:
+                try:
+                    self._relist(list_func, replace)
+                except Exception as e:
+                    logger.warning(f"Cache resync failed: {e}")
+
+    def _merge(self, current: Dict[Tuple[str, str], Any], deleted: Dict[Tuple[str, str], int],
+               items: List[Any], list_version: Optional[str]) -> Dict[Tuple[str, str], Any]:
+        """
+        Combine a list snapshot with what the watch has applied since (lock held)
+
+        Cached objects newer than their listed version are kept, as are objects
+        created after the snapshot; listed objects already deleted are dropped.
+        """
+        snapshot = self._version(list_version)
+        merged = {}
+        for item in items:
+            key = self._key(item)
+            version = self._version(item.metadata.resource_version)
+            cached = current.get(key)
+            if cached is not None and self._version(cached.metadata.resource_version) > version:
+                merged[key] = cached
+            elif deleted.get(key, -1) < version:
+                merged[key] = item
+
+        for key, cached in current.items():
+            if key not in merged and self._version(cached.metadata.resource_version) > snapshot:
+                merged[key] = cached
+
+        # Deletions the snapshot already reflects need no tombstone
+        for key in [key for key, version in deleted.items() if version <= snapshot]:
+            del deleted[key]
+        return merged
+
+    def _replace_pods(self, pods: List[Any], list_version: Optional[str] = None):
+        """Replace cached pods with a list snapshot"""
+        with self._lock:
+            self._pods = self._merge(self._pods, self._deleted_pods, pods, list_version)
+
+    def _apply_pod_event(self, event_type: str, pod):
+        """Apply a pod watch event"""
+        key = self._key(pod)
+        with self._lock:
+            if event_type == 'DELETED':
+                self._pods.pop(key, None)
+                self._deleted_pods[key] = self._version(pod.metadata.resource_version)
+            else:
+                self._pods[key] = pod
+
+    def _replace_events(self, events: List[Any], list_version: Optional[str] = None):
+        """Replace cached events with a list snapshot and rebuild the per-pod index"""
+        with self._lock:
+            items = self._merge(self._events, self._deleted_events, events, list_version)
+            by_pod = {}
+            for key, event in items.items():
+                pod_key = self._pod_key(event)
+                if pod_key:
+                    by_pod.setdefault(pod_key, {})[key] = event
+
+            self._events = items
+            self._events_by_pod = by_pod
+
+    def _apply_event_event(self, event_type: str, event):
+        """Apply an event watch event"""
+        key = self._key(event)
+        pod_key = self._pod_key(event)
+
+        with self._lock:
+            if event_type == 'DELETED':
+                self._events.pop(key, None)
+                self._deleted_events[key] = self._version(event.metadata.resource_version)
+                if pod_key in self._events_by_pod:
+                    self._events_by_pod[pod_key].pop(key, None)
+                    if not self._events_by_pod[pod_key]:
+                        del self._events_by_pod[pod_key]
+            else:
+                self._events[key] = event
+                if pod_key:
+                    self._events_by_pod.setdefault(pod_key, {})[key] = event
+
+    def _version(self, resource_version: Optional[str]) -> int:
+        """resourceVersion as a number for ordering (etcd revisions are integers)"""
+        try:
+            return int(resource_version)
+        except (TypeError, ValueError):
+            return 0
+
+    def _key(self, obj) -> Tuple[str, str]:
+        """Cache key for an API object"""
+        return (obj.metadata.namespace, obj.metadata.name)
+
+    def _pod_key(self, event) -> Optional[Tuple[str, str]]:
+        """Key of the pod an event refers to, or None if it is not about a pod"""
+        involved = event.involved_object
+        if not involved or involved.kind != 'Pod':
+            return None
+        return (involved.namespace or event.metadata.namespace, involved.name)
@@ -9,51 +9,220 @@ Handles all Kubernetes API interactions including:
 """
 
 import os
+import sys
+import copy
+import functools
+import heapq
+import operator
+import threading
 import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
-from kubernetes import client, config, watch
+from decimal import Decimal
+from typing import List, Dict, Optional, Any, Iterator
+from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+from urllib3.exceptions import ProtocolError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Suffixes of Kubernetes resource quantities, largest first
+_BINARY_SUFFIXES = (('Ei', 2 ** 60), ('Pi', 2 ** 50), ('Ti', 2 ** 40), ('Gi', 2 ** 30), ('Mi', 2 ** 20), ('Ki', 2 ** 10))
+_DECIMAL_SUFFIXES = (('E', 10 ** 18), ('P', 10 ** 15), ('T', 10 ** 12), ('G', 10 ** 9), ('M', 10 ** 6), ('k', 10 ** 3))
+
+try:
+    from kubernetes.utils import parse_quantity
+except ImportError:
+    _FRACTION_SUFFIXES = {'m': Decimal('0.001'), 'u': Decimal('0.000001'), 'n': Decimal('0.000000001')}
+    
+    def parse_quantity(quantity) -> Decimal:
+        """Parse a Kubernetes resource quantity such as '250m' or '1Gi'"""
+        quantity = str(quantity)
+        for suffix, factor in _BINARY_SUFFIXES + _DECIMAL_SUFFIXES:
+            if quantity.endswith(suffix):
+                return Decimal(quantity[:-len(suffix)]) * factor
+        if quantity[-1:] in _FRACTION_SUFFIXES:
+            return Decimal(quantity[:-1]) * _FRACTION_SUFFIXES[quantity[-1]]
+        return Decimal(quantity)
+
+# Marker for the in-cluster service account configuration
+_IN_CLUSTER = "in-cluster"
+
+# Seconds get_pod_info and list_pods results are reused, and how many are kept
+RESPONSE_CACHE_TTL = 5
+RESPONSE_CACHE_MAXSIZE = 256
+
+# Pod phases reported as failed by the health check
+FAILED_PHASES = ('Failed', 'CrashLoopBackOff')
+
+# Reads the phase from a pod summary
+_PHASE = operator.itemgetter('phase')
+
+# HTTP connections kept open to the API server
+CONNECTION_POOL_MAXSIZE = 16
+
+# Event attributes read in one call; each is a property on the API model
+_EVENT_FIELDS = operator.attrgetter(
+    'type', 'reason', 'message', 'first_timestamp', 'last_timestamp', 'count', 'source', 'involved_object'
+)
+
+# Sub-day age units, largest first
+_AGE_UNITS = ((3600, "h"), (60, "m"))
+
+# Bytes read from a log stream at a time
+LOG_CHUNK_SIZE = 4096
+
+# Reconnects to an interrupted log stream without new output, and the backoff between them in seconds
+LOG_RECONNECT_ATTEMPTS = 5
+LOG_RECONNECT_MIN_WAIT = 1
+LOG_RECONNECT_MAX_WAIT = 30
+
+# Items requested per page when listing pods and events
+LIST_PAGE_SIZE = 500
+
+# Most recent events shown for a namespace
+NAMESPACE_EVENTS_LIMIT = 50
+
+# Upper bounds for fetching the events of a single pod
+POD_EVENTS_LIMIT = 200
+POD_EVENTS_TIMEOUT = 5
+
+
+def _event_sort_key(event: Dict[str, Any]) -> str:
+    """Recency key for an event dict; events without timestamps sort last"""
+    return event['last_timestamp'] or event['first_timestamp'] or ''
+
+
+def _log_timestamp_key(line: bytes) -> bytes:
+    """
+    Sortable form of the RFC3339 timestamp a raw log line starts with
+    
+    Fractional seconds are padded to nanoseconds, since the API server trims
+    trailing zeros and would otherwise break byte comparison.
+    """
+    stamp = line.split(b' ', 1)[0].rstrip(b'Z')
+    seconds, _, fraction = stamp.partition(b'.')
+    return seconds + b'.' + fraction.ljust(9, b'0')
+
+
+def _ttl_cached(method):
+    """
+    Reuse a KubernetesClient method's result for RESPONSE_CACHE_TTL seconds
+    
+    Bypassed when the watch cache is enabled, which is always current.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache:
+            return method(self, *args, **kwargs)
+        
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached and cached[0] > now:
+                self._response_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+        
+        result = method(self, *args, **kwargs)
+        
+        with self._response_cache_lock:
+            self._response_cache[key] = (now + RESPONSE_CACHE_TTL, result)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+        
+        # Callers may modify what they get back, so never hand out the cached copy
+        return copy.deepcopy(result)
+    
+    return wrapper
+
+
+def _format_cpu(cores: Decimal) -> str:
+    """Format a CPU quantity as whole cores or millicores"""
+    if cores == cores.to_integral_value():
+        return str(int(cores))
+    return f"{int((cores * 1000).to_integral_value())}m"
+
+
+def _format_memory(size: Decimal) -> str:
+    """Format a memory quantity with the largest suffix that divides it exactly"""
+    size = int(size)
+    if size:
+        for suffix, factor in _BINARY_SUFFIXES + _DECIMAL_SUFFIXES:
+            if size % factor == 0:
+                return f"{size // factor}{suffix}"
+    return str(size)
+
 
 class KubernetesClient:
     """Client for interacting with Kubernetes API"""
     
+    # Where the process-wide default client configuration was loaded from
+    _kube_config_source: Optional[str] = None
+    
     def __init__(self, app_config):
         """Initialize Kubernetes client with configuration"""
         self.config = app_config
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
         self._load_kube_config()
         self._initialize_clients()
+        
+        # Optional watch-backed cache serving pod and event queries from memory
+        self.cache = None
+        if self.config.get('kubernetes.watch_cache', False):
+            from .cluster_cache import ClusterStateCache
+            self.cache = ClusterStateCache(self.v1)
+            try:
+                self.cache.start()
+            except ApiException as e:
+                # e.g. RBAC limited to one namespace cannot list cluster-wide
+                logger.warning(f"Watch cache unavailable, querying the API directly: {e}")
+                self.cache.stop()
+                self.cache = None
     
     def _load_kube_config(self):
         """Load Kubernetes configuration"""
+        config_path = os.path.expanduser(self.config.get('kubernetes.config_path', '~/.kube/config'))
+        
+        # load_*_config sets the process-wide default, so later clients reuse it
+        if KubernetesClient._kube_config_source in (_IN_CLUSTER, config_path):
+            logger.debug(f"Reusing Kubernetes configuration from {KubernetesClient._kube_config_source}")
+            return
+        
         try:
             # Try to load in-cluster config first (if running in a pod)
             config.load_incluster_config()
+            KubernetesClient._kube_config_source = _IN_CLUSTER
             logger.info("Loaded in-cluster Kubernetes configuration")
         except:
             try:
                 # Load from kubeconfig file
-                config_path = self.config.get('kubernetes.config_path', '~/.kube/config')
-                config_path = os.path.expanduser(config_path)
                 config.load_kube_config(config_file=config_path)
+                KubernetesClient._kube_config_source = config_path
                 logger.info(f"Loaded Kubernetes configuration from {config_path}")
             except Exception as e:
                 raise Exception(f"Failed to load Kubernetes configuration: {e}")
     
     def _initialize_clients(self):
         """Initialize Kubernetes API clients"""
-        self.v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.extensions_v1beta1 = client.ExtensionsV1beta1Api()
+        # One ApiClient, and so one keep-alive connection pool, shared by every
+        # API group; sized for concurrent fetches and watch streams
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        self.api_client = client.ApiClient(configuration=configuration)
+        
+        self.v1 = client.CoreV1Api(api_client=self.api_client)
+        self.apps_v1 = client.AppsV1Api(api_client=self.api_client)
+        self.extensions_v1beta1 = client.ExtensionsV1beta1Api(api_client=self.api_client)
     
+    @_ttl_cached
     def get_pod_info(self, pod_name: str, namespace: str) -> Dict[str, Any]:
         """Get detailed information about a specific pod"""
         try:
-            pod = self.v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+            pod = self._fetch_pod(pod_name, namespace)
             
             # Calculate age
             created_time = pod.metadata.creation_timestamp
@@ -117,6 +286,53 @@ class KubernetesClient:
             else:
                 raise Exception(f"Error getting pod logs: {e}")
     
+    def iter_pod_logs(self, pod_name: str, namespace: str, container: Optional[str] = None,
+                      tail: int = 100) -> Iterator[str]:
+        """Yield pod log lines as they arrive instead of buffering the whole log"""
+        kwargs = {
+            'name': pod_name,
+            'namespace': namespace,
+            'tail_lines': tail,
+            'timestamps': True,
+            '_preload_content': False
+        }
+        
+        if container:
+            kwargs['container'] = container
+        
+        try:
+            response = self.v1.read_namespaced_pod_log(**kwargs)
+        except ApiException as e:
+            if e.status == 404:
+                raise Exception(f"Pod '{pod_name}' not found in namespace '{namespace}'")
+            else:
+                raise Exception(f"Error getting pod logs: {e}")
+        
+        yield from self._iter_response_lines(response)
+    
+    def _iter_response_lines(self, response) -> Iterator[str]:
+        """Split a raw urllib3 response into decoded lines"""
+        for lines in self._iter_raw_line_batches(response):
+            for line in lines:
+                yield line.decode('utf-8', errors='replace')
+    
+    def _iter_raw_line_batches(self, response) -> Iterator[List[bytes]]:
+        """Yield the complete raw lines of each chunk read from a urllib3 response"""
+        pending = b''
+        try:
+            for chunk in response.stream(LOG_CHUNK_SIZE, decode_content=True):
+                # A newline byte never occurs inside a UTF-8 sequence, so
+                # splitting before decoding is safe
+                lines = (pending + chunk).split(b'\n')
+                pending = lines.pop()
+                if lines:
+                    yield lines
+            
+            if pending:
+                yield [pending]
+        finally:
+            response.release_conn()
+    
     def follow_pod_logs(self, pod_name: str, namespace: str, container: Optional[str] = None):
         """Follow pod logs in real-time"""
         try:
@@ -130,9 +346,40 @@ class KubernetesClient:
             if container:
                 kwargs['container'] = container
             
-            w = watch.Watch()
-            for line in w.stream(self.v1.read_namespaced_pod_log, **kwargs):
-                print(line)
+            out = sys.stdout.buffer
+            last_key = None
+            last_seen = None
+            failures = 0
+            while True:
+                if last_seen is not None:
+                    # Resume just before the last line seen; replayed lines are skipped below
+                    kwargs['since_seconds'] = int(time.time() - last_seen) + 1
+                
+                response = self.v1.read_namespaced_pod_log(_preload_content=False, **kwargs)
+                received = False
+                try:
+                    # Log text is copied to stdout as raw bytes, one write per chunk
+                    for lines in self._iter_raw_line_batches(response):
+                        if last_key is not None:
+                            lines = [line for line in lines if _log_timestamp_key(line) > last_key]
+                            if not lines:
+                                continue
+                        last_key = _log_timestamp_key(lines[-1])
+                        last_seen = time.time()
+                        received = True
+                        out.write(b'\n'.join(lines) + b'\n')
+                        out.flush()
+                    return
+                except ProtocolError as e:
+                    # Only interruptions without output in between count toward the limit
+                    failures = 1 if received else failures + 1
+                    if failures > LOG_RECONNECT_ATTEMPTS:
+                        raise Exception(f"Error following pod logs: stream keeps failing: {e}")
+                    delay = min(LOG_RECONNECT_MAX_WAIT, LOG_RECONNECT_MIN_WAIT * 2 ** (failures - 1))
+                    logger.warning(f"Log stream interrupted, reconnecting in {delay}s: {e}")
+                    time.sleep(delay)
+                finally:
+                    response.release_conn()
                 
         except KeyboardInterrupt:
             print("\nLog following stopped.")
@@ -142,26 +389,11 @@ class KubernetesClient:
     def get_pod_events(self, pod_name: str, namespace: str) -> List[Dict[str, Any]]:
         """Get events related to a specific pod"""
         try:
-            events = self.v1.list_namespaced_event(namespace=namespace)
-            pod_events = []
-            
-            for event in events.items:
-                if (event.involved_object.name == pod_name and 
-                    event.involved_object.kind == 'Pod'):
-                    pod_events.append({
-                        'type': event.type,
-                        'reason': event.reason,
-                        'message': event.message,
-                        'first_timestamp': event.first_timestamp.isoformat() if event.first_timestamp else None,
-                        'last_timestamp': event.last_timestamp.isoformat() if event.last_timestamp else None,
-                        'count': event.count,
-                        'source': event.source.component if event.source else 'Unknown',
-                        'object': f"{event.involved_object.kind}/{event.involved_object.name}",
-                        'age': self._calculate_age(event.first_timestamp)
-                    })
+            now = datetime.now(timezone.utc)
+            pod_events = [self._format_event(event, now) for event in self._fetch_pod_events(pod_name, namespace)]
             
             # Sort by timestamp (most recent first)
-            pod_events.sort(key=lambda x: x['last_timestamp'] or x['first_timestamp'], reverse=True)
+            pod_events.sort(key=_event_sort_key, reverse=True)
             return pod_events
             
         except ApiException as e:
@@ -170,56 +402,31 @@ class KubernetesClient:
     def get_namespace_events(self, namespace: str) -> List[Dict[str, Any]]:
         """Get all events in a namespace"""
         try:
-            events = self.v1.list_namespaced_event(namespace=namespace)
-            namespace_events = []
-            
-            for event in events.items:
-                namespace_events.append({
-                    'type': event.type,
-                    'reason': event.reason,
-                    'message': event.message,
-                    'first_timestamp': event.first_timestamp.isoformat() if event.first_timestamp else None,
-                    'last_timestamp': event.last_timestamp.isoformat() if event.last_timestamp else None,
-                    'count': event.count,
-                    'source': event.source.component if event.source else 'Unknown',
-                    'object': f"{event.involved_object.kind}/{event.involved_object.name}",
-                    'age': self._calculate_age(event.first_timestamp)
-                })
+            now = datetime.now(timezone.utc)
+            namespace_events = [self._format_event(event, now) for event in self._fetch_events(namespace)]
             
-            # Sort by timestamp (most recent first)
-            namespace_events.sort(key=lambda x: x['last_timestamp'] or x['first_timestamp'], reverse=True)
-            return namespace_events[:50]  # Limit to recent 50 events
+            # Most recent first, selecting the top entries without sorting them all
+            return heapq.nlargest(NAMESPACE_EVENTS_LIMIT, namespace_events, key=_event_sort_key)
             
         except ApiException as e:
             raise Exception(f"Error getting namespace events: {e}")
     
+    @_ttl_cached
     def list_pods(self, namespace: str) -> List[Dict[str, Any]]:
         """List all pods in a namespace"""
         try:
-            pods = self.v1.list_namespaced_pod(namespace=namespace)
             pod_list = []
+            now = datetime.now(timezone.utc)
             
-            for pod in pods.items:
-                # Calculate ready containers
-                ready_count = 0
-                total_count = 0
-                restart_count = 0
-                
-                if pod.status.container_statuses:
-                    total_count = len(pod.status.container_statuses)
-                    for container_status in pod.status.container_statuses:
-                        if container_status.ready:
-                            ready_count += 1
-                        restart_count += container_status.restart_count
-                
+            for summary in self._iter_pod_summaries(namespace):
                 pod_list.append({
-                    'name': pod.metadata.name,
-                    'namespace': pod.metadata.namespace,
-                    'status': pod.status.phase,
-                    'ready': f"{ready_count}/{total_count}",
-                    'restarts': restart_count,
-                    'age': self._calculate_age(pod.metadata.creation_timestamp),
-                    'node': pod.spec.node_name or 'Not Scheduled'
+                    'name': summary['name'],
+                    'namespace': summary['namespace'],
+                    'status': summary['phase'],
+                    'ready': f"{summary['ready']}/{summary['total']}",
+                    'restarts': summary['restarts'],
+                    'age': self._calculate_age(summary['created'], now),
+                    'node': summary['node']
                 })
             
             return pod_list
@@ -230,28 +437,24 @@ class KubernetesClient:
     def get_namespace_health(self, namespace: str) -> Dict[str, Any]:
         """Get comprehensive health information for a namespace"""
         try:
-            pods = self.v1.list_namespaced_pod(namespace=namespace)
+            # Completed pods are neither healthy nor failing, so leave them out
+            summaries = list(self._iter_pod_summaries(namespace, skip_succeeded=True))
             
-            total_pods = len(pods.items)
-            running_pods = 0
-            failed_pods = 0
-            pending_pods = 0
-            failed_pod_details = []
+            # Tally every phase in one C-level counting pass
+            phase_counts = Counter(map(_PHASE, summaries))
+            total_pods = len(summaries)
+            running_pods = phase_counts['Running']
+            pending_pods = phase_counts['Pending']
+            failed_pods = sum(phase_counts[phase] for phase in FAILED_PHASES)
             
-            for pod in pods.items:
-                status = pod.status.phase
-                
-                if status == 'Running':
-                    running_pods += 1
-                elif status in ['Failed', 'CrashLoopBackOff']:
-                    failed_pods += 1
-                    failed_pod_details.append({
-                        'name': pod.metadata.name,
-                        'status': status,
-                        'reason': self._get_pod_failure_reason(pod)
-                    })
-                elif status == 'Pending':
-                    pending_pods += 1
+            failed_pod_details = [
+                {
+                    'name': summary['name'],
+                    'status': summary['phase'],
+                    'reason': summary['failure_reason']
+                }
+                for summary in summaries if summary['phase'] in FAILED_PHASES
+            ] if failed_pods else []
             
             return {
                 'namespace': namespace,
@@ -266,22 +469,78 @@ class KubernetesClient:
         except ApiException as e:
             raise Exception(f"Error getting namespace health: {e}")
     
-    def _calculate_age(self, created_time) -> str:
-        """Calculate age from creation timestamp"""
+    def _fetch_pod(self, pod_name: str, namespace: str):
+        """Read a pod from the cache when enabled, otherwise from the API"""
+        if self.cache:
+            pod = self.cache.get_pod(namespace, pod_name)
+            if pod is None:
+                raise ApiException(status=404, reason="Not Found")
+            return pod
+        return self.v1.read_namespaced_pod(name=pod_name, namespace=namespace)
+    
+    def _fetch_pods(self, namespace: str, skip_succeeded: bool = False) -> List[Any]:
+        """List pods in a namespace from the cache when enabled, otherwise from the API"""
+        if self.cache:
+            pods = self.cache.list_pods(namespace)
+            if skip_succeeded:
+                pods = [pod for pod in pods if pod.status.phase != 'Succeeded']
+            return pods
+        
+        kwargs = {'namespace': namespace}
+        if skip_succeeded:
+            kwargs['field_selector'] = 'status.phase!=Succeeded'
+        return self._list_all(self.v1.list_namespaced_pod, **kwargs)
+    
+    def _fetch_events(self, namespace: str) -> List[Any]:
+        """List events in a namespace from the cache when enabled, otherwise from the API"""
+        if self.cache:
+            return self.cache.list_events(namespace)
+        return self._list_all(self.v1.list_namespaced_event, namespace=namespace)
+    
+    def _list_all(self, list_func, **kwargs) -> List[Any]:
+        """Collect every item of a list call, fetching it in pages of LIST_PAGE_SIZE"""
+        items = []
+        continue_token = None
+        
+        while True:
+            if continue_token:
+                kwargs['_continue'] = continue_token
+            result = list_func(limit=LIST_PAGE_SIZE, **kwargs)
+            items.extend(result.items)
+            
+            # Pages may come back short mid-list; only a missing token ends it
+            continue_token = result.metadata._continue
+            if not continue_token:
+                return items
+    
+    def _fetch_pod_events(self, pod_name: str, namespace: str) -> List[Any]:
+        """List the events whose involved object is the pod"""
+        if self.cache:
+            return self.cache.get_pod_events(namespace, pod_name)
+        
+        # Let the API server filter, so only this pod's events are transferred
+        field_selector = f"involvedObject.name={pod_name},involvedObject.kind=Pod,involvedObject.namespace={namespace}"
+        return self.v1.list_namespaced_event(
+            namespace=namespace,
+            field_selector=field_selector,
+            limit=POD_EVENTS_LIMIT,
+            _request_timeout=POD_EVENTS_TIMEOUT
+        ).items
+    
+    def _calculate_age(self, created_time, now: Optional[datetime] = None) -> str:
+        """Calculate age from creation timestamp (pass now when aging many objects)"""
         if not created_time:
             return "Unknown"
         
-        now = datetime.now(timezone.utc)
-        age = now - created_time
+        age = (now or datetime.now(timezone.utc)) - created_time
         
         if age.days > 0:
             return f"{age.days}d"
-        elif age.seconds > 3600:
-            return f"{age.seconds // 3600}h"
-        elif age.seconds > 60:
-            return f"{age.seconds // 60}m"
-        else:
-            return f"{age.seconds}s"
+        
+        for unit_seconds, suffix in _AGE_UNITS:
+            if age.seconds > unit_seconds:
+                return f"{age.seconds // unit_seconds}{suffix}"
+        return f"{age.seconds}s"
     
     def _get_container_state(self, state) -> str:
         """Get human-readable container state"""
@@ -296,26 +555,33 @@ class KubernetesClient:
     
     def _get_pod_resources(self, pod) -> Dict[str, Any]:
         """Extract resource requests and limits from pod"""
-        resources = {
-            'requests': {'cpu': '0', 'memory': '0'},
-            'limits': {'cpu': '0', 'memory': '0'}
+        # Pod totals: the sum over all containers
+        totals = {
+            'requests': {'cpu': Decimal(0), 'memory': Decimal(0)},
+            'limits': {'cpu': Decimal(0), 'memory': Decimal(0)}
         }
+        reqs = totals['requests']
+        lims = totals['limits']
         
         for container in pod.spec.containers:
-            if container.resources:
-                if container.resources.requests:
-                    if 'cpu' in container.resources.requests:
-                        resources['requests']['cpu'] = container.resources.requests['cpu']
-                    if 'memory' in container.resources.requests:
-                        resources['requests']['memory'] = container.resources.requests['memory']
-                
-                if container.resources.limits:
-                    if 'cpu' in container.resources.limits:
-                        resources['limits']['cpu'] = container.resources.limits['cpu']
-                    if 'memory' in container.resources.limits:
-                        resources['limits']['memory'] = container.resources.limits['memory']
+            container_resources = container.resources
+            if not container_resources:
+                continue
+            
+            for values, total in ((container_resources.requests, reqs), (container_resources.limits, lims)):
+                if not values:
+                    continue
+                cpu = values.get('cpu')
+                if cpu is not None:
+                    total['cpu'] += parse_quantity(cpu)
+                memory = values.get('memory')
+                if memory is not None:
+                    total['memory'] += parse_quantity(memory)
         
-        return resources
+        return {
+            kind: {'cpu': _format_cpu(total['cpu']), 'memory': _format_memory(total['memory'])}
+            for kind, total in totals.items()
+        }
     
     def _get_pod_conditions(self, conditions) -> List[Dict[str, Any]]:
         """Extract pod conditions"""
@@ -334,18 +600,70 @@ class KubernetesClient:
         
         return condition_list
     
-    def _get_pod_failure_reason(self, pod) -> str:
-        """Get reason for pod failure"""
-        if pod.status.container_statuses:
-            for container_status in pod.status.container_statuses:
-                if container_status.state.waiting:
-                    return container_status.state.waiting.reason
-                elif container_status.state.terminated:
-                    return container_status.state.terminated.reason
+    def _format_event(self, event, now: datetime) -> Dict[str, Any]:
+        """Convert an event into the dictionary shown by the events commands"""
+        event_type, reason, message, first_timestamp, last_timestamp, count, source, involved = _EVENT_FIELDS(event)
         
-        if pod.status.conditions:
-            for condition in pod.status.conditions:
-                if condition.type == 'PodScheduled' and condition.status == 'False':
-                    return condition.reason or 'SchedulingFailed'
+        return {
+            'type': event_type,
+            'reason': reason,
+            'message': message,
+            'first_timestamp': first_timestamp.isoformat() if first_timestamp else None,
+            'last_timestamp': last_timestamp.isoformat() if last_timestamp else None,
+            'count': count,
+            'source': source.component if source else 'Unknown',
+            'object': f"{involved.kind}/{involved.name}",
+            'age': self._calculate_age(first_timestamp, now)
+        }
+    
+    def _iter_pod_summaries(self, namespace: str, skip_succeeded: bool = False) -> Iterator[Dict[str, Any]]:
+        """Summarize every pod in a namespace"""
+        for pod in self._fetch_pods(namespace, skip_succeeded=skip_succeeded):
+            yield self._summarize_pod(pod)
+    
+    def _summarize_pod(self, pod) -> Dict[str, Any]:
+        """Collect the fields list_pods and get_namespace_health need in one pass over the pod"""
+        metadata = pod.metadata
+        status = pod.status
+        container_statuses = status.container_statuses or ()
+        
+        ready_count = 0
+        restart_count = 0
+        # The first container that is not running explains a failure
+        failure_reason = None
+        found_reason = False
+        
+        for container_status in container_statuses:
+            if container_status.ready:
+                ready_count += 1
+            restart_count += container_status.restart_count
+            
+            if not found_reason:
+                state = container_status.state
+                if state.waiting:
+                    failure_reason, found_reason = state.waiting.reason, True
+                elif state.terminated:
+                    failure_reason, found_reason = state.terminated.reason, True
+        
+        if not found_reason and status.phase in FAILED_PHASES:
+            failure_reason = self._get_scheduling_failure_reason(status.conditions)
+        
+        return {
+            'name': metadata.name,
+            'namespace': metadata.namespace,
+            'phase': status.phase,
+            'ready': ready_count,
+            'total': len(container_statuses),
+            'restarts': restart_count,
+            'failure_reason': failure_reason,
+            'created': metadata.creation_timestamp,
+            'node': pod.spec.node_name or 'Not Scheduled'
+        }
+    
+    def _get_scheduling_failure_reason(self, conditions) -> str:
+        """Get the reason a pod without container states failed"""
+        for condition in conditions or ():
+            if condition.type == 'PodScheduled' and condition.status == 'False':
+                return condition.reason or 'SchedulingFailed'
         
         return "Unknown"
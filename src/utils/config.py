@@ -3,13 +3,75 @@ Configuration management for KubeGPT
 """
 
 import os
+import copy
+import functools
 import yaml
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 logger = logging.getLogger(__name__)
 
+# Parsed configuration files keyed by (absolute path, mtime in ns, size), so
+# a file is only parsed again after it changes
+_CONFIG_CACHE: Dict[Tuple[str, int, int], dict] = {}
+
+
+class EnvRef(str):
+    """A ``${VAR}`` config string, resolved from the environment by Config.get"""
+    
+    __slots__ = ()
+    
+    @property
+    def name(self) -> str:
+        """Name of the referenced environment variable"""
+        return self[2:-1]
+
+
+def _mark_env_refs(value: Any) -> Any:
+    """Replace ``${VAR}`` strings in a parsed config with EnvRef markers"""
+    if isinstance(value, dict):
+        return {k: _mark_env_refs(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_mark_env_refs(v) for v in value]
+    if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
+        return EnvRef(value)
+    return value
+
+
+def _unmark_env_refs(value: Any) -> Any:
+    """Turn EnvRef markers back into plain strings for saving"""
+    if isinstance(value, dict):
+        return {k: _unmark_env_refs(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_unmark_env_refs(v) for v in value]
+    if isinstance(value, EnvRef):
+        return str(value)
+    return value
+
+
+def _flatten(data: dict, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yield ('a.b.c', value) for every key path in a nested config, sections included"""
+    for k, v in data.items():
+        key = f"{prefix}{k}"
+        yield key, v
+        if isinstance(v, dict):
+            yield from _flatten(v, f"{key}.")
+
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted config key once and remember the parts"""
+    return tuple(key.split('.'))
+
 
 class Config:
     """Configuration manager for KubeGPT"""
@@ -18,60 +80,89 @@ class Config:
         """Initialize configuration from file"""
         self.config_file = config_file
         self.config_data = {}
+        self._flat: Dict[str, Any] = {}
         self._load_config()
     
     def _load_config(self):
         """Load configuration from YAML file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.config_data = yaml.safe_load(f) or {}
+                self.config_data = self._read_config_file()
                 logger.info(f"Loaded configuration from {self.config_file}")
             else:
                 logger.warning(f"Configuration file {self.config_file} not found, using defaults")
-                self.config_data = self._get_default_config()
+                self.config_data = _mark_env_refs(self._get_default_config())
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
-            self.config_data = self._get_default_config()
+            self.config_data = _mark_env_refs(self._get_default_config())
+        
+        # Dotted keys resolved up front, so get() is a single dict lookup
+        self._flat = dict(_flatten(self.config_data))
+    
+    def _read_config_file(self) -> dict:
+        """Parse the config file, reusing the result while the file is unchanged"""
+        stat = os.stat(self.config_file)
+        cache_key = (os.path.abspath(self.config_file), stat.st_mtime_ns, stat.st_size)
+        
+        data = _CONFIG_CACHE.get(cache_key)
+        if data is None:
+            with open(self.config_file, 'r') as f:
+                data = _mark_env_refs(yaml.load(f, Loader=_Loader) or {})
+            _CONFIG_CACHE[cache_key] = data
+        
+        # set() mutates config_data, so each instance gets its own copy
+        return copy.deepcopy(data)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'kubernetes.namespace')"""
-        keys = key.split('.')
-        value = self.config_data
+        value = self._flat.get(key, _MISSING)
         
-        try:
-            for k in keys:
-                value = value[k]
-            
-            # Handle environment variable substitution
-            if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
-                env_var = value[2:-1]
-                env_value = os.getenv(env_var)
-                return env_value if env_value is not None else default
-            
-            return value
-        except (KeyError, TypeError):
-            return default
+        if value is _MISSING:
+            # Not seen at load time or by set(); walk config_data in case it was
+            # edited directly
+            value = self.config_data
+            try:
+                for k in _split_key(key):
+                    value = value[k]
+            except (KeyError, TypeError):
+                return default
+        
+        # Handle environment variable substitution
+        if isinstance(value, EnvRef):
+            env_value = os.getenv(value.name)
+            return env_value if env_value is not None else default
+        
+        return value
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation"""
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config_data
         
         # Navigate to the parent dictionary
-        for k in keys[:-1]:
+        for i, k in enumerate(keys[:-1]):
             if k not in config:
                 config[k] = {}
+                self._flat['.'.join(keys[:i + 1])] = config[k]
             config = config[k]
         
         # Set the value
+        value = _mark_env_refs(value)
         config[keys[-1]] = value
+        
+        # Replace the flattened entries under this key
+        prefix = f"{key}."
+        for stale in [k for k in self._flat if k.startswith(prefix)]:
+            del self._flat[stale]
+        self._flat[key] = value
+        if isinstance(value, dict):
+            self._flat.update(_flatten(value, prefix))
     
     def save(self):
         """Save current configuration to file"""
         try:
             with open(self.config_file, 'w') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False)
+                yaml.dump(_unmark_env_refs(self.config_data), f, Dumper=_Dumper, default_flow_style=False)
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Error saving configuration: {e}")
@@ -82,7 +173,8 @@ class Config:
             'kubernetes': {
                 'config_path': '~/.kube/config',
                 'default_namespace': 'default',
-                'timeout': 30
+                'timeout': 30,
+                'watch_cache': False
             },
             'openai': {
                 'api_key': '${OPENAI_API_KEY}',
@@ -0,0 +1,13 @@
+"""
+Shared Rich console for KubeGPT
+"""
+
+import sys
+from rich.console import Console
+
+# Whether output goes to a terminal rather than a pipe or file
+_IS_TTY = sys.stdout.isatty()
+
+# One console for the whole CLI. When output is piped, nobody sees the
+# highlighting and wrapped lines only break downstream parsing, so both are off
+console = Console(highlight=_IS_TTY, soft_wrap=not _IS_TTY)
@@ -2,48 +2,163 @@
 Output formatting utilities for KubeGPT
 """
 
-import json
-import yaml
-from typing import Any, Dict, List
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.syntax import Syntax
+import re
+import functools
+import operator
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union, TYPE_CHECKING
 
-console = Console()
+# yaml and rich are imported on first use, so importing this module stays cheap
+# for commands that never render anything
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+
+try:
+    import orjson
+    
+    def _dumps_json(data: Any, compact: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option, default=str).decode()
+    
+    def _dump_json(data: Any, stream: TextIO, compact: bool = False) -> None:
+        # orjson only encodes to bytes, so the document is written in one piece
+        stream.write(_dumps_json(data, compact))
+except ImportError:
+    import json
+    
+    def _dumps_json(data: Any, compact: bool = False) -> str:
+        if compact:
+            return json.dumps(data, separators=(',', ':'), default=str)
+        return json.dumps(data, indent=2, default=str)
+    
+    def _dump_json(data: Any, stream: TextIO, compact: bool = False) -> None:
+        if compact:
+            json.dump(data, stream, separators=(',', ':'), default=str)
+        else:
+            json.dump(data, stream, indent=2, default=str)
+
+# Log level keywords and line breaks, matched in one case-insensitive scan of
+# the whole log
+_LEVEL_SCAN_RE = re.compile(r'ERROR|FATAL|EXCEPTION|WARN|INFO|DEBUG|\n', re.IGNORECASE)
+
+# Class code per level keyword; a lower code is more severe and wins when a
+# line mentions several
+_LEVEL_CODE = {'ERROR': 1, 'FATAL': 1, 'EXCEPTION': 1, 'WARN': 2, 'INFO': 3, 'DEBUG': 4}
+
+# Line style per class code (0 = no level)
+_CODE_STYLE = (None, 'red', 'yellow', 'blue', 'dim')
+
+# Log lines rendered per console print, bounding memory for long logs
+_LOG_RENDER_BATCH = 1000
+
+# Table cells read from each pod and event, in column order
+_POD_FIELDS = operator.itemgetter('name', 'status', 'ready', 'restarts', 'age', 'node')
+_EVENT_FIELDS = operator.itemgetter('type', 'reason', 'object', 'message', 'age')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """The CLI's shared rich console, imported on first use"""
+    from .console import console
+    return console
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_dumper() -> Tuple[Any, Any]:
+    """The yaml module and its fastest available safe dumper"""
+    import yaml
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+    return yaml, Dumper
+
+
+def _dump_yaml(data: Any, stream: Optional[TextIO] = None) -> Optional[str]:
+    """Dump data as block-style YAML, returning a string when no stream is given"""
+    yaml, Dumper = _yaml_dumper()
+    return yaml.dump(data, stream, Dumper=Dumper, default_flow_style=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _styled_cells() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Prebuilt styled cells for common pod statuses and event types"""
+    from rich.text import Text
+    pod_status = {'Running': Text('Running', style='green')}
+    event_type = {
+        'Normal': Text('Normal', style='green'),
+        'Warning': Text('Warning', style='red')
+    }
+    return pod_status, event_type
+
+
+@functools.lru_cache(maxsize=None)
+def _syntax_style(language: str) -> Tuple[Any, Any]:
+    """Pygments lexer and monokai theme for a language, created once and reused"""
+    from pygments.lexers import get_lexer_by_name
+    from rich.syntax import Syntax
+    return get_lexer_by_name(language), Syntax.get_theme("monokai")
 
 
 class OutputFormatter:
     """Handles different output formats for KubeGPT"""
     
     @staticmethod
-    def format_output(data: Any, output_format: str = 'table') -> str:
-        """Format data according to specified format"""
+    def format_output(data: Any, output_format: str = 'table', compact: bool = False,
+                      stream: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Format data according to specified format
+        
+        JSON is the format for machine consumers; pass compact=True when the
+        output goes to a pipe rather than a terminal. YAML is much slower to
+        produce and is meant for reading.
+        
+        With a stream (e.g. sys.stdout) the output is written to it directly and
+        None is returned; otherwise the formatted string is returned.
+        """
+        if stream is None:
+            if output_format == 'json':
+                return _dumps_json(data, compact)
+            elif output_format == 'yaml':
+                return _dump_yaml(data)
+            else:
+                return str(data)
+        
         if output_format == 'json':
-            return json.dumps(data, indent=2, default=str)
+            _dump_json(data, stream, compact)
         elif output_format == 'yaml':
-            return yaml.dump(data, default_flow_style=False)
+            _dump_yaml(data, stream)
         else:
-            return str(data)
+            stream.write(str(data))
+        return None
     
     @staticmethod
     def print_json(data: Any):
         """Print data as formatted JSON"""
-        json_str = json.dumps(data, indent=2, default=str)
-        syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
-        console.print(syntax)
+        from rich.syntax import Syntax
+        
+        json_str = _dumps_json(data)
+        lexer, theme = _syntax_style("json")
+        syntax = Syntax(json_str, lexer, theme=theme, line_numbers=True)
+        _get_console().print(syntax)
     
     @staticmethod
     def print_yaml(data: Any):
         """Print data as formatted YAML"""
-        yaml_str = yaml.dump(data, default_flow_style=False)
-        syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=True)
-        console.print(syntax)
+        from rich.syntax import Syntax
+        
+        yaml_str = _dump_yaml(data)
+        lexer, theme = _syntax_style("yaml")
+        syntax = Syntax(yaml_str, lexer, theme=theme, line_numbers=True)
+        _get_console().print(syntax)
     
     @staticmethod
-    def create_pods_table(pods: List[Dict[str, Any]]) -> Table:
+    def create_pods_table(pods: List[Dict[str, Any]]) -> "Table":
         """Create a formatted table for pods"""
+        from rich.table import Table
+        from rich.text import Text
+        
         table = Table(title="Kubernetes Pods")
         table.add_column("Name", style="cyan", no_wrap=True)
         table.add_column("Status", style="white")
@@ -52,22 +167,26 @@ class OutputFormatter:
         table.add_column("Age", style="white")
         table.add_column("Node", style="blue")
         
-        for pod in pods:
-            status_color = "green" if pod['status'] == "Running" else "red"
-            table.add_row(
-                pod['name'],
-                f"[{status_color}]{pod['status']}[/{status_color}]",
-                pod['ready'],
-                str(pod['restarts']),
-                pod['age'],
-                pod['node']
-            )
+        if not pods:
+            return table
+        
+        # Pull each column out once, then convert whole columns at a time
+        names, statuses, ready, restarts, ages, nodes = zip(*map(_POD_FIELDS, pods))
+        status_text = _styled_cells()[0]
+        statuses = [status_text.get(status) or Text(str(status), style='red') for status in statuses]
+        restarts = map(str, restarts)
+        
+        for row in zip(names, statuses, ready, restarts, ages, nodes):
+            table.add_row(*row)
         
         return table
     
     @staticmethod
-    def create_events_table(events: List[Dict[str, Any]]) -> Table:
+    def create_events_table(events: List[Dict[str, Any]]) -> "Table":
         """Create a formatted table for events"""
+        from rich.table import Table
+        from rich.text import Text
+        
         table = Table(title="Kubernetes Events")
         table.add_column("Type", style="cyan")
         table.add_column("Reason", style="white")
@@ -75,25 +194,25 @@ class OutputFormatter:
         table.add_column("Message", style="white")
         table.add_column("Age", style="blue")
         
-        for event in events:
-            type_color = "red" if event['type'] == "Warning" else "green"
-            message = event['message']
-            if len(message) > 50:
-                message = message[:47] + "..."
-            
-            table.add_row(
-                f"[{type_color}]{event['type']}[/{type_color}]",
-                event['reason'],
-                event['object'],
-                message,
-                event['age']
-            )
+        if not events:
+            return table
+        
+        # Pull each column out once, then convert whole columns at a time
+        types, reasons, objects, messages, ages = zip(*map(_EVENT_FIELDS, events))
+        type_text = _styled_cells()[1]
+        types = [type_text.get(event_type) or Text(str(event_type), style='green') for event_type in types]
+        messages = [message[:47] + "..." if len(message) > 50 else message for message in messages]
+        
+        for row in zip(types, reasons, objects, messages, ages):
+            table.add_row(*row)
         
         return table
     
     @staticmethod
-    def create_health_summary(health_data: Dict[str, Any]) -> Panel:
+    def create_health_summary(health_data: Dict[str, Any]) -> "Panel":
         """Create a health summary panel"""
+        from rich.panel import Panel
+        
         content = f"""
 [bold]Namespace:[/bold] {health_data['namespace']}
 [bold]Total Pods:[/bold] {health_data['total_pods']}
@@ -106,40 +225,92 @@ class OutputFormatter:
         return Panel(content.strip(), title="[bold green]Namespace Health Summary[/bold green]")
     
     @staticmethod
-    def format_logs(logs: str, pod_name: str) -> None:
-        """Format and display logs with syntax highlighting"""
+    def format_logs(logs: Union[str, Iterable[str]], pod_name: str) -> None:
+        """
+        Format and display logs with syntax highlighting
+        
+        Args:
+            logs: The whole log as one string, or an iterable of lines (e.g. an
+                open file or a log stream) that is rendered as it is read
+            pod_name: Pod the logs belong to
+        """
+        from rich.panel import Panel
+        from rich.text import Text
+        
+        console = _get_console()
         console.print(Panel(f"[bold green]Logs for Pod: {pod_name}[/bold green]"))
         
-        for line in logs.split('\n'):
+        # Styled lines are collected into a Text and rendered a batch at a time;
+        # appending plain text also keeps brackets in log lines from being read as markup
+        output = Text()
+        count = 0
+        for line, code in OutputFormatter._iter_classified_lines(logs):
             if line.strip():
+                if count:
+                    output.append('\n')
                 # Color code log levels
-                if any(level in line.upper() for level in ['ERROR', 'FATAL', 'EXCEPTION']):
-                    console.print(f"[red]{line}[/red]")
-                elif any(level in line.upper() for level in ['WARN', 'WARNING']):
-                    console.print(f"[yellow]{line}[/yellow]")
-                elif any(level in line.upper() for level in ['INFO', 'INFORMATION']):
-                    console.print(f"[blue]{line}[/blue]")
-                elif 'DEBUG' in line.upper():
-                    console.print(f"[dim]{line}[/dim]")
-                else:
-                    console.print(line)
+                output.append(line, style=_CODE_STYLE[code])
+                count += 1
+                
+                if count >= _LOG_RENDER_BATCH:
+                    console.print(output)
+                    output = Text()
+                    count = 0
+        
+        if count:
+            console.print(output)
+    
+    @staticmethod
+    def _iter_classified_lines(logs: Union[str, Iterable[str]]) -> Iterator[Tuple[str, int]]:
+        """
+        Yield each log line with the class code of the most severe level it mentions
+        
+        A string is scanned once for level keywords and line breaks, and each
+        line is sliced out as the scan passes it, so no list of all lines is built.
+        """
+        if not isinstance(logs, str):
+            for chunk in logs:
+                yield from OutputFormatter._iter_classified_lines(chunk.rstrip('\n'))
+            return
+        
+        start = 0
+        code = 0
+        for match in _LEVEL_SCAN_RE.finditer(logs):
+            token = match.group()
+            if token == '\n':
+                yield logs[start:match.start()], code
+                start = match.end()
+                code = 0
+                continue
+            level = _LEVEL_CODE[token.upper()]
+            if not code or level < code:
+                code = level
+        yield logs[start:], code
     
     @staticmethod
-    def format_analysis_result(analysis: str, title: str = "Analysis") -> Panel:
+    def format_analysis_result(analysis: str, title: str = "Analysis") -> "Panel":
         """Format analysis result in a panel"""
+        from rich.panel import Panel
+        
         return Panel(analysis, title=f"[bold blue]{title}[/bold blue]", border_style="blue")
     
     @staticmethod
-    def format_error(error_message: str) -> Panel:
+    def format_error(error_message: str) -> "Panel":
         """Format error message"""
+        from rich.panel import Panel
+        
         return Panel(f"[red]{error_message}[/red]", title="[bold red]Error[/bold red]", border_style="red")
     
     @staticmethod
-    def format_warning(warning_message: str) -> Panel:
+    def format_warning(warning_message: str) -> "Panel":
         """Format warning message"""
+        from rich.panel import Panel
+        
         return Panel(f"[yellow]{warning_message}[/yellow]", title="[bold yellow]Warning[/bold yellow]", border_style="yellow")
     
     @staticmethod
-    def format_success(success_message: str) -> Panel:
+    def format_success(success_message: str) -> "Panel":
         """Format success message"""
+        from rich.panel import Panel
+        
         return Panel(f"[green]{success_message}[/green]", title="[bold green]Success[/bold green]", border_style="green")
@@ -2,9 +2,11 @@
 Logging configuration for KubeGPT
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from typing import Optional
 
 
@@ -32,14 +34,21 @@ def setup_logger(name: Optional[str] = None,
         '%(levelname)s: %(message)s'
     )
     
-    # File handler with rotation
+    # File handler with rotation, written from a background thread so logging
+    # calls only enqueue the record instead of waiting on disk I/O
     try:
         file_handler = logging.handlers.RotatingFileHandler(
             log_file, maxBytes=max_bytes, backupCount=backup_count
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        # Stopping the listener flushes the records still queued at exit
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
     except Exception as e:
         print(f"Warning: Could not create log file handler: {e}")
     
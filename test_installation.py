@@ -5,10 +5,52 @@ KubeGPT Test Script
 Simple test to verify installation and basic functionality.
 """
 
+import io
+import os
 import sys
+import shutil
 import subprocess
+import threading
+import importlib.util
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+class _ThreadOutput:
+    """Stand-in for sys.stdout that can give each thread its own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self.stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self.stream).flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+    
+    @contextmanager
+    def capture(self):
+        """Collect what the current thread prints"""
+        previous = getattr(self._local, 'buffer', None)
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            if previous is None:
+                del self._local.buffer
+            else:
+                self._local.buffer = previous
+
+def _captured_output():
+    """Context manager collecting what the current thread prints"""
+    if isinstance(sys.stdout, _ThreadOutput):
+        return sys.stdout.capture()
+    return redirect_stdout(io.StringIO())
+
 def test_dependencies():
     """Test if all required dependencies are installed"""
     print("🔍 Testing dependencies...")
@@ -23,11 +65,12 @@ def test_dependencies():
     
     failed = []
     
+    # Locate the packages without importing them; openai alone pulls in
+    # httpx, pydantic and anyio
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"  ✅ {package}")
-        except ImportError:
+        else:
             print(f"  ❌ {package}")
             failed.append(package)
     
@@ -36,13 +79,31 @@ def test_dependencies():
         print("Run: pip install -r requirements.txt")
         return False
     
+    # find_spec cannot tell a broken install from a working one, so import
+    # one cheap package for real as a canary
+    try:
+        import yaml  # noqa: F401
+    except Exception as e:
+        print(f"\n❌ Installed packages fail to import: {e}")
+        print("Run: pip install --force-reinstall -r requirements.txt")
+        return False
+    
     print("✅ All dependencies installed!")
     return True
 
+def _kubeconfig_exists():
+    """Whether any kubeconfig file kubectl would read exists"""
+    paths = os.environ.get("KUBECONFIG") or os.path.join("~", ".kube", "config")
+    return any(os.path.exists(os.path.expanduser(path)) for path in paths.split(os.pathsep) if path)
+
 def test_kubectl():
     """Test if kubectl is available"""
     print("\n🔍 Testing kubectl access...")
     
+    if shutil.which("kubectl") is None:
+        print("  ❌ kubectl not found in PATH")
+        return False
+    
     try:
         result = subprocess.run(
             ["kubectl", "version", "--client", "--short"],
@@ -54,6 +115,11 @@ def test_kubectl():
         if result.returncode == 0:
             print("  ✅ kubectl is available")
             
+            # Without a kubeconfig there is no cluster to reach
+            if not _kubeconfig_exists():
+                print("  ⚠️ no kubeconfig; skipping cluster-info")
+                return True
+            
             # Test cluster access
             try:
                 cluster_result = subprocess.run(
@@ -79,9 +145,6 @@ def test_kubectl():
             print("  ❌ kubectl not available")
             return False
             
-    except FileNotFoundError:
-        print("  ❌ kubectl not found in PATH")
-        return False
     except subprocess.TimeoutExpired:
         print("  ❌ kubectl command timeout")
         return False
@@ -124,21 +187,19 @@ def test_basic_functionality():
     print("\n🔍 Testing basic functionality...")
     
     try:
-        # Test help command
-        result = subprocess.run(
-            [sys.executable, "kubegpt.py", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=Path(__file__).parent
-        )
+        # Test help command, in this interpreter rather than a new Python
+        sys.path.insert(0, str(Path(__file__).parent))
+        from kubegpt.cli import app
         
-        if result.returncode == 0:
+        with _captured_output():
+            exit_code = app(args=["--help"], prog_name="kubegpt.py", standalone_mode=False)
+        
+        if not exit_code:
             print("  ✅ CLI help command works")
             return True
         else:
             print("  ❌ CLI help command failed")
-            print(f"    Error: {result.stderr}")
+            print(f"    Exit code: {exit_code}")
             return False
             
     except Exception as e:
@@ -177,8 +238,25 @@ def main():
         check_optional_features
     ]
     
-    for test in tests:
-        if not test():
+    # The tests wait on subprocesses and imports, so they run side by side;
+    # each one's output is collected and printed in order afterwards
+    output = _ThreadOutput(sys.stdout)
+    
+    def run(test):
+        with output.capture() as buffer:
+            passed = test()
+        return passed, buffer.getvalue()
+    
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run, tests))
+    finally:
+        sys.stdout = output.stream
+    
+    for passed, text in results:
+        print(text, end="")
+        if not passed:
             all_passed = False
         print()
     
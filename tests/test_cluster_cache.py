@@ -0,0 +1,62 @@
+"""
+Test the watch-backed cluster state cache
+"""
+
+import unittest
+from unittest.mock import Mock
+from src.kubernetes.cluster_cache import ClusterStateCache
+
+
+def _pod(name, resource_version, phase="Running"):
+    """Create a mock pod with a resourceVersion"""
+    pod = Mock()
+    pod.metadata.namespace = "default"
+    pod.metadata.name = name
+    pod.metadata.resource_version = str(resource_version)
+    pod.status.phase = phase
+    return pod
+
+
+class TestClusterStateCache(unittest.TestCase):
+    """Test merging list snapshots with watch events"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.cache = ClusterStateCache(Mock())
+        self.cache._replace_pods([_pod("web", 10), _pod("db", 11)], "12")
+    
+    def test_stale_relist_does_not_resurrect_deleted_pod(self):
+        """Test that a snapshot taken before a deletion does not bring the pod back"""
+        self.cache._apply_pod_event('DELETED', _pod("web", 15))
+        
+        self.cache._replace_pods([_pod("web", 10), _pod("db", 11)], "14")
+        
+        self.assertIsNone(self.cache.get_pod("default", "web"))
+        self.assertIsNotNone(self.cache.get_pod("default", "db"))
+    
+    def test_stale_relist_does_not_revert_status(self):
+        """Test that a snapshot older than a watch update keeps the newer object"""
+        self.cache._apply_pod_event('MODIFIED', _pod("db", 20, "Failed"))
+        
+        self.cache._replace_pods([_pod("web", 10), _pod("db", 11)], "14")
+        
+        self.assertEqual(self.cache.get_pod("default", "db").status.phase, "Failed")
+    
+    def test_stale_relist_keeps_pod_created_after_it(self):
+        """Test that a pod added by the watch after the snapshot is kept"""
+        self.cache._apply_pod_event('ADDED', _pod("worker", 16))
+        
+        self.cache._replace_pods([_pod("web", 10), _pod("db", 11)], "14")
+        
+        self.assertIsNotNone(self.cache.get_pod("default", "worker"))
+    
+    def test_newer_relist_applies_missed_changes(self):
+        """Test that a newer snapshot drops pods deleted while the watch was down"""
+        self.cache._replace_pods([_pod("web", 25, "Succeeded")], "30")
+        
+        self.assertIsNone(self.cache.get_pod("default", "db"))
+        self.assertEqual(self.cache.get_pod("default", "web").status.phase, "Succeeded")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ Test configuration management
 
 import unittest
 import tempfile
+import shutil
 import os
 from src.utils.config import Config
 
@@ -11,10 +12,11 @@ from src.utils.config import Config
 class TestConfig(unittest.TestCase):
     """Test configuration management"""
     
-    def setUp(self):
-        """Set up test environment"""
-        self.temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        self.temp_config.write("""
+    @classmethod
+    def setUpClass(cls):
+        """Write the temporary config file once for all tests"""
+        cls.temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
+        cls.temp_config.write("""
 kubernetes:
   config_path: ~/.kube/config
   default_namespace: test
@@ -27,11 +29,12 @@ openai:
 output:
   format: json
         """)
-        self.temp_config.close()
+        cls.temp_config.close()
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment"""
-        os.unlink(self.temp_config.name)
+        os.unlink(cls.temp_config.name)
     
     def test_load_config(self):
         """Test configuration loading"""
@@ -65,6 +68,31 @@ output:
         
         config.set('test.new_key', 'new_value')
         self.assertEqual(config.get('test.new_key'), 'new_value')
+        self.assertEqual(config.get('test'), {'new_key': 'new_value'})
+        
+        # Replacing a section drops the keys it no longer has
+        config.set('kubernetes', {'timeout': 60})
+        self.assertEqual(config.get('kubernetes.timeout'), 60)
+        self.assertIsNone(config.get('kubernetes.default_namespace'))
+    
+    def test_reload_after_file_change(self):
+        """Test that a changed config file is parsed again"""
+        # Rewrites the file, so work on a copy rather than the shared one
+        fd, path = tempfile.mkstemp(suffix='.yaml')
+        os.close(fd)
+        self.addCleanup(os.unlink, path)
+        shutil.copyfile(self.temp_config.name, path)
+        
+        config = Config(path)
+        config.set('kubernetes.default_namespace', 'changed')
+        
+        # Mutations of one instance do not leak into the parse cache
+        self.assertEqual(Config(path).get('kubernetes.default_namespace'), 'test')
+        
+        with open(path, 'w') as f:
+            f.write("kubernetes:\n  default_namespace: updated\n")
+        
+        self.assertEqual(Config(path).get('kubernetes.default_namespace'), 'updated')
     
     def test_default_config(self):
         """Test default configuration when file doesn't exist"""
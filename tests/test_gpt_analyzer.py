@@ -0,0 +1,206 @@
+"""
+Test GPT analyzer request handling with a mocked OpenAI client
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import openai
+
+from src.ai import gpt_analyzer
+from src.ai.gpt_analyzer import GPTAnalyzer, AsyncGPTAnalyzer
+from tests.test_utils import TestKubeGPT
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _status_error(error_class, status_code, headers=None):
+    """Create an OpenAI HTTP status error"""
+    return error_class("error", response=httpx.Response(status_code, request=_REQUEST, headers=headers), body=None)
+
+
+def _completion(content):
+    """Create a chat completion response"""
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+
+class TestGPTAnalyzer(TestKubeGPT):
+    """Test retries, the circuit breaker, caching and batching"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        super().setUp()
+        gpt_analyzer._response_cache.clear()
+        gpt_analyzer._circuit_breaker.record(True)
+        # No warm-up request from the analyzers created here
+        gpt_analyzer._connection_warmed.set()
+        
+        self.sleep = patch.object(gpt_analyzer.time, 'sleep').start()
+        patch.object(gpt_analyzer, '_shared_http_client').start()
+        patch('openai.OpenAI').start()
+        self.addCleanup(patch.stopall)
+        
+        self.analyzer = GPTAnalyzer(self.config)
+        self.client = self.analyzer.client
+        self.client.with_options.return_value = self.client
+        self.create = self.client.chat.completions.create
+    
+    def test_retries_rate_limit_after_retry_after(self):
+        """Test that a 429 is retried after the Retry-After delay"""
+        self.create.side_effect = [
+            _status_error(openai.RateLimitError, 429, {"retry-after": "2"}),
+            _completion("analysis")
+        ]
+        
+        self.assertEqual(self.analyzer.analyze_events([{"reason": "BackOff"}]), "analysis")
+        self.sleep.assert_called_once_with(2.0)
+        self.client.with_options.assert_called_with(max_retries=0)
+    
+    def test_retries_server_and_connection_errors(self):
+        """Test that 5xx responses and connection failures are retried"""
+        self.create.side_effect = [
+            _status_error(openai.InternalServerError, 503),
+            openai.APIConnectionError(request=_REQUEST),
+            _completion("analysis")
+        ]
+        
+        self.assertEqual(self.analyzer.analyze_events([{"reason": "BackOff"}]), "analysis")
+        self.assertEqual(self.create.call_count, 3)
+    
+    def test_gives_up_after_retry_attempts(self):
+        """Test that a persistent error is reported after the last attempt"""
+        self.create.side_effect = _status_error(openai.InternalServerError, 503)
+        
+        result = self.analyzer.analyze_events([{"reason": "BackOff"}])
+        
+        self.assertTrue(result.startswith("Event analysis failed"))
+        self.assertEqual(self.create.call_count, gpt_analyzer.OPENAI_RETRY_ATTEMPTS)
+    
+    def test_circuit_breaker_opens_after_failures(self):
+        """Test that calls stop after repeated failures, including non-retried ones"""
+        self.create.side_effect = _status_error(openai.AuthenticationError, 401)
+        
+        for i in range(gpt_analyzer.CIRCUIT_BREAKER_THRESHOLD):
+            self.analyzer.analyze_events([{"reason": f"event-{i}"}])
+        self.assertEqual(self.create.call_count, gpt_analyzer.CIRCUIT_BREAKER_THRESHOLD)
+        
+        result = self.analyzer.analyze_events([{"reason": "one more"}])
+        
+        self.assertIn("paused", result)
+        self.assertEqual(self.create.call_count, gpt_analyzer.CIRCUIT_BREAKER_THRESHOLD)
+    
+    def test_identical_requests_are_cached(self):
+        """Test that a repeated prompt is answered from the response cache"""
+        self.create.return_value = _completion("analysis")
+        
+        first = self.analyzer.get_troubleshooting_steps("pod stuck in Pending")
+        second = self.analyzer.get_troubleshooting_steps("pod stuck in Pending")
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.create.call_count, 1)
+    
+    def test_batch_analysis(self):
+        """Test that pods are analyzed through one batch and cached afterwards"""
+        pods = [{"pod_info": {"name": name, "namespace": "default"}} for name in ("web", "db")]
+        output = "\n".join(json.dumps({
+            "custom_id": f"default/{name}",
+            "response": {"status_code": 200, "body": {"choices": [{"message": {"content": f"{name} analysis"}}]}}
+        }) for name in ("web", "db"))
+        self.client.files.create.return_value = Mock(id="file-1")
+        self.client.batches.create.return_value = Mock(id="batch-1", status="completed", output_file_id="file-2")
+        self.client.files.content.return_value = Mock(text=output)
+        
+        results = dict(self.analyzer.analyze_pod_issues_batch(pods))
+        
+        self.assertEqual(results, {"default/web": "web analysis", "default/db": "db analysis"})
+        self.assertEqual(self.client.batches.create.call_count, 1)
+        
+        # Answered from the response cache the second time
+        self.assertEqual(dict(self.analyzer.analyze_pod_issues_batch(pods)), results)
+        self.assertEqual(self.client.batches.create.call_count, 1)
+    
+    def test_batch_falls_back_to_synchronous_calls(self):
+        """Test that pods are analyzed one by one when the batch fails or times out"""
+        pods = [{"pod_info": {"name": name, "namespace": "default"}} for name in ("web", "db")]
+        self.create.return_value = _completion("sync analysis")
+        self.client.files.create.return_value = Mock(id="file-1")
+        
+        self.client.batches.create.return_value = Mock(id="batch-1", status="failed")
+        results = dict(self.analyzer.analyze_pod_issues_batch(pods))
+        self.assertEqual(results, {"default/web": "sync analysis", "default/db": "sync analysis"})
+        
+        gpt_analyzer._response_cache.clear()
+        self.client.batches.create.return_value = Mock(id="batch-2", status="in_progress")
+        self.client.batches.retrieve.return_value = Mock(id="batch-2", status="in_progress")
+        results = dict(self.analyzer.analyze_pod_issues_batch(pods, timeout=7))
+        self.assertEqual(results, {"default/web": "sync analysis", "default/db": "sync analysis"})
+        self.assertEqual(self.client.batches.retrieve.call_count, 1)
+        
+        self.client.files.create.side_effect = _status_error(openai.BadRequestError, 400)
+        results = dict(self.analyzer.analyze_pod_issues_batch([{"pod_info": {"name": "api", "namespace": "default"}}]))
+        self.assertEqual(results, {"default/api": "sync analysis"})
+
+
+class TestAsyncGPTAnalyzer(TestKubeGPT):
+    """Test the async analyzer"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        super().setUp()
+        gpt_analyzer._response_cache.clear()
+        gpt_analyzer._circuit_breaker.record(True)
+        gpt_analyzer._connection_warmed.set()
+        
+        self.sleep = patch.object(gpt_analyzer.asyncio, 'sleep', new_callable=AsyncMock).start()
+        patch.object(gpt_analyzer, '_shared_http_client').start()
+        patch('openai.OpenAI').start()
+        patch('openai.AsyncOpenAI').start()
+        patch('openai.DefaultAsyncHttpxClient').start()
+        self.addCleanup(patch.stopall)
+        
+        self.analyzer = AsyncGPTAnalyzer(self.config)
+        self.aclient = self.analyzer.aclient
+        self.aclient.with_options.return_value = self.aclient
+        self.create = self.aclient.chat.completions.create = AsyncMock()
+    
+    def test_analyze_pod(self):
+        """Test that pod, log and event analyses are gathered"""
+        self.create.side_effect = lambda **request: _completion(request["messages"][0]["content"][:20])
+        pod_data = {"pod_info": {"name": "web", "namespace": "default"}, "logs": "ERROR failed", "events": []}
+        
+        result = asyncio.run(self.analyzer.analyze_pod(pod_data))
+        
+        self.assertEqual(set(result), {"pod", "logs", "events"})
+        self.assertEqual(self.create.call_count, 3)
+    
+    def test_retries_server_error(self):
+        """Test that the async path retries a 5xx response"""
+        self.create.side_effect = [_status_error(openai.InternalServerError, 502), _completion("analysis")]
+        
+        result = asyncio.run(self.analyzer.get_troubleshooting_steps("pod stuck in Pending"))
+        
+        self.assertEqual(result, "analysis")
+        self.assertEqual(self.sleep.call_count, 1)
+    
+    def test_analyze_logs_mapreduce(self):
+        """Test that a long log is summarized in chunks, then analyzed from the summaries"""
+        def create(**request):
+            prompt = request["messages"][1]["content"]
+            return _completion("final analysis" if "SUMMARIES:" in prompt else "OOM errors")
+        self.create.side_effect = create
+        logs = "\n".join(f"ERROR line {i} out of memory" for i in range(200))
+        
+        with patch.object(gpt_analyzer, 'LOG_CHUNK_TOKENS', 100):
+            chunks = len(gpt_analyzer._split_tokens(logs, 100, self.analyzer.log_scan_model))
+            result = asyncio.run(self.analyzer.analyze_logs_mapreduce(logs, "web"))
+        
+        self.assertGreater(chunks, 1)
+        self.assertEqual(result, "final analysis")
+        self.assertEqual(self.create.call_count, chunks + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
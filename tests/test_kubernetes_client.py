@@ -5,6 +5,8 @@ Test Kubernetes client functionality
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import ProtocolError
 from src.kubernetes.kubernetes_client import KubernetesClient
 from tests.test_utils import TestKubeGPT, create_mock_pod, create_mock_event
 
@@ -77,6 +79,7 @@ class TestKubernetesClient(TestKubeGPT):
         
         mock_pods = Mock()
         mock_pods.items = [mock_pod]
+        mock_pods.metadata._continue = None
         
         self.mock_v1.list_namespaced_pod.return_value = mock_pods
         
@@ -99,6 +102,7 @@ class TestKubernetesClient(TestKubeGPT):
         
         mock_pods = Mock()
         mock_pods.items = [running_pod, failed_pod]
+        mock_pods.metadata._continue = None
         
         self.mock_v1.list_namespaced_pod.return_value = mock_pods
         
@@ -108,6 +112,60 @@ class TestKubernetesClient(TestKubeGPT):
         self.assertEqual(health['running_pods'], 1)
         self.assertEqual(health['failed_pods'], 1)
         self.assertEqual(health['health_score'], 50.0)
+    
+    @patch('src.kubernetes.cluster_cache.ClusterStateCache.start')
+    @patch('src.kubernetes.kubernetes_client.config')
+    @patch('src.kubernetes.kubernetes_client.client')
+    def test_watch_cache_falls_back_when_forbidden(self, mock_client, mock_config, mock_start):
+        """Test that a cluster-wide list denied by RBAC disables the watch cache"""
+        mock_client.CoreV1Api.return_value = self.mock_v1
+        mock_start.side_effect = ApiException(status=403, reason="Forbidden")
+        self.config.set('kubernetes.watch_cache', True)
+        
+        k8s_client = KubernetesClient(self.config)
+        
+        self.assertIsNone(k8s_client.cache)
+    
+    @patch('src.kubernetes.kubernetes_client.time.sleep')
+    def test_follow_pod_logs_backs_off_and_gives_up(self, mock_sleep):
+        """Test that a failing log stream is retried with backoff, then reported"""
+        response = Mock()
+        response.stream.side_effect = ProtocolError("connection broken")
+        self.mock_v1.read_namespaced_pod_log.return_value = response
+        
+        with self.assertRaises(Exception):
+            self.k8s_client.follow_pod_logs("test-pod", "default")
+        
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(delays, sorted(delays))
+        self.assertGreater(delays[-1], delays[0])
+        self.assertGreaterEqual(response.release_conn.call_count, self.mock_v1.read_namespaced_pod_log.call_count)
+    
+    def test_list_pods_follows_continue_token_past_short_page(self):
+        """Test that a short page with a continue token is not taken as the last one"""
+        first_pod = create_mock_pod()
+        first_pod.metadata.name = "first-pod"
+        first_pod.metadata.creation_timestamp = datetime.now(timezone.utc)
+        
+        last_pod = create_mock_pod()
+        last_pod.metadata.name = "last-pod"
+        last_pod.metadata.creation_timestamp = datetime.now(timezone.utc)
+        
+        first_page = Mock()
+        first_page.items = [first_pod]
+        first_page.metadata._continue = "token"
+        
+        last_page = Mock()
+        last_page.items = [last_pod]
+        last_page.metadata._continue = None
+        
+        self.mock_v1.list_namespaced_pod.side_effect = [first_page, last_page]
+        
+        pods = self.k8s_client.list_pods("default")
+        
+        self.assertEqual([pod['name'] for pod in pods], ["first-pod", "last-pod"])
+        self.assertEqual(self.mock_v1.list_namespaced_pod.call_count, 2)
+        self.assertEqual(self.mock_v1.list_namespaced_pod.call_args.kwargs['_continue'], "token")
 
 
 if __name__ == '__main__':
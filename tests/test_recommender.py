@@ -0,0 +1,71 @@
+"""
+Test fix recommendations
+"""
+
+import unittest
+from kubegpt.recommender import FixRecommender
+
+
+class TestFixRecommender(unittest.TestCase):
+    """Test issue classification and fix generation"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.recommender = FixRecommender()
+        self.pod = {"name": "test-pod", "namespace": "default"}
+    
+    def test_classify_known_issues(self):
+        """Test that diagnoser issue texts map to their categories"""
+        issues = [
+            "Container app is in CrashLoopBackOff",
+            "Container app has image pull issues",
+            "Container app was killed due to OOM (Out of Memory)",
+            "Pod is in Pending state"
+        ]
+        
+        self.assertEqual(self.recommender.classify_batch(issues),
+                         ["crashloopbackoff", "imagepull", "oom", "pending"])
+    
+    def test_insufficient_memory_is_not_oom(self):
+        """Test that scheduling failures for lack of memory do not get OOM advice"""
+        failed_scheduling = "Warning event: FailedScheduling - 0/3 nodes are available: 3 Insufficient memory."
+        not_scheduled = "PodScheduled condition is False: 0/3 nodes are available: 3 Insufficient memory."
+        
+        self.assertEqual(self.recommender.classify_batch([failed_scheduling, not_scheduled]), ["pending", None])
+        
+        quick_fixes = self.recommender.get_quick_fixes({"issues": [failed_scheduling, not_scheduled]})
+        self.assertNotIn("Increase memory limits in pod specification", quick_fixes)
+    
+    def test_generate_fixes_once_per_category(self):
+        """Test that issues of the same category do not repeat their fixes"""
+        single = self.recommender.generate_fixes(dict(self.pod, issues=["Container app has image pull issues"]))
+        both = self.recommender.generate_fixes(dict(self.pod, issues=[
+            "Container app has image pull issues",
+            "Warning event: Failed - ErrImagePull"
+        ]))
+        
+        self.assertEqual(both, single)
+        self.assertTrue(single["kubectl_commands"])
+    
+    def test_quick_fixes_once_per_category(self):
+        """Test that issues of the same category do not repeat their quick fixes"""
+        quick_fixes = self.recommender.get_quick_fixes({"issues": [
+            "Container app has image pull issues",
+            "Warning event: Failed - ErrImagePull"
+        ]})
+        
+        self.assertEqual(len(quick_fixes), len(set(quick_fixes)))
+    
+    def test_analyze_and_recommend(self):
+        """Test recommendations for a crash-looping pod"""
+        result = self.recommender.analyze_and_recommend(dict(self.pod, issues=["Container app is in CrashLoopBackOff"],
+                                                             logs=""))
+        
+        self.assertEqual(len(result["issues_analyzed"]), 1)
+        self.assertEqual(result["issues_analyzed"][0]["severity"], "high")
+        self.assertIn("kubectl logs test-pod -n default --previous", result["commands"])
+        self.assertNotIn("error", result)
+
+
+if __name__ == '__main__':
+    unittest.main()
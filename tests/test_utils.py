@@ -4,6 +4,7 @@ Test configuration and utilities
 
 import unittest
 import tempfile
+import copy
 import os
 from unittest.mock import Mock, patch
 from src.utils.config import Config
@@ -12,11 +13,11 @@ from src.utils.config import Config
 class TestKubeGPT(unittest.TestCase):
     """Base test class for KubeGPT tests"""
     
-    def setUp(self):
-        """Set up test environment"""
-        # Create temporary config file
-        self.temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        self.temp_config.write("""
+    @classmethod
+    def setUpClass(cls):
+        """Write the temporary config file once for the test class"""
+        cls.temp_config = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
+        cls.temp_config.write("""
 kubernetes:
   config_path: ~/.kube/config
   default_namespace: test
@@ -35,17 +36,21 @@ logging:
   level: DEBUG
   file: test.log
         """)
-        self.temp_config.close()
-        
-        self.config = Config(self.temp_config.name)
+        cls.temp_config.close()
     
-    def tearDown(self):
-        """Clean up test environment"""
-        os.unlink(self.temp_config.name)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary config file"""
+        os.unlink(cls.temp_config.name)
+    
+    def setUp(self):
+        """Set up test environment"""
+        # Fresh Config per test, so values set by one test don't leak into the next
+        self.config = Config(self.temp_config.name)
 
 
-def create_mock_pod():
-    """Create a mock Kubernetes pod object"""
+def _build_mock_pod():
+    """Build the mock Kubernetes pod object create_mock_pod copies"""
     mock_pod = Mock()
     mock_pod.metadata.name = "test-pod"
     mock_pod.metadata.namespace = "default"
@@ -63,8 +68,8 @@ def create_mock_pod():
     return mock_pod
 
 
-def create_mock_event():
-    """Create a mock Kubernetes event object"""
+def _build_mock_event():
+    """Build the mock Kubernetes event object create_mock_event copies"""
     mock_event = Mock()
     mock_event.type = "Normal"
     mock_event.reason = "Started"
@@ -77,3 +82,18 @@ def create_mock_event():
     mock_event.involved_object.name = "test-pod"
     
     return mock_event
+
+
+# Mocks are built once; copying them is cheaper than setting every attribute again
+_TEMPLATE_POD = _build_mock_pod()
+_TEMPLATE_EVENT = _build_mock_event()
+
+
+def create_mock_pod():
+    """Create a mock Kubernetes pod object"""
+    return copy.deepcopy(_TEMPLATE_POD)
+
+
+def create_mock_event():
+    """Create a mock Kubernetes event object"""
+    return copy.deepcopy(_TEMPLATE_EVENT)